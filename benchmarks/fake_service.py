@@ -0,0 +1,263 @@
+"""
+Local fake of the Google Sheets and Drive API service objects, for benchmarks.
+
+It implements the surfaces GSheet Tools calls, with generated data and a configurable
+per-request latency:
+- spreadsheets().get(spreadsheetId, fields)
+- spreadsheets().values().get(spreadsheetId, range, ...)
+- spreadsheets().values().batchGet(spreadsheetId, ranges, majorDimension, ...)
+- files().get(fileId, fields)
+- new_batch_http_request(callback), batching files().get calls
+
+Example:
+    workbook = FakeWorkbook(tabs=5, rows=10_000, columns=20)
+    sheet = FakeSheetsService({"file": workbook}, latency=0.05)
+    get_gsheet_data(sheet, "file", by="sheet_position", sheet_position=0)
+"""
+
+import re
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_CELL = re.compile(r"^([A-Za-z]*)(\d*)$")
+
+
+def column_number(letters: str) -> int:
+    """'A' -> 1, 'AA' -> 27"""
+    number = 0
+    for letter in letters.upper():
+        number = number * 26 + ord(letter) - ord("A") + 1
+    return number
+
+
+class FakeHttpError(Exception):
+    """Mimics googleapiclient.errors.HttpError"""
+
+    def __init__(self, status: int, reason: str) -> None:
+        super().__init__(f"HTTP {status}: {reason}")
+        self.resp = SimpleNamespace(status=status)
+
+
+class FakeWorkbook:
+    """
+    A spreadsheet of `tabs` tabs named Sheet0..SheetN, each `rows` x `columns` cells
+    plus a header row. Every tenth row is ragged, as the API trims trailing blanks.
+    """
+
+    def __init__(
+        self,
+        tabs: int = 1,
+        rows: int = 1000,
+        columns: int = 10,
+        version: str = "1",
+        mime_type: str = "application/vnd.google-apps.spreadsheet",
+    ) -> None:
+        self.tabs = tabs
+        self.rows = rows
+        self.columns = columns
+        self.version = version
+        self.mime_type = mime_type
+        self._values: Dict[str, List[List[Any]]] = {}
+
+    def title(self, position: int) -> str:
+        return f"Sheet{position}"
+
+    def metadata(self) -> dict:
+        return {
+            "sheets": [
+                {
+                    "properties": {
+                        "sheetId": 1000 + position,
+                        "title": self.title(position),
+                        "index": position,
+                        "gridProperties": {
+                            "rowCount": self.rows + 1,
+                            "columnCount": self.columns,
+                        },
+                    }
+                }
+                for position in range(self.tabs)
+            ]
+        }
+
+    def values(self, title: str) -> List[List[Any]]:
+        if title not in self._values:
+            if title not in {self.title(p) for p in range(self.tabs)}:
+                raise FakeHttpError(400, f"Unable to parse range: {title}")
+            header = [f"column_{c}" for c in range(self.columns)]
+            self._values[title] = [header] + [
+                [f"{r}:{c}" for c in range(self.columns - (r % 10 == 0))]
+                for r in range(self.rows)
+            ]
+        return self._values[title]
+
+    def read(self, cell_range: str, major_dimension: str = "ROWS") -> dict:
+        """Serves a `values().get` of an A1 range ('Title', 'Title!A1:C9', 'Title!1:1')"""
+        title, _, bounds = cell_range.rpartition("!")
+        if not title:
+            title, bounds = bounds, ""
+        if title.startswith("'") and title.endswith("'"):
+            title = title[1:-1].replace("''", "'")
+        values = self.values(title)
+        first_column, first_row, last_column, last_row = 1, 1, None, None
+        if bounds:
+            start, _, end = bounds.partition(":")
+            start_match, end_match = _CELL.match(start), _CELL.match(end or start)
+            if start_match is None or end_match is None:
+                raise ValueError(f"unsupported range {cell_range!r}")
+            first_column = column_number(start_match.group(1) or "A")
+            first_row = int(start_match.group(2) or 1)
+            last_column = (
+                column_number(end_match.group(1)) if end_match.group(1) else None
+            )
+            last_row = int(end_match.group(2)) if end_match.group(2) else None
+        rows = [
+            row[first_column - 1 : last_column]
+            for row in values[first_row - 1 : last_row]
+        ]
+        while rows and not rows[-1]:
+            rows.pop()
+        if major_dimension == "COLUMNS":
+            width = max(map(len, rows), default=0)
+            rows = [
+                [row[c] if c < len(row) else "" for row in rows] for c in range(width)
+            ]
+        return {"range": cell_range, "values": rows} if rows else {"range": cell_range}
+
+
+class FakeRequest:
+    """A request whose `execute` sleeps `latency` seconds before answering"""
+
+    def __init__(self, respond: Callable[[], dict], latency: float) -> None:
+        self._respond = respond
+        self._latency = latency
+
+    def execute(self, **_: Any) -> dict:
+        if self._latency:
+            time.sleep(self._latency)
+        return self._respond()
+
+
+class _FakeValues:
+    def __init__(self, service: "FakeSheetsService") -> None:
+        self._service = service
+
+    def get(
+        self,
+        spreadsheetId: str,  # pylint: disable=invalid-name
+        range: str,  # pylint: disable=redefined-builtin
+        majorDimension: str = "ROWS",  # pylint: disable=invalid-name
+        **_: Any,
+    ) -> FakeRequest:
+        workbook = self._service.workbooks[spreadsheetId]
+        return self._service.request(lambda: workbook.read(range, majorDimension))
+
+    def batchGet(  # pylint: disable=invalid-name
+        self,
+        spreadsheetId: str,  # pylint: disable=invalid-name
+        ranges: List[str],
+        majorDimension: str = "ROWS",  # pylint: disable=invalid-name
+        **_: Any,
+    ) -> FakeRequest:
+        workbook = self._service.workbooks[spreadsheetId]
+        return self._service.request(
+            lambda: {
+                "valueRanges": [
+                    workbook.read(cell_range, majorDimension) for cell_range in ranges
+                ]
+            }
+        )
+
+
+class FakeSheetsService:
+    """
+    Fake of `build("sheets", "v4", ...).spreadsheets()`.
+
+    Args:
+        workbooks (Dict[str, FakeWorkbook]): The workbooks, by file_id.
+        latency (float): Seconds every request takes.
+    """
+
+    def __init__(self, workbooks: Dict[str, FakeWorkbook], latency: float = 0.0):
+        self.workbooks = workbooks
+        self.latency = latency
+        self.requests = 0
+
+    def request(self, respond: Callable[[], dict]) -> FakeRequest:
+        self.requests += 1
+        return FakeRequest(respond, self.latency)
+
+    def get(
+        self, spreadsheetId: str, fields: Optional[str] = None  # pylint: disable=C0103
+    ) -> FakeRequest:
+        workbook = self.workbooks[spreadsheetId]
+        return self.request(workbook.metadata)
+
+    def values(self) -> _FakeValues:
+        return _FakeValues(self)
+
+
+class _FakeFiles:
+    def __init__(self, service: "FakeDriveService") -> None:
+        self._service = service
+
+    def get(
+        self,
+        fileId: str,  # pylint: disable=C0103
+        fields: Optional[str] = None,
+        **_: Any,
+    ) -> FakeRequest:
+        workbook = self._service.workbooks[fileId]
+        return self._service.request(
+            lambda: {
+                "id": fileId,
+                "name": fileId,
+                "mimeType": workbook.mime_type,
+                "version": workbook.version,
+                "modifiedTime": "2024-01-01T00:00:00.000Z",
+            }
+        )
+
+
+class _FakeBatch:
+    """A batch request: one round trip (one latency) for all its calls"""
+
+    def __init__(self, service: "FakeDriveService", callback: Callable) -> None:
+        self._service = service
+        self._callback = callback
+        self._requests: List[Tuple[str, FakeRequest]] = []
+
+    def add(self, request: FakeRequest, request_id: str) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self, **_: Any) -> None:
+        if self._service.latency:
+            time.sleep(self._service.latency)
+        for request_id, request in self._requests:
+            self._callback(request_id, request._respond(), None)
+
+
+class FakeDriveService(FakeSheetsService):
+    """Fake of `build("drive", "v3", ...)`, sharing the workbooks of the Sheets fake"""
+
+    def files(self) -> _FakeFiles:
+        return _FakeFiles(self)
+
+    def new_batch_http_request(self, callback: Callable) -> _FakeBatch:
+        return _FakeBatch(self, callback)
+
+
+def fake_services(
+    files: int = 1,
+    tabs: int = 1,
+    rows: int = 1000,
+    columns: int = 10,
+    latency: float = 0.0,
+) -> Tuple[FakeSheetsService, FakeDriveService]:
+    """Sheets and Drive fakes over `files` identical workbooks named file0..fileN"""
+    workbooks = {
+        f"file{i}": FakeWorkbook(tabs=tabs, rows=rows, columns=columns)
+        for i in range(files)
+    }
+    return FakeSheetsService(workbooks, latency), FakeDriveService(workbooks, latency)
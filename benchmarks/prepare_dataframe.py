@@ -0,0 +1,66 @@
+"""
+Benchmark: prepare_dataframe against the previous row-padding implementation.
+
+Measures wall time and peak traced memory (tracemalloc) on synthetic ragged sheets.
+
+Run:
+    python benchmarks/prepare_dataframe.py
+"""
+
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+import pandas as pd
+
+from gsheet_tools import prepare_dataframe
+
+
+def legacy_prepare_dataframe(spreadsheet_data: List[List[Any]]) -> pd.DataFrame:
+    """prepare_dataframe as of 0.2.0, kept as the comparison baseline"""
+    spreadsheet_data = list(filter(None, spreadsheet_data))
+    column_names = spreadsheet_data[0]
+    padded_spreadsheet_data = [
+        arr + [""] * (len(column_names) - len(arr)) for arr in spreadsheet_data[1:]
+    ]
+    return pd.DataFrame(padded_spreadsheet_data, columns=column_names)
+
+
+def synthetic_sheet(rows: int, columns: int, seed: int = 0) -> List[List[Any]]:
+    """Ragged sheet: every row has a random width, as returned by the Sheets API"""
+    rng = random.Random(seed)
+    return [[f"column_{c}" for c in range(columns)]] + [
+        [f"{r}:{c}" for c in range(rng.randint(1, columns))] for r in range(rows)
+    ]
+
+
+def measure(
+    function: Callable[[List[List[Any]]], pd.DataFrame], data: List[List[Any]]
+) -> Tuple[float, int]:
+    """Returns (seconds, peak bytes) of one call"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    function(data)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    print(f"{'shape':>14} {'impl':>8} {'seconds':>9} {'peak MB':>9}")
+    for rows, columns in ((10_000, 10), (50_000, 20), (100_000, 10), (20_000, 50)):
+        data = synthetic_sheet(rows, columns)
+        for name, function in (
+            ("legacy", legacy_prepare_dataframe),
+            ("current", prepare_dataframe),
+        ):
+            elapsed, peak = measure(function, data)
+            print(
+                f"{rows:>7}x{columns:<6} {name:>8} {elapsed:>9.3f} {peak / 1e6:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
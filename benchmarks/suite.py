@@ -0,0 +1,154 @@
+"""
+Benchmark suite: times the main GSheet Tools entry points against the local fake service.
+
+Every case runs over a scaling matrix (rows x columns, tabs, URL counts) and reports the
+best of `--repeat` runs. Results are compared with the stored baselines, so regressions
+show up as a ratio above 1.
+
+Run:
+    PYTHONPATH=src python benchmarks/suite.py                 # compare with baselines
+    PYTHONPATH=src python benchmarks/suite.py --save-baseline # record new baselines
+    PYTHONPATH=src python benchmarks/suite.py --fail-over 1.5 # exit 1 on regressions
+
+Baselines are machine specific; record them on the machine the comparison runs on.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, Iterator, Tuple
+
+from fake_service import fake_services
+
+from gsheet_tools import (
+    MetadataCache,
+    UrlResolver,
+    check_sheet_origin,
+    check_sheet_origins,
+    get_gsheet_data,
+    get_workbook_dataframes,
+    prepare_dataframe,
+)
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+ROWS_X_COLUMNS = ((1_000, 10), (10_000, 10), (10_000, 50), (100_000, 10))
+TABS = (1, 50, 500)
+URL_COUNTS = (1_000, 10_000, 100_000)
+
+
+def best_of(function: Callable[[], object], repeat: int) -> float:
+    """Best wall time of `repeat` calls, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def cases(latency: float = 0.0) -> Iterator[Tuple[str, Callable[[], object]]]:
+    """(name, callable) of every case of the scaling matrix"""
+    for rows, columns in ROWS_X_COLUMNS:
+        sheet, _ = fake_services(rows=rows, columns=columns, latency=latency)
+        data = sheet.workbooks["file0"].values("Sheet0")
+        column_data = sheet.workbooks["file0"].read("Sheet0", "COLUMNS")["values"]
+        yield f"get_gsheet_data[{rows}x{columns}]", lambda sheet=sheet: get_gsheet_data(
+            sheet, "file0", by="sheet_position", sheet_position=0
+        )
+        yield f"prepare_dataframe[{rows}x{columns}]", lambda data=data: (
+            prepare_dataframe(data)
+        )
+        yield f"prepare_dataframe_columns[{rows}x{columns}]", lambda data=column_data: (
+            prepare_dataframe(data, major_dimension="COLUMNS")
+        )
+    for tabs in TABS:
+        sheet, _ = fake_services(tabs=tabs, rows=10, columns=5, latency=latency)
+        cache = MetadataCache()
+        yield f"get_gsheet_data_last_tab[{tabs} tabs]", lambda sheet=sheet, tabs=tabs: (
+            get_gsheet_data(
+                sheet, "file0", by="sheet_name", sheet_name=f"Sheet{tabs - 1}"
+            )
+        )
+        yield f"get_gsheet_data_cached[{tabs} tabs]", lambda sheet=sheet, tabs=tabs, cache=cache: (
+            get_gsheet_data(
+                sheet,
+                "file0",
+                by="sheet_name",
+                sheet_name=f"Sheet{tabs - 1}",
+                metadata_cache=cache,
+            )
+        )
+        yield f"get_workbook_dataframes[{tabs} tabs]", lambda sheet=sheet: (
+            get_workbook_dataframes(sheet, "file0")
+        )
+    _, drive = fake_services(files=100, latency=latency)
+    yield "check_sheet_origin[100 files]", lambda: [
+        check_sheet_origin(drive, f"file{i}") for i in range(100)
+    ]
+    yield "check_sheet_origins[100 files]", lambda: list(
+        check_sheet_origins(drive, [f"file{i}" for i in range(100)])
+    )
+    rng = random.Random(0)
+    for count in URL_COUNTS:
+        urls = [
+            f"https://docs.google.com/spreadsheets/d/{rng.getrandbits(64):016x}"
+            f"/edit?gid={rng.randint(0, 10**6)}"
+            for _ in range(count // 2)
+        ]
+        urls += rng.choices(urls, k=count - len(urls))  # half of them repeated
+        yield f"UrlResolver[{count} urls]", lambda urls=urls: [
+            UrlResolver(url).is_valid for url in urls
+        ]
+        yield f"UrlResolver.resolve_many[{count} urls]", lambda urls=urls: (
+            UrlResolver.resolve_many(urls)
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--fail-over", type=float, default=None)
+    parser.add_argument("--filter", default="", help="only run cases containing this")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds per fake API request"
+    )
+    arguments = parser.parse_args()
+
+    baselines: Dict[str, float] = {}
+    # baselines are recorded without latency, which would dominate the timings
+    if os.path.exists(BASELINES) and not arguments.latency:
+        with open(BASELINES, encoding="utf-8") as f:
+            baselines = json.load(f)
+    results: Dict[str, float] = {}
+    regressions = []
+    print(f"{'case':<48} {'seconds':>10} {'baseline':>10} {'ratio':>7}")
+    for name, function in cases(arguments.latency):
+        if arguments.filter not in name:
+            continue
+        results[name] = seconds = best_of(function, arguments.repeat)
+        baseline = baselines.get(name)
+        ratio = seconds / baseline if baseline else float("nan")
+        print(
+            f"{name:<48} {seconds:>10.4f} {baseline or float('nan'):>10.4f} {ratio:>7.2f}"
+        )
+        if arguments.fail_over and baseline and ratio > arguments.fail_over:
+            regressions.append(name)
+
+    if arguments.save_baseline and not arguments.latency:
+        with open(BASELINES, "w", encoding="utf-8") as f:
+            json.dump({**baselines, **results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baselines saved to {BASELINES}")
+    if regressions:
+        print(f"regressions over x{arguments.fail_over}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
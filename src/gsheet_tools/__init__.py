@@ -8,6 +8,12 @@ data using the Google Sheets API, and preparing pandas DataFrames from the retri
 
 Modules:
 - `_tools`: Contains the core tools and utilities for Google Sheets interaction.
+- `_cache`: Contains the caches used to avoid redundant Google Sheets API calls.
+- `_index`: Contains the indexed lookup of sheets in spreadsheet metadata.
+- `_execution`: Contains the rate limiting and retry layer every API call goes through.
+- `_instrumentation`: Contains the spans recorded around API calls and processing stages.
+- `_bulk`: Contains the tools for reading and classifying many Google Sheets at once.
+- `aio`: Asyncio counterparts of the fetch and origin-check functions.
 
 Exports:
 - GsheetToolExceptionsBase: Base exception class for all GSheet Tools-related errors.
@@ -16,10 +22,37 @@ Exports:
 - NameFormatter: Provides utilities for formatting sheet names into snake_case.
 - SheetOrigins: Enum for identifying the origin of a Google Sheet.
 - SheetMimetype: Enum for identifying the MIME type of a Google Sheet.
+- OriginDetails: Details of a Google Sheet file origin, returned by check_sheet_origin.
+- MetadataCache: TTL + LRU cache for spreadsheet metadata, shared across fetch calls.
+- ResponseCache: Persistent sqlite cache for sheet data, revalidated against Drive.
+- SheetIndex: Maps titles, sheet IDs and positions of a workbook to sheet properties.
+- SheetSelector: Describes which tab of a spreadsheet to read, and which range of it.
 - get_gid_sheets_data: Fetches data for a specific sheet by its GID or the first sheet by default.
+- get_gsheet_data: Fetches data from a Google Sheet with various selection options.
+- get_gsheet_data_many: Fetches several tabs of one Google Sheet with batched reads.
+- get_workbook_dataframes: Reads every tab of a Google Sheet into a dict of DataFrames.
+- iter_gsheet_data: Streams data from a Google Sheet in blocks of rows.
+- BulkFetchResult: Outcome of a single job of a bulk fetch.
+- get_gsheet_data_concurrently: Fetches many (file_id, selector) jobs on a thread pool.
+- OriginCheckResult: Outcome of the origin check of a single file.
+- check_sheet_origins: Checks the origin of many files with Drive batch requests.
+- list_sheet_origins: Checks the origin of the files of a folder or Drive query.
+- RateLimiter: Token bucket limiter, shared across threads and asyncio tasks.
+- RetryPolicy: Exponential backoff with jitter for retryable HTTP statuses.
+- RequestExecutor: Executes API requests through a rate limiter and a retry policy.
+- SingleFlight: Coalesces concurrent identical API reads into one call.
+- get_request_executor: Returns the executor every API call goes through.
+- set_request_executor: Replaces the executor every API call goes through.
+- Span: Timing and attributes of one instrumented operation.
+- Instrumentation: Receives finished spans, forwarding them to an optional callback.
+- NoopInstrumentation: Default instrumentation, records nothing.
+- InMemoryCollector: Keeps the latest spans in memory and summarizes them.
+- get_instrumentation: Returns the instrumentation every span goes to.
+- set_instrumentation: Replaces the instrumentation every span goes to.
 - check_sheet_origin: Determines the origin and MIME type of a Google Sheet file.
 - is_valid_google_url: Validates if a URL is a valid Google Sheets URL.
 - prepare_dataframe: Converts Google Sheets data into a pandas DataFrame.
+- prepare_arrow_table: Converts Google Sheets data into a pyarrow Table (optional dependency).
 
 Metadata:
 - Version: 0.2.0
@@ -27,17 +60,48 @@ Metadata:
 - Email: ankit8290@gmail.com
 """
 
+from gsheet_tools._bulk import (
+    BulkFetchResult,
+    OriginCheckResult,
+    check_sheet_origins,
+    get_gsheet_data_concurrently,
+    list_sheet_origins,
+)
+from gsheet_tools._cache import MetadataCache, ResponseCache
 from gsheet_tools._exceptions import GsheetToolExceptionsBase
+from gsheet_tools._execution import (
+    RateLimiter,
+    RequestExecutor,
+    RetryPolicy,
+    SingleFlight,
+    get_request_executor,
+    set_request_executor,
+)
+from gsheet_tools._index import SheetIndex
+from gsheet_tools._instrumentation import (
+    InMemoryCollector,
+    Instrumentation,
+    NoopInstrumentation,
+    Span,
+    get_instrumentation,
+    set_instrumentation,
+)
 from gsheet_tools._tools import Exceptions  # all public assistive tools
 from gsheet_tools._tools import (
     NameFormatter,
+    OriginDetails,
     SheetMimetype,
     SheetOrigins,
+    SheetSelector,
     UrlResolver,
     check_sheet_origin,
     get_gid_sheets_data,
     get_gsheet_data,
+    get_gsheet_data_many,
+    get_workbook_dataframes,
     is_valid_google_url,
+    iter_gsheet_data,
+    prepare_arrow_table,
     prepare_dataframe,
 )
 
@@ -48,11 +112,37 @@ __all__ = [
     "NameFormatter",
     "SheetOrigins",
     "SheetMimetype",
+    "OriginDetails",
+    "MetadataCache",
+    "ResponseCache",
+    "SheetIndex",
+    "SheetSelector",
     "get_gid_sheets_data",
     "get_gsheet_data",
+    "get_gsheet_data_many",
+    "get_workbook_dataframes",
+    "iter_gsheet_data",
+    "BulkFetchResult",
+    "get_gsheet_data_concurrently",
+    "OriginCheckResult",
+    "check_sheet_origins",
+    "list_sheet_origins",
+    "RateLimiter",
+    "RetryPolicy",
+    "RequestExecutor",
+    "SingleFlight",
+    "get_request_executor",
+    "set_request_executor",
+    "Span",
+    "Instrumentation",
+    "NoopInstrumentation",
+    "InMemoryCollector",
+    "get_instrumentation",
+    "set_instrumentation",
     "check_sheet_origin",
     "is_valid_google_url",
     "prepare_dataframe",
+    "prepare_arrow_table",
 ]
 __version__ = "0.2.0"
 __author__ = "Ankit Yadav"
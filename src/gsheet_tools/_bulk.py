@@ -0,0 +1,343 @@
+"""
+Bulk tools for reading and classifying many Google Sheets at once.
+
+Classes:
+- BulkFetchResult: Outcome of a single job of a bulk fetch.
+- OriginCheckResult: Outcome of the origin check of a single file.
+
+Functions:
+- get_gsheet_data_concurrently: Fetches many (file_id, selector) jobs on a thread pool.
+- check_sheet_origins: Checks the origin of many files with Drive batch requests.
+- list_sheet_origins: Checks the origin of the files of a folder or Drive query.
+"""
+
+import dataclasses
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from gsheet_tools._cache import MetadataCache
+from gsheet_tools._exceptions import Exceptions
+from gsheet_tools._execution import get_request_executor
+from gsheet_tools._tools import (
+    OriginDetails,
+    SheetMimetype,
+    SheetSelector,
+    _classify_origin,
+    _execute,
+    _get_selected_data,
+)
+
+__all__ = [
+    "BulkFetchResult",
+    "OriginCheckResult",
+    "get_gsheet_data_concurrently",
+    "check_sheet_origins",
+    "list_sheet_origins",
+]
+
+# Drive accepts at most 100 calls in one batch request
+_MAX_BATCH_SIZE = 100
+_ORIGIN_FIELDS = "id,name,mimeType,originalFilename"
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkFetchResult:
+    """
+    Outcome of a single job of a bulk fetch.
+
+    Attributes:
+        position (int): Position of the job in the submitted jobs.
+        file_id (str): The ID of the spreadsheet.
+        selector (Optional[SheetSelector]): The selection of the job, None if it was invalid.
+        title (str): The sheet title, empty on failure or when no sheet matched.
+        data (List): The fetched data, empty on failure or when no sheet matched.
+        error (Optional[Exception]): The exception raised by the job, if any.
+    """
+
+    position: int
+    file_id: str
+    selector: Optional[SheetSelector]
+    title: str = ""
+    data: List = dataclasses.field(default_factory=list)
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the job completed without raising"""
+        return self.error is None
+
+
+def get_gsheet_data_concurrently(
+    service_factory: Callable[[], object],
+    jobs: Iterable[Tuple[str, Union[SheetSelector, Dict[str, Any]]]],
+    max_workers: int = 8,
+    metadata_cache: Optional[MetadataCache] = None,
+    typed: bool = False,
+) -> Iterator[BulkFetchResult]:
+    """
+    Fetches many (file_id, selector) jobs on a bounded thread pool.
+
+    The googleapiclient service objects (and the httplib2 connection below them) are
+    not thread-safe, so every worker thread builds its own Sheets service with
+    `service_factory` and reuses it for all the jobs it runs.
+
+    Args:
+        service_factory (Callable[[], object]): Builds a Google Sheets API service object,
+            e.g. `lambda: build("sheets", "v4", credentials=creds).spreadsheets()`.
+        jobs (Iterable[Tuple[str, Union[SheetSelector, Dict[str, Any]]]]): The file IDs to
+            read, each with a SheetSelector or a dict of `get_gsheet_data` selection
+            arguments.
+        max_workers (int): Number of worker threads.
+        metadata_cache (Optional[MetadataCache]): Cache shared by all workers.
+        typed (bool): Read unformatted values instead of display strings.
+
+    Yields:
+        BulkFetchResult: One result per job, in completion order. Exceptions raised by
+            a job are reported on its result instead of being raised.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If `max_workers` is not positive.
+    """
+    if max_workers <= 0:
+        raise Exceptions.GsheetToolsArgumentError(
+            "[max_workers]", f"value `{max_workers=}` is invalid, should be positive."
+        )
+    worker_state = threading.local()
+
+    def _worker_service() -> object:
+        if not hasattr(worker_state, "service"):
+            worker_state.service = service_factory()
+        return worker_state.service
+
+    def _run(
+        position: int, file_id: str, selector: Union[SheetSelector, Dict[str, Any]]
+    ) -> BulkFetchResult:
+        sheet_selector: Optional[SheetSelector] = None
+        try:
+            sheet_selector = (
+                selector
+                if isinstance(selector, SheetSelector)
+                else SheetSelector(**selector)
+            )
+            title, data = _get_selected_data(
+                _worker_service(), file_id, sheet_selector, metadata_cache, typed
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return BulkFetchResult(position, file_id, sheet_selector, error=e)
+        return BulkFetchResult(position, file_id, sheet_selector, title, data)
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="gsheet-tools"
+    )
+    try:
+        futures = [
+            executor.submit(_run, position, file_id, selector)
+            for position, (file_id, selector) in enumerate(jobs)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # stop pending jobs when the caller stops iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclasses.dataclass(frozen=True)
+class OriginCheckResult:
+    """
+    Outcome of the origin check of a single file.
+
+    Attributes:
+        position (int): Position of the file in the submitted file IDs, or in the listing.
+        file_id (str): The ID of the file.
+        origin (str): The `SheetOrigins` value, empty on failure.
+        details (Optional[OriginDetails]): The origin details, None on failure.
+        name (str): The name of the file, as reported by Drive.
+        error (Optional[Exception]): The exception raised for the file, if any.
+    """
+
+    position: int
+    file_id: str
+    origin: str = ""
+    details: Optional[OriginDetails] = None
+    name: str = ""
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the check completed without raising"""
+        return self.error is None
+
+
+def _origin_result(position: int, file_metadata: dict) -> OriginCheckResult:
+    origin, details = _classify_origin(file_metadata)
+    return OriginCheckResult(
+        position,
+        file_metadata.get("id", ""),
+        origin,
+        details,
+        file_metadata.get("name", ""),
+    )
+
+
+def _check_origin_batch(
+    google_drive_service: object, jobs: List[Tuple[int, str, int]]
+) -> Dict[int, Tuple[Optional[dict], Optional[Exception]]]:
+    """
+    Sends one Drive batch request of `files().get` calls, one per (position, file_id,
+    attempt) job, and returns the (response, error) of every position.
+    """
+    answers: Dict[int, Tuple[Optional[dict], Optional[Exception]]] = {}
+
+    def _callback(
+        request_id: str, response: Optional[dict], exception: Optional[Exception]
+    ) -> None:
+        answers[int(request_id)] = (response, exception)
+
+    batch = google_drive_service.new_batch_http_request(  # type: ignore[attr-defined]
+        callback=_callback
+    )
+    for position, file_id, _ in jobs:
+        batch.add(
+            google_drive_service.files().get(  # type: ignore[attr-defined]
+                fileId=file_id, fields=_ORIGIN_FIELDS, supportsAllDrives=True
+            ),
+            request_id=str(position),
+        )
+    try:
+        # Drive counts every call of a batch against the quota
+        _execute(batch, "drive.batch", tokens=len(jobs), files=len(jobs))
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return {position: (None, e) for position, _, _ in jobs}
+    return answers
+
+
+def check_sheet_origins(
+    google_drive_service: object,
+    file_ids: Iterable[str],
+    batch_size: int = _MAX_BATCH_SIZE,
+) -> Iterator[OriginCheckResult]:
+    """
+    Checks the origin of many files, see `check_sheet_origin`, grouping the Drive
+    `files().get` calls into batch HTTP requests of `batch_size` calls.
+
+    Calls failing with a retryable status (e.g. rate limits reported per call inside a
+    batch) are sent again in a later batch, after the backoff of the retry policy of
+    the request executor.
+
+    Args:
+        google_drive_service (object): The Google Drive API service object.
+        file_ids (Iterable[str]): The IDs of the files, consumed lazily.
+        batch_size (int): Number of calls per batch request, at most 100.
+
+    Yields:
+        OriginCheckResult: One result per file, batch after batch. Errors are reported
+            on the result instead of being raised.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If `batch_size` is not within 1..100.
+    """
+    if not 0 < batch_size <= _MAX_BATCH_SIZE:
+        raise Exceptions.GsheetToolsArgumentError(
+            "[batch_size]",
+            f"value `{batch_size=}` is invalid, should be within 1..{_MAX_BATCH_SIZE}.",
+        )
+    retry_policy = get_request_executor().retry_policy
+    pending = enumerate(file_ids)
+    retries: List[Tuple[int, str, int]] = []
+    while True:
+        jobs, retries = retries[:batch_size], retries[batch_size:]
+        jobs += [
+            (position, file_id, 0)
+            for position, file_id in itertools.islice(pending, batch_size - len(jobs))
+        ]
+        if not jobs:
+            return
+        attempts = max(attempt for _, _, attempt in jobs)
+        if attempts:
+            time.sleep(retry_policy.backoff(attempts - 1))
+        answers = _check_origin_batch(google_drive_service, jobs)
+        for position, file_id, attempt in jobs:
+            response, error = answers.get(position, (None, None))
+            if error is None and response is None:
+                error = Exceptions.GoogleSpreadsheetProcessingError(
+                    "GSHEET.ORIGIN.NORESPONSE01"
+                )
+            if error is not None:
+                if attempt < retry_policy.max_retries and retry_policy.is_retryable(
+                    error
+                ):
+                    retries.append((position, file_id, attempt + 1))
+                    continue
+                yield OriginCheckResult(position, file_id, error=error)
+            else:
+                yield _origin_result(position, {"id": file_id, **(response or {})})
+
+
+def list_sheet_origins(
+    google_drive_service: object,
+    folder_id: Optional[str] = None,
+    query: Optional[str] = None,
+    drive_id: Optional[str] = None,
+    page_size: int = 1000,
+) -> Iterator[OriginCheckResult]:
+    """
+    Checks the origin of every spreadsheet-like file (Google Sheets, xlsx, xls, csv) of
+    a folder or Drive query, with paged `files().list` calls. The `fields` mask
+    requests what the classification needs only, so one call covers a page of files.
+
+    Args:
+        google_drive_service (object): The Google Drive API service object.
+        folder_id (Optional[str]): Only list the files directly in this folder.
+        query (Optional[str]): Additional Drive search query, e.g.
+            "modifiedTime > '2024-01-01T00:00:00'".
+        drive_id (Optional[str]): Search the shared drive with this ID, instead of the
+            files of the user.
+        page_size (int): Number of files per page, at most 1000.
+
+    Yields:
+        OriginCheckResult: One result per file, page after page.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If `page_size` is not within 1..1000.
+    """
+    if not 0 < page_size <= 1000:
+        raise Exceptions.GsheetToolsArgumentError(
+            "[page_size]", f"value `{page_size=}` is invalid, should be within 1..1000."
+        )
+    clauses = [
+        "("
+        + " or ".join(f"mimeType = '{mimetype.value}'" for mimetype in SheetMimetype)
+        + ")",
+        "trashed = false",
+    ]
+    if folder_id is not None:
+        clauses.append(f"'{folder_id}' in parents")
+    if query:
+        clauses.append(f"({query})")
+    list_options: Dict[str, Any] = {
+        "q": " and ".join(clauses),
+        "fields": f"nextPageToken,files({_ORIGIN_FIELDS})",
+        "pageSize": page_size,
+        "supportsAllDrives": True,
+        "includeItemsFromAllDrives": True,
+    }
+    if drive_id is not None:
+        list_options.update(corpora="drive", driveId=drive_id)
+    position = 0
+    page_token: Optional[str] = None
+    while True:
+        response = _execute(
+            google_drive_service.files().list(  # type: ignore[attr-defined]
+                pageToken=page_token, **list_options
+            ),
+            "drive.files.list",
+        )
+        for file_metadata in response.get("files", []):
+            yield _origin_result(position, file_metadata)
+            position += 1
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return
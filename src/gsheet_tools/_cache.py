@@ -0,0 +1,425 @@
+"""
+Caching utilities for Google Sheets API responses.
+
+Classes:
+- MetadataCache: In-memory TTL + LRU cache for spreadsheet metadata, keyed by file_id.
+- ResponseCache: Persistent sqlite cache for sheet data, revalidated against Drive.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from gsheet_tools._exceptions import Exceptions
+from gsheet_tools._execution import get_request_executor
+
+__all__ = [
+    "MetadataCache",
+    "ResponseCache",
+]
+
+
+class MetadataCache:
+    """
+    In-memory cache for spreadsheet metadata (`spreadsheets().get(...)` responses).
+
+    Entries are keyed by file_id, expire after `ttl` seconds and the least recently
+    used entry is evicted once `maxsize` entries are stored. The cache is thread-safe,
+    so a single instance can be shared between workers reading the same workbooks.
+
+    Subclass and override `get`, `set`, `invalidate` and `clear` to plug in another
+    storage backend.
+
+    Args:
+        ttl (Optional[float]): Seconds an entry stays valid. `None` disables expiry.
+        maxsize (int): Maximum number of entries kept in the cache.
+        timer (Callable[[], float]): Clock used for expiry, `time.monotonic` by default.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that were not found or had expired.
+        evictions (int): Number of entries dropped because the cache was full.
+    """
+
+    class Stats(NamedTuple):
+        """
+        Snapshot of the cache counters
+        """
+
+        hits: int
+        misses: int
+        evictions: int
+        size: int
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 300.0,
+        maxsize: int = 128,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl is not None and ttl <= 0:
+            raise Exceptions.GsheetToolsArgumentError(
+                "[ttl]", f"value `{ttl=}` is invalid, should be a positive number."
+            )
+        if maxsize <= 0:
+            raise Exceptions.GsheetToolsArgumentError(
+                "[maxsize]", f"value `{maxsize=}` is invalid, should be positive."
+            )
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, file_id: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(file_id)  # type: ignore[call-overload]
+            return entry is not None and not self._is_expired(entry[0])
+
+    @property
+    def stats(self) -> "MetadataCache.Stats":
+        """ReadOnly"""
+        with self._lock:
+            return self.Stats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._entries),
+            )
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self._ttl is not None and self._timer() - stored_at >= self._ttl
+
+    def get(self, file_id: str) -> Optional[Any]:
+        """
+        Returns the cached metadata for a file, or None if absent or expired.
+
+        Args:
+            file_id (str): The ID of the spreadsheet.
+
+        Returns:
+            Optional[Any]: The cached metadata.
+        """
+        with self._lock:
+            entry = self._entries.get(file_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, metadata = entry
+            if self._is_expired(stored_at):
+                del self._entries[file_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(file_id)
+            self.hits += 1
+            return metadata
+
+    def set(self, file_id: str, metadata: Any) -> None:
+        """
+        Stores metadata for a file, evicting the least recently used entry if full.
+
+        Args:
+            file_id (str): The ID of the spreadsheet.
+            metadata (Any): The metadata to cache.
+        """
+        with self._lock:
+            self._entries[file_id] = (self._timer(), metadata)
+            self._entries.move_to_end(file_id)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, file_id: str) -> bool:
+        """
+        Drops the cached metadata of a file.
+
+        Args:
+            file_id (str): The ID of the spreadsheet.
+
+        Returns:
+            bool: True if an entry was removed.
+        """
+        with self._lock:
+            return self._entries.pop(file_id, None) is not None
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+class ResponseCache:
+    """
+    Persistent sqlite cache for sheet data, revalidated against Google Drive.
+
+    Entries are keyed by file_id, sheet title, range and render options. Before a cached
+    entry is served, the file `version` is read with one cheap Drive
+    `files().get(fields="modifiedTime,version")` call; the Sheets read is skipped when
+    the version did not change. Least recently used entries are evicted once the cache
+    holds more than `max_entries` entries or `max_bytes` of compressed data.
+
+    Args:
+        path (str): Path of the sqlite database, created if missing.
+        drive_service (object): The Google Drive API service object (the one
+            `check_sheet_origin` uses).
+        max_entries (int): Maximum number of cached ranges.
+        max_bytes (Optional[int]): Maximum size of the cached payloads, None for no limit.
+        revalidate_after (float): Seconds during which a revalidated entry is served
+            without asking Drive again, 0 to revalidate on every read.
+        timer (Callable[[], float]): Clock used for `revalidate_after` and recency.
+
+    Attributes:
+        hits (int): Number of reads served from the cache.
+        misses (int): Number of reads that were absent or stale.
+        revalidations (int): Number of Drive version checks made.
+        evictions (int): Number of entries dropped to respect the limits.
+
+    Notes:
+        Resolving the sheet title still needs the spreadsheet metadata, pair this cache
+        with a `MetadataCache` so an unchanged read only costs the Drive version check.
+    """
+
+    class Stats(NamedTuple):
+        """
+        Snapshot of the cache counters
+        """
+
+        hits: int
+        misses: int
+        revalidations: int
+        evictions: int
+        entries: int
+        size: int
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            file_id TEXT NOT NULL,
+            sheet_title TEXT NOT NULL,
+            cell_range TEXT NOT NULL,
+            render_options TEXT NOT NULL,
+            version TEXT NOT NULL,
+            modified_time TEXT,
+            validated_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            size INTEGER NOT NULL,
+            payload BLOB NOT NULL,
+            PRIMARY KEY (file_id, sheet_title, cell_range, render_options)
+        )
+    """
+
+    def __init__(
+        self,
+        path: str,
+        drive_service: object,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        revalidate_after: float = 0.0,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries <= 0 or (max_bytes is not None and max_bytes <= 0):
+            raise Exceptions.GsheetToolsArgumentError(
+                "[max_entries,max_bytes]",
+                f"values `{max_entries=}`, `{max_bytes=}` should be positive.",
+            )
+        self._drive_service = drive_service
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._revalidate_after = revalidate_after
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(self._SCHEMA)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.revalidations: int = 0
+        self.evictions: int = 0
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the sqlite connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    @property
+    def stats(self) -> "ResponseCache.Stats":
+        """ReadOnly"""
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return self.Stats(
+                self.hits,
+                self.misses,
+                self.revalidations,
+                self.evictions,
+                entries,
+                size,
+            )
+
+    def _file_version(self, file_id: str) -> Tuple[str, Optional[str]]:
+        """
+        Reads the current (version, modifiedTime) of a file from Drive.
+        """
+        file_metadata = get_request_executor().execute(
+            self._drive_service.files().get(  # type: ignore[attr-defined]
+                fileId=file_id, fields="modifiedTime,version"
+            )
+        )
+        with self._lock:
+            self.revalidations += 1
+        return str(file_metadata.get("version")), file_metadata.get("modifiedTime")
+
+    def get(
+        self, file_id: str, sheet_title: str, cell_range: str, render_options: str = ""
+    ) -> Tuple[Optional[List], Optional[Tuple[str, Optional[str]]]]:
+        """
+        Returns the cached data of a range if the file did not change since it was stored.
+
+        Args:
+            file_id (str): The ID of the spreadsheet.
+            sheet_title (str): The title of the sheet.
+            cell_range (str): The range that was read.
+            render_options (str): Key of the render options of the read.
+
+        Returns:
+            Tuple[Optional[List], Optional[Tuple[str, Optional[str]]]]: The cached data
+                (None on a miss) and the (version, modifiedTime) read from Drive, None
+                when the entry was served without revalidation. On a miss, pass the
+                version back to `set` along with the data read afterwards.
+        """
+        key = (file_id, sheet_title, cell_range, render_options)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT version, validated_at, payload FROM responses WHERE "
+                "file_id = ? AND sheet_title = ? AND cell_range = ? AND render_options = ?",
+                key,
+            ).fetchone()
+        current_version = None
+        if row is not None:
+            version, validated_at, payload = row
+            now = self._timer()
+            if now - validated_at >= self._revalidate_after:
+                current_version = self._file_version(file_id)
+                if current_version[0] != version:
+                    row = None
+            if row is not None:
+                with self._lock, self._connection:
+                    self._connection.execute(
+                        "UPDATE responses SET accessed_at = ?, validated_at = ? WHERE "
+                        "file_id = ? AND sheet_title = ? AND cell_range = ? "
+                        "AND render_options = ?",
+                        (now, now if current_version else validated_at, *key),
+                    )
+                    self.hits += 1
+                return json.loads(zlib.decompress(payload)), current_version
+        if current_version is None:
+            # read before the data, so a concurrent edit can only make the entry stale
+            current_version = self._file_version(file_id)
+        with self._lock:
+            self.misses += 1
+        return None, current_version
+
+    def set(
+        self,
+        file_id: str,
+        sheet_title: str,
+        cell_range: str,
+        data: List,
+        file_version: Tuple[str, Optional[str]],
+        render_options: str = "",
+    ) -> None:
+        """
+        Stores the data of a range, evicting least recently used entries over the limits.
+
+        Args:
+            file_id (str): The ID of the spreadsheet.
+            sheet_title (str): The title of the sheet.
+            cell_range (str): The range that was read.
+            data (List): The fetched data.
+            file_version (Tuple[str, Optional[str]]): The (version, modifiedTime) of the
+                file returned by `get`, read before the data was fetched.
+            render_options (str): Key of the render options of the read.
+        """
+        payload = zlib.compress(json.dumps(data).encode())
+        now = self._timer()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    file_id,
+                    sheet_title,
+                    cell_range,
+                    render_options,
+                    file_version[0],
+                    file_version[1],
+                    now,
+                    now,
+                    len(payload),
+                    payload,
+                ),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Drops least recently used entries until the limits hold (lock held by caller).
+        """
+        entries, size = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if entries <= self._max_entries and (
+            self._max_bytes is None or size <= self._max_bytes
+        ):
+            return
+        for rowid, entry_size in self._connection.execute(
+            "SELECT rowid, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            if entries <= self._max_entries and (
+                self._max_bytes is None or size <= self._max_bytes
+            ):
+                break
+            self._connection.execute("DELETE FROM responses WHERE rowid = ?", (rowid,))
+            entries -= 1
+            size -= entry_size
+            self.evictions += 1
+
+    def invalidate(self, file_id: Optional[str] = None) -> int:
+        """
+        Drops the cached entries of a file, or of every file.
+
+        Args:
+            file_id (Optional[str]): The ID of the spreadsheet, None for all files.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock, self._connection:
+            if file_id is None:
+                cursor = self._connection.execute("DELETE FROM responses")
+            else:
+                cursor = self._connection.execute(
+                    "DELETE FROM responses WHERE file_id = ?", (file_id,)
+                )
+            return cursor.rowcount
@@ -7,3 +7,24 @@ class GsheetToolExceptionsBase(Exception):
     """
     Base for all Gsheet Tools related Errors
     """
+
+
+class Exceptions:
+    """
+    Custom exception classes for handling errors specific to Google Sheets processing.
+    """
+
+    class GoogleSpreadsheetProcessingError(GsheetToolExceptionsBase):
+        """
+        Raised when there is an issue in parsing specific Google Sheets.
+        """
+
+    class GsheetToolsArgumentError(GsheetToolExceptionsBase):
+        """
+        Raised when invalid arguments are passed to GSheet tools functions.
+        """
+
+        def __init__(self, arg_name: str, message: str, *args: tuple) -> None:
+            prefix = f"Argument::{arg_name}"
+            self.message = f"{prefix}|{message}"
+            super().__init__(self.message, *args)
@@ -0,0 +1,483 @@
+"""
+Execution layer for Google API requests.
+
+Every `.execute()` issued by GSheet Tools goes through a `RequestExecutor`, which keeps
+the calls below the configured quota and retries the transient failures.
+
+Classes:
+- RateLimiter: Token bucket limiter, shared across threads and asyncio tasks.
+- RetryPolicy: Exponential backoff with jitter for retryable HTTP statuses.
+- RequestExecutor: Executes requests through a rate limiter and a retry policy.
+- SingleFlight: Coalesces concurrent identical calls into one, for threads and asyncio.
+
+Functions:
+- get_request_executor: Returns the executor used by GSheet Tools.
+- set_request_executor: Replaces the executor used by GSheet Tools.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import random
+import threading
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from gsheet_tools._exceptions import Exceptions
+
+__all__ = [
+    "RateLimiter",
+    "RetryPolicy",
+    "RequestExecutor",
+    "SingleFlight",
+    "get_request_executor",
+    "set_request_executor",
+]
+
+
+class RateLimiter:
+    """
+    Token bucket limiter, shared across threads and asyncio tasks.
+
+    Tokens are reserved under a lock, so concurrent callers are served in arrival order
+    and the wait happens outside of the lock.
+
+    Args:
+        rate (float): Number of requests allowed per `per` seconds.
+        per (float): Length of the quota window in seconds, 60 for per-minute quotas.
+        burst (Optional[int]): Maximum number of tokens accumulated while idle,
+            defaults to `rate`.
+        timer (Callable[[], float]): Clock used to refill tokens.
+        sleep (Callable[[float], Any]): Blocking sleep used by `acquire`.
+
+    Example:
+        RateLimiter(300, per=60)  # the default Sheets read quota per user
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        per: float = 60.0,
+        burst: Optional[int] = None,
+        timer: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        if rate <= 0 or per <= 0:
+            raise Exceptions.GsheetToolsArgumentError(
+                "[rate,per]", f"values `{rate=}`, `{per=}` should be positive."
+            )
+        self._tokens_per_second = rate / per
+        self._capacity = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self._capacity
+        self._timer = timer
+        self._sleep = sleep
+        self._updated_at = timer()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """
+        Takes `tokens` from the bucket and returns how long the caller has to wait.
+        """
+        with self._lock:
+            now = self._timer()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated_at) * self._tokens_per_second,
+            )
+            self._updated_at = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._tokens_per_second
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Blocks until `tokens` are available.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """
+        Waits, without blocking the event loop, until `tokens` are available.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for retryable failures.
+
+    Attributes:
+        max_retries (int): Maximum number of retries after the first attempt.
+        initial_backoff (float): Backoff ceiling of the first retry, in seconds.
+        max_backoff (float): Upper bound of any backoff, in seconds.
+        multiplier (float): Growth factor of the backoff ceiling between retries.
+        jitter (bool): Whether to sleep a random duration up to the ceiling.
+        retryable_statuses (FrozenSet[int]): HTTP statuses that are retried.
+        retryable_exceptions (Tuple[Type[BaseException], ...]): Exception types that are
+            retried regardless of status, e.g. connection resets and timeouts.
+    """
+
+    max_retries: int = 5
+    initial_backoff: float = 1.0
+    max_backoff: float = 32.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retryable_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retryable_exceptions: Tuple[Type[BaseException], ...] = (
+        ConnectionError,
+        TimeoutError,
+    )
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Whether a failed attempt should be retried.
+        """
+        if isinstance(error, self.retryable_exceptions):
+            return True
+        return _http_status(error) in self.retryable_statuses
+
+    def backoff(self, retry: int) -> float:
+        """
+        Seconds to sleep before the given retry (0 based).
+        """
+        ceiling = min(self.max_backoff, self.initial_backoff * self.multiplier**retry)
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+
+_T = TypeVar("_T")
+
+
+class _Flight:  # pylint: disable=R0903
+    """
+    A call in progress, awaited by the threads that asked for the same key.
+    """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: while a call for a key is in flight, callers
+    asking for the same key wait for it and all receive its result (or its exception).
+    Nothing is cached; the next call after completion runs again.
+
+    Works for threads (`do`) and for asyncio tasks (`do_async`, coalesced per event loop).
+
+    Attributes:
+        calls (int): Number of calls made through the single flight.
+        collapsed (int): Number of calls served by another in-flight call.
+
+    Notes:
+        Coalesced callers share the same result object, treat it as read-only.
+    """
+
+    class Stats(NamedTuple):
+        """
+        Snapshot of the single flight counters
+        """
+
+        calls: int
+        collapsed: int
+        in_flight: int
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+        self.calls: int = 0
+        self.collapsed: int = 0
+
+    @property
+    def stats(self) -> "SingleFlight.Stats":
+        """ReadOnly"""
+        with self._lock:
+            return self.Stats(
+                self.calls,
+                self.collapsed,
+                len(self._flights) + len(self._async_flights),
+            )
+
+    def do(self, key: Hashable, function: Callable[[], _T]) -> _T:
+        """
+        Runs `function`, unless a call for `key` is in flight, then waits for its result.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            function (Callable[[], _T]): The call.
+
+        Returns:
+            _T: The result of the call.
+        """
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.collapsed += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = function()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    async def do_async(
+        self, key: Hashable, function: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """
+        Awaits `function()`, unless a call for `key` is in flight on the running event
+        loop, then awaits its result.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            function (Callable[[], Awaitable[_T]]): Returns the awaitable of the call.
+
+        Returns:
+            _T: The result of the call.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            self.calls += 1
+            future = self._async_flights.get(flight_key)
+            leader = future is None
+            if future is None:
+                future = self._async_flights[flight_key] = loop.create_future()
+            else:
+                self.collapsed += 1
+        if not leader:
+            # a cancelled follower must not cancel the shared call
+            return await asyncio.shield(future)
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved, even when nobody else was waiting
+            raise
+        finally:
+            with self._lock:
+                del self._async_flights[flight_key]
+        future.set_result(result)
+        return result
+
+
+def _http_status(error: BaseException) -> Optional[int]:
+    """
+    Extracts the HTTP status from an `HttpError` (or any look-alike), None if absent.
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "resp", None), "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+# limiters applied on top of the executor's own, to the requests of a context only
+_scoped_rate_limiters: contextvars.ContextVar[Tuple[RateLimiter, ...]] = (
+    contextvars.ContextVar("gsheet_tools_scoped_rate_limiters", default=())
+)
+
+
+@contextlib.contextmanager
+def _limited_by(rate_limiter: Optional[RateLimiter]) -> Iterator[None]:
+    """
+    Applies `rate_limiter`, besides the executor's own, to the requests made in the
+    current context (thread or asyncio task) until the block exits. Other threads and
+    the executor itself are left untouched.
+    """
+    if rate_limiter is None:
+        yield
+        return
+    token = _scoped_rate_limiters.set(_scoped_rate_limiters.get() + (rate_limiter,))
+    try:
+        yield
+    finally:
+        _scoped_rate_limiters.reset(token)
+
+
+class RequestExecutor:  # pylint: disable=R0902
+    """
+    Executes Google API requests through a rate limiter and a retry policy.
+
+    Args:
+        rate_limiter (Optional[RateLimiter]): Limiter applied before every attempt.
+        retry_policy (RetryPolicy): Backoff applied to retryable failures.
+        sleep (Callable[[float], Any]): Blocking sleep used between retries.
+        single_flight (Optional[SingleFlight]): Coalesces concurrent requests that
+            share a `coalesce_key`, e.g. identical reads from several threads.
+
+    Attributes:
+        requests (int): Number of attempts made, retries included.
+        retries (int): Number of retried attempts.
+        failures (int): Number of requests that failed after the last attempt.
+        throttled_seconds (float): Total time spent waiting on the rate limiter.
+    """
+
+    class Stats(NamedTuple):
+        """
+        Snapshot of the executor counters
+        """
+
+        requests: int
+        retries: int
+        failures: int
+        throttled_seconds: float
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        sleep: Callable[[float], Any] = time.sleep,
+        single_flight: Optional[SingleFlight] = None,
+    ) -> None:
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.single_flight = single_flight
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.requests: int = 0
+        self.retries: int = 0
+        self.failures: int = 0
+        self.throttled_seconds: float = 0.0
+
+    @property
+    def stats(self) -> "RequestExecutor.Stats":
+        """ReadOnly"""
+        with self._lock:
+            return self.Stats(
+                self.requests, self.retries, self.failures, self.throttled_seconds
+            )
+
+    def _count(
+        self, requests: int = 0, retries: int = 0, failures: int = 0, waited: float = 0
+    ) -> None:
+        with self._lock:
+            self.requests += requests
+            self.retries += retries
+            self.failures += failures
+            self.throttled_seconds += waited
+
+    def execute(
+        self,
+        request: Any,
+        coalesce_key: Optional[Hashable] = None,
+        tokens: float = 1,
+        **execute_kwargs: Any,
+    ) -> Any:
+        """
+        Executes a request, waiting on the rate limiter and retrying transient failures.
+
+        Args:
+            request (Any): The request built by the service object.
+            coalesce_key (Optional[Hashable]): Identifies identical requests, which share
+                one in-flight call when a `single_flight` is configured.
+            tokens (float): Rate limiter tokens taken per attempt, e.g. the number of
+                calls of a batch request, each counted against the quota.
+            **execute_kwargs (Any): Forwarded to `request.execute`.
+
+        Returns:
+            Any: The response of the request.
+
+        Raises:
+            Exception: The error of the last attempt, once retries are exhausted or
+                when the error is not retryable.
+        """
+        if self.single_flight is not None and coalesce_key is not None:
+            return self.single_flight.do(
+                coalesce_key, lambda: self._execute(request, tokens, **execute_kwargs)
+            )
+        return self._execute(request, tokens, **execute_kwargs)
+
+    def _execute(self, request: Any, tokens: float, **execute_kwargs: Any) -> Any:
+        retry = 0
+        while True:
+            if self.rate_limiter is not None:
+                self._count(waited=self.rate_limiter.acquire(tokens))
+            for rate_limiter in _scoped_rate_limiters.get():
+                self._count(waited=rate_limiter.acquire(tokens))
+            self._count(requests=1)
+            try:
+                return request.execute(**execute_kwargs)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if retry >= self.retry_policy.max_retries or not (
+                    self.retry_policy.is_retryable(e)
+                ):
+                    self._count(failures=1)
+                    raise
+            self._sleep(self.retry_policy.backoff(retry))
+            retry += 1
+            self._count(retries=1)
+
+
+_request_executor = RequestExecutor()
+
+
+def get_request_executor() -> RequestExecutor:
+    """
+    Returns the executor every GSheet Tools API call goes through.
+    """
+    return _request_executor
+
+
+def set_request_executor(executor: RequestExecutor) -> RequestExecutor:
+    """
+    Replaces the executor every GSheet Tools API call goes through.
+
+    Args:
+        executor (RequestExecutor): The new executor.
+
+    Returns:
+        RequestExecutor: The previous executor.
+    """
+    global _request_executor  # pylint: disable=global-statement
+    previous, _request_executor = _request_executor, executor
+    return previous
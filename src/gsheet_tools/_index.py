@@ -0,0 +1,96 @@
+"""
+Indexed lookup of the sheets described by spreadsheet metadata.
+
+Classes:
+- SheetIndex: Maps titles, sheet IDs and positions to sheet properties.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+__all__ = [
+    "SheetIndex",
+]
+
+
+class SheetIndex:
+    """
+    Maps the titles, sheet IDs and positions of a workbook to its sheet properties.
+
+    The maps are built once per metadata payload; lookups are constant time instead of
+    a scan over every tab. Keys and looked up values are compared as strings, so
+    `gid=0` and `gid="0"` (or `sheet_position=1` and `"1"`) find the same sheet.
+    When several sheets share a value, the first one in workbook order wins.
+
+    Args:
+        spreadsheet_metadata (dict): A `spreadsheets().get(fields="sheets.properties")`
+            response.
+
+    Notes:
+        Use `SheetIndex.of` to reuse the index of a payload that is looked up repeatedly,
+        e.g. metadata served by a `MetadataCache`. Payloads must not be mutated once
+        indexed.
+    """
+
+    KEYS = ("sheetId", "title", "index")
+    _MEMO_SIZE = 256
+    _memo: "OrderedDict[int, Tuple[dict, SheetIndex]]" = OrderedDict()
+    _memo_lock = threading.Lock()
+
+    def __init__(self, spreadsheet_metadata: dict) -> None:
+        self._sheets: List[dict] = [
+            sheet["properties"] for sheet in spreadsheet_metadata.get("sheets", [])
+        ]
+        self._maps: Dict[str, Dict[str, dict]] = {key: {} for key in self.KEYS}
+        for properties in self._sheets:
+            for key, lookup in self._maps.items():
+                if key in properties:
+                    lookup.setdefault(str(properties[key]), properties)
+
+    @classmethod
+    def of(cls, spreadsheet_metadata: dict) -> "SheetIndex":
+        """
+        Returns the index of a metadata payload, building it on the first call only.
+
+        Args:
+            spreadsheet_metadata (dict): The spreadsheet metadata.
+
+        Returns:
+            SheetIndex: The index of the payload.
+        """
+        memo_key = id(spreadsheet_metadata)
+        with cls._memo_lock:
+            entry = cls._memo.get(memo_key)
+            # the memo holds the payload, so its id cannot be reused while cached
+            if entry is not None and entry[0] is spreadsheet_metadata:
+                cls._memo.move_to_end(memo_key)
+                return entry[1]
+        index = cls(spreadsheet_metadata)
+        with cls._memo_lock:
+            cls._memo[memo_key] = (spreadsheet_metadata, index)
+            cls._memo.move_to_end(memo_key)
+            while len(cls._memo) > cls._MEMO_SIZE:
+                cls._memo.popitem(last=False)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._sheets)
+
+    @property
+    def sheets(self) -> List[dict]:
+        """ReadOnly, the sheet properties in workbook order"""
+        return list(self._sheets)
+
+    def find(self, key: str, value: Any) -> Optional[dict]:
+        """
+        Returns the properties of the first sheet whose `key` property equals `value`.
+
+        Args:
+            key (str): The property to search on, any of 'sheetId', 'title' or 'index'.
+            value (Any): The value searched for, compared as a string.
+
+        Returns:
+            Optional[dict]: The sheet properties, None if no sheet matches.
+        """
+        return self._maps[key].get(str(value))
@@ -0,0 +1,290 @@
+"""
+Instrumentation of the API calls and processing stages of GSheet Tools.
+
+Every Google API request and every `prepare_dataframe` call runs inside a span, which
+records its duration and attributes (API method, file_id, range, row/cell counts,
+response size). Spans are handed to the configured `Instrumentation`; the default one
+is a no-op, so nothing is measured until a collector is installed.
+
+Classes:
+- Span: Timing and attributes of one instrumented operation.
+- Instrumentation: Receives finished spans, forwarding them to an optional callback.
+- NoopInstrumentation: Default instrumentation, records nothing.
+- InMemoryCollector: Keeps the latest spans in memory and summarizes them.
+
+Functions:
+- get_instrumentation: Returns the instrumentation used by GSheet Tools.
+- set_instrumentation: Replaces the instrumentation used by GSheet Tools.
+
+Example:
+    collector = InMemoryCollector(response_bytes=True)
+    set_instrumentation(collector)
+    ...
+    for name, summary in collector.summary().items():
+        print(name, summary.calls, summary.total_seconds, summary.response_bytes)
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Type
+
+__all__ = [
+    "Span",
+    "Instrumentation",
+    "NoopInstrumentation",
+    "InMemoryCollector",
+    "get_instrumentation",
+    "set_instrumentation",
+]
+
+
+class Span:
+    """
+    Timing and attributes of one instrumented operation.
+
+    Attributes:
+        name (str): The operation, e.g. 'sheets.values.get' or 'prepare_dataframe'.
+        attributes (Dict[str, Any]): e.g. file_id, range, rows, cells, response_bytes.
+        started_at (float): `time.time()` when the operation started.
+        duration (float): Seconds the operation took.
+        error (Optional[str]): Name of the exception raised by the operation, if any.
+    """
+
+    __slots__ = ("name", "attributes", "started_at", "duration", "error")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.started_at = 0.0
+        self.duration = 0.0
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        """
+        Adds attributes to the span.
+        """
+        self.attributes.update(attributes)
+
+    def __repr__(self) -> str:
+        return (
+            f"Span({self.name!r}, duration={self.duration:.6f}, "
+            f"attributes={self.attributes!r}, error={self.error!r})"
+        )
+
+
+class _SpanContext:
+    """
+    Times the body of a `with` block into a span.
+    """
+
+    __slots__ = ("_instrumentation", "_span", "_started")
+
+    def __init__(self, instrumentation: "Instrumentation", span: Span) -> None:
+        self._instrumentation = instrumentation
+        self._span = span
+        self._started = 0.0
+
+    def __enter__(self) -> Span:
+        self._span.started_at = time.time()
+        self._started = time.perf_counter()
+        return self._span
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], *exc_info: Any) -> None:
+        self._span.duration = time.perf_counter() - self._started
+        if exc_type is not None:
+            self._span.error = exc_type.__name__
+        self._instrumentation.record(self._span)
+
+
+class _NullSpan(Span):  # pylint: disable=R0903
+    """
+    Span of the no-op instrumentation, ignores attributes.
+    """
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+class _NullSpanContext:
+    __slots__ = ()
+
+    def __enter__(self) -> Span:
+        return _NULL_SPAN
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan("", {})
+_NULL_SPAN_CONTEXT = _NullSpanContext()
+
+
+class Instrumentation:
+    """
+    Receives finished spans.
+
+    Pass a `callback` to forward every span (e.g. to a metrics or tracing client), or
+    subclass and override `record`.
+
+    Args:
+        callback (Optional[Callable[[Span], Any]]): Called with every finished span.
+        response_bytes (bool): Whether API call spans carry `response_bytes`, the JSON
+            size of the response. Measuring it serializes every response again, which
+            costs about as much as a large read itself.
+
+    Attributes:
+        enabled (bool): Whether spans are measured. Costly attributes, such as the
+            response size, are only computed when enabled.
+    """
+
+    enabled: bool = True
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[Span], Any]] = None,
+        response_bytes: bool = False,
+    ) -> None:
+        self._callback = callback
+        self.response_bytes = response_bytes
+
+    def span(self, name: str, **attributes: Any) -> Any:
+        """
+        Returns a context manager timing its body into a span.
+
+        Args:
+            name (str): The operation.
+            **attributes (Any): The attributes known before the operation runs.
+
+        Returns:
+            Any: A context manager yielding the `Span`, to add attributes to.
+        """
+        return _SpanContext(self, Span(name, attributes))
+
+    def record(self, span: Span) -> None:
+        """
+        Handles a finished span.
+
+        Args:
+            span (Span): The span.
+        """
+        if self._callback is not None:
+            self._callback(span)
+
+
+class NoopInstrumentation(Instrumentation):
+    """
+    Default instrumentation, measures and records nothing.
+    """
+
+    enabled = False
+
+    def span(self, name: str, **attributes: Any) -> Any:
+        return _NULL_SPAN_CONTEXT
+
+
+class InMemoryCollector(Instrumentation):
+    """
+    Keeps the latest spans in memory and summarizes them by name. Thread-safe.
+
+    Args:
+        maxlen (Optional[int]): Number of spans kept, None for no limit.
+        callback (Optional[Callable[[Span], Any]]): Also called with every span.
+        response_bytes (bool): Whether API call spans carry `response_bytes`, see
+            `Instrumentation`.
+    """
+
+    class Summary(NamedTuple):
+        """
+        Aggregate of the spans of one operation
+        """
+
+        calls: int
+        errors: int
+        total_seconds: float
+        mean_seconds: float
+        max_seconds: float
+        rows: int
+        cells: int
+        response_bytes: int
+
+    def __init__(
+        self,
+        maxlen: Optional[int] = 10_000,
+        callback: Optional[Callable[[Span], Any]] = None,
+        response_bytes: bool = False,
+    ) -> None:
+        super().__init__(callback, response_bytes)
+        self._lock = threading.Lock()
+        self._spans: Deque[Span] = deque(maxlen=maxlen)
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+        super().record(span)
+
+    @property
+    def spans(self) -> List[Span]:
+        """ReadOnly, oldest first"""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """
+        Drops the collected spans.
+        """
+        with self._lock:
+            self._spans.clear()
+
+    def summary(self) -> Dict[str, "InMemoryCollector.Summary"]:
+        """
+        Summarizes the collected spans by name.
+
+        Returns:
+            Dict[str, InMemoryCollector.Summary]: The summary of every operation.
+        """
+        grouped: Dict[str, List[Span]] = {}
+        for span in self.spans:
+            grouped.setdefault(span.name, []).append(span)
+        return {
+            name: self.Summary(
+                calls=len(spans),
+                errors=sum(span.error is not None for span in spans),
+                total_seconds=sum(span.duration for span in spans),
+                mean_seconds=sum(span.duration for span in spans) / len(spans),
+                max_seconds=max(span.duration for span in spans),
+                rows=sum(span.attributes.get("rows", 0) for span in spans),
+                cells=sum(span.attributes.get("cells", 0) for span in spans),
+                response_bytes=sum(
+                    span.attributes.get("response_bytes", 0) for span in spans
+                ),
+            )
+            for name, spans in grouped.items()
+        }
+
+
+_instrumentation: Instrumentation = NoopInstrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    """
+    Returns the instrumentation every GSheet Tools span goes to.
+    """
+    return _instrumentation
+
+
+def set_instrumentation(instrumentation: Instrumentation) -> Instrumentation:
+    """
+    Replaces the instrumentation every GSheet Tools span goes to.
+
+    Args:
+        instrumentation (Instrumentation): The new instrumentation.
+
+    Returns:
+        Instrumentation: The previous instrumentation.
+    """
+    global _instrumentation  # pylint: disable=global-statement
+    previous, _instrumentation = _instrumentation, instrumentation
+    return previous
@@ -0,0 +1,114 @@
+"""
+A1 range planning from the grid size reported by spreadsheet metadata.
+
+Functions:
+- column_letter: Converts a 1-based column number to its A1 letters.
+- column_number: Converts A1 column letters to a 1-based column number.
+- plan_range: Builds the tightest A1 range covering the columns of a sheet.
+- quote_sheet_title: Quotes a sheet title for use in an A1 range.
+"""
+
+from typing import Optional
+
+from gsheet_tools._exceptions import Exceptions
+
+__all__ = [
+    "column_letter",
+    "column_number",
+    "plan_range",
+    "quote_sheet_title",
+]
+
+
+def column_letter(number: int) -> str:
+    """
+    Converts a 1-based column number to its A1 letters, e.g. 1 -> 'A', 27 -> 'AA'.
+
+    Args:
+        number (int): The column number.
+
+    Returns:
+        str: The column letters.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If `number` is not positive.
+    """
+    if number <= 0:
+        raise Exceptions.GsheetToolsArgumentError(
+            "[number]", f"value `{number=}` is invalid, should be positive."
+        )
+    letters = ""
+    while number:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def column_number(letters: str) -> int:
+    """
+    Converts A1 column letters to a 1-based column number, e.g. 'AA' -> 27.
+
+    Args:
+        letters (str): The column letters, case insensitive.
+
+    Returns:
+        int: The column number.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If `letters` are not A-Z letters.
+    """
+    if not letters or not letters.isascii() or not letters.isalpha():
+        raise Exceptions.GsheetToolsArgumentError(
+            "[letters]", f"value `{letters=}` is invalid, should be column letters."
+        )
+    number = 0
+    for letter in letters.upper():
+        number = number * 26 + ord(letter) - ord("A") + 1
+    return number
+
+
+def plan_range(
+    sheet_title: str,
+    sheet_properties: dict,
+    first_row: int = 1,
+    last_row: Optional[int] = None,
+) -> Optional[str]:
+    """
+    Builds the tightest A1 range covering the columns of a sheet, from `first_row` on.
+
+    The width comes from `gridProperties.columnCount`, part of the `sheets.properties`
+    metadata, so columns beyond Z are covered. The rows are left open-ended: metadata
+    served from a cache may predate rows appended since, and a bound taken from its
+    `rowCount` would drop them.
+
+    Args:
+        sheet_title (str): The title of the sheet.
+        sheet_properties (dict): The properties of the sheet.
+        first_row (int): The first row to read, 2 to skip the headers.
+        last_row (Optional[int]): The last row to read, None for every row.
+
+    Returns:
+        Optional[str]: The range, e.g. 'Sheet1!A1:AB', None when the grid size is not
+            reported.
+    """
+    grid_properties = sheet_properties.get("gridProperties") or {}
+    column_count = int(grid_properties.get("columnCount") or 0)
+    if column_count <= 0:
+        return None
+    end_row = str(max(last_row, first_row)) if last_row is not None else ""
+    return f"{sheet_title}!A{first_row}:{column_letter(column_count)}{end_row}"
+
+
+def quote_sheet_title(sheet_title: str) -> str:
+    """
+    Quotes a sheet title for use in an A1 range, e.g. "Q1" -> "'Q1'", "Bob's" ->
+    "'Bob''s'". A bare title that looks like a cell reference would be read as a cell of
+    the first sheet.
+
+    Args:
+        sheet_title (str): The title of the sheet.
+
+    Returns:
+        str: The quoted title.
+    """
+    return "'" + sheet_title.replace("'", "''") + "'"
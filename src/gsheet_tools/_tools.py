@@ -14,29 +14,61 @@ Classes:
 - NameFormatter: Provides utilities for formatting sheet names.
 - SheetOrigins: Enum for identifying the origin of a Google Sheet.
 - SheetMimetype: Enum for identifying the MIME type of a Google Sheet.
+- OriginDetails: Details of a Google Sheet file origin, returned by check_sheet_origin.
+- SheetSelector: Describes which tab of a spreadsheet to read, and which range of it.
 
 Functions:
 - get_gid_sheets_data: Fetches data for a specific sheet by its GID or the first sheet by default.
 - get_gsheet_data: Fetches data from a Google Sheet with various selection options.
+- get_gsheet_data_many: Fetches several tabs of one Google Sheet with batched reads.
+- get_workbook_dataframes: Reads every tab of a Google Sheet into a dict of DataFrames.
+- iter_gsheet_data: Streams data from a Google Sheet in blocks of rows.
 - check_sheet_origin: Determines the origin and MIME type of a Google Sheet file.
 - is_valid_google_url: Validates if a URL is a valid Google Sheets URL.
 - prepare_dataframe: Converts Google Sheets data into a pandas DataFrame.
+- prepare_arrow_table: Converts Google Sheets data into a pyarrow Table.
 
 This module is designed to simplify working with Google Sheets data and provide robust error
 handling for common issues.
 """
 
 import dataclasses
+import fnmatch
+import functools
+import itertools
+import json
 import re
 import warnings
-from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
-import pandas as pd
+from gsheet_tools._cache import MetadataCache, ResponseCache
+from gsheet_tools._exceptions import Exceptions
+from gsheet_tools._execution import _http_status, get_request_executor
+from gsheet_tools._index import SheetIndex
+from gsheet_tools._instrumentation import get_instrumentation
+from gsheet_tools._ranges import column_letter, plan_range, quote_sheet_title
 
-from gsheet_tools._exceptions import GsheetToolExceptionsBase
+if TYPE_CHECKING:
+    # pandas is imported on first use by the DataFrame producing functions, keeping
+    # `import gsheet_tools` light for callers that only resolve URLs or read values
+    import pandas as pd
 
 __all__ = [
     "Exceptions",
@@ -44,34 +76,20 @@ __all__ = [
     "NameFormatter",
     "SheetOrigins",
     "SheetMimetype",
+    "OriginDetails",
+    "SheetSelector",
     "get_gid_sheets_data",
+    "get_gsheet_data",
+    "get_gsheet_data_many",
+    "get_workbook_dataframes",
+    "iter_gsheet_data",
     "check_sheet_origin",
     "is_valid_google_url",
     "prepare_dataframe",
+    "prepare_arrow_table",
 ]
 
 
-class Exceptions:
-    """
-    Custom exception classes for handling errors specific to Google Sheets processing.
-    """
-
-    class GoogleSpreadsheetProcessingError(GsheetToolExceptionsBase):
-        """
-        Raised when there is an issue in parsing specific Google Sheets.
-        """
-
-    class GsheetToolsArgumentError(GsheetToolExceptionsBase):
-        """
-        Raised when invalid arguments are passed to GSheet tools functions.
-        """
-
-        def __init__(self, arg_name: str, message: str, *args: tuple) -> None:
-            prefix = f"Argument::{arg_name}"
-            self.message = f"{prefix}|{message}"
-            super().__init__(self.message, *args)
-
-
 class UrlResolver:
     """
     Resolves and validates Google Sheets URLs, extracting file and sheet IDs.
@@ -84,6 +102,11 @@ class UrlResolver:
         is_valid (bool): Indicates whether the URL is valid.
         url_data (Optional[UrlResolver.UrlData]): Resolved fields of the URL.
 
+    Example:
+        for resolution in UrlResolver.iter_resolve(urls, unique=True):
+            if resolution.is_valid:
+                ...  # resolution.file_id, resolution.gid
+
     Notes:
         Supported URL formats:
         - https://docs.google.com/spreadsheets/d/{GOOGLE-SHEET-RESOURCE-ID}/edit?gid={SHEET-GID}#gid=546508778 # pylint: disable=C0301
@@ -99,6 +122,15 @@ class UrlResolver:
         file_id: str
         gid: str
 
+    class Resolution(NamedTuple):
+        """
+        Compact result of a bulk resolution, file_id and gid are None when invalid
+        """
+
+        file_id: Optional[str]
+        gid: Optional[str]
+        is_valid: bool
+
     def __init__(self, raw_url: str):
         self._raw_url: str = raw_url
         self._is_valid: bool = False
@@ -124,16 +156,71 @@ class UrlResolver:
         """
         Initializes the fields by validating and parsing the URL.
         """
-        if not is_valid_google_url(self._raw_url):
-            return
-        if "spreadsheets" not in self._raw_url:
-            return
-        match = re.search(r"/d/([a-zA-Z0-9-_]+)(?:.*?gid=([0-9]+))?", self._raw_url)
-        if match:
-            _file_id = match.group(1)
-            _gid = match.group(2)
+        resolution = _resolve_url(self._raw_url)
+        if resolution.is_valid:
             self._is_valid = True
-            self._url_data = self.UrlData(file_id=_file_id, gid=_gid)
+            self._url_data = self.UrlData(
+                file_id=resolution.file_id, gid=resolution.gid  # type: ignore[arg-type]
+            )
+
+    @classmethod
+    def iter_resolve(
+        cls, raw_urls: Iterable[str], unique: bool = False
+    ) -> Iterator["UrlResolver.Resolution"]:
+        """
+        Resolves many URLs lazily, without building a resolver object per URL.
+
+        Results are memoized, so repeated URLs are parsed once.
+
+        Args:
+            raw_urls (Iterable[str]): The raw URLs of the Google Sheets.
+            unique (bool): Whether to yield a valid file_id only for its first URL.
+                Invalid URLs are always yielded.
+
+        Yields:
+            UrlResolver.Resolution: One result per URL, in input order.
+        """
+        seen_file_ids = set()
+        for raw_url in raw_urls:
+            resolution = _resolve_url(raw_url)
+            if unique and resolution.is_valid:
+                if resolution.file_id in seen_file_ids:
+                    continue
+                seen_file_ids.add(resolution.file_id)
+            yield resolution
+
+    @classmethod
+    def resolve_many(
+        cls, raw_urls: Iterable[str], unique: bool = False
+    ) -> List["UrlResolver.Resolution"]:
+        """
+        Resolves many URLs at once, see `iter_resolve`.
+
+        Args:
+            raw_urls (Iterable[str]): The raw URLs of the Google Sheets.
+            unique (bool): Whether to keep a valid file_id only for its first URL.
+
+        Returns:
+            List[UrlResolver.Resolution]: One result per URL, in input order.
+        """
+        return list(cls.iter_resolve(raw_urls, unique=unique))
+
+
+_SHEET_URL_PATTERN = re.compile(r"/d/([a-zA-Z0-9-_]+)(?:.*?gid=([0-9]+))?")
+_INVALID_RESOLUTION = UrlResolver.Resolution(None, None, False)
+
+
+@functools.lru_cache(maxsize=65536)
+def _resolve_url(raw_url: str) -> UrlResolver.Resolution:
+    """
+    Validates and parses a URL, memoized for repeated URLs.
+    """
+    if "spreadsheets" not in raw_url or not is_valid_google_url(raw_url):
+        return _INVALID_RESOLUTION
+    match = _SHEET_URL_PATTERN.search(raw_url)
+    if match is None:
+        return _INVALID_RESOLUTION
+    return UrlResolver.Resolution(match.group(1), match.group(2), True)
 
 
 class NameFormatter:
@@ -181,7 +268,207 @@ class SheetMimetype(str, Enum):
     STANDARD_CSV = "text/csv"
 
 
-def _fetch_data(sheet: object, sheet_id: str, cell_range: str) -> list:
+class OriginDetails(NamedTuple):
+    """
+    Details of a Google Sheet file origin, see `check_sheet_origin`.
+    """
+
+    is_parsable: bool
+    mimetype: Optional[str]
+    original_extension: Optional[str]
+    original_filename: Optional[str] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class SheetSelector:
+    """
+    Describes which tab of a spreadsheet to read, and which range of it.
+
+    The fields mirror the selection arguments of `get_gsheet_data` and are validated
+    the same way on creation.
+
+    Args:
+        by (str): The selection method ('gid', 'sheet_name' or 'sheet_position').
+        gid (Optional[str]): The GID of the sheet (if by='gid').
+        sheet_name (Optional[str]): The name of the sheet (if by='sheet_name').
+        sheet_position (Optional[int]): The position of the sheet (if by='sheet_position').
+        without_headers (bool): Whether to exclude headers from the data.
+        custom_tabular_range (Optional[Tuple[str, str]]): The custom range of cells to
+            fetch, None to plan the range from the sheet's gridProperties.
+        not_found_priority (Optional[Dict[str, Any]]): Priority list for fallback options.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If invalid arguments are passed.
+    """
+
+    PROPERTY_KEYS: ClassVar[Dict[str, str]] = {
+        "gid": "sheetId",
+        "sheet_name": "title",
+        "sheet_position": "index",
+    }
+
+    by: str
+    gid: Optional[str] = None
+    sheet_name: Optional[str] = None
+    sheet_position: Optional[int] = None
+    without_headers: bool = False
+    custom_tabular_range: Optional[Tuple[str, str]] = None
+    not_found_priority: Optional[Dict[str, Any]] = dataclasses.field(
+        default=None, hash=False
+    )
+
+    def __post_init__(self) -> None:
+        by = self.by
+        __by__ = self.PROPERTY_KEYS.keys()
+        if by not in __by__:
+            raise Exceptions.GsheetToolsArgumentError(
+                "[by]",
+                f"value `{by=}` is invalid, should be any one of `{','.join(__by__)}`.",
+            )
+        for argument in __by__:
+            value = getattr(self, argument)
+            if by == argument and value is None:
+                raise Exceptions.GsheetToolsArgumentError(
+                    f"[by,{argument}]",
+                    f"with `{by=}` you cannot pass `{argument}={value!r}`.",
+                )
+        if self.not_found_priority and not all(
+            v in __by__ for v in self.not_found_priority
+        ):
+            raise Exceptions.GsheetToolsArgumentError(
+                "[not_found_priority]",
+                f"not_found_priority should be any of `{','.join(__by__)}`.",
+            )
+
+    @property
+    def search_value(self) -> Any:
+        """The value searched for with the primary selection method"""
+        return getattr(self, self.by)
+
+    def cell_range(
+        self, sheet_title: str, sheet_properties: Optional[dict] = None
+    ) -> str:
+        """
+        Builds the A1 range to read from the selected sheet.
+
+        Without a custom range, the range is planned from the grid width of the sheet
+        (see `plan_range`). Metadata without gridProperties falls back to the fixed
+        `A1:z999999` rectangle (`A2:z999999` without headers).
+
+        Args:
+            sheet_title (str): The title of the selected sheet.
+            sheet_properties (Optional[dict]): The properties of the selected sheet.
+
+        Returns:
+            str: The range of cells to fetch.
+        """
+        if self.custom_tabular_range:
+            return f"{sheet_title}!" + ":".join(self.custom_tabular_range)
+        first_row = 2 if self.without_headers else 1
+        planned_range = plan_range(sheet_title, sheet_properties or {}, first_row)
+        if planned_range is not None:
+            return planned_range
+        return f"{sheet_title}!A{first_row}:z999999"
+
+
+def _coalesce_key(
+    method: str,
+    file_id: str,
+    cell_range: str = "",
+    render_options: Optional[Dict[str, str]] = None,
+) -> Tuple[str, str, str, Tuple[Tuple[str, str], ...]]:
+    """
+    Identifies identical reads, which a `SingleFlight` serves with one call.
+    """
+    return method, file_id, cell_range, tuple(sorted((render_options or {}).items()))
+
+
+def _execute(
+    request: Any,
+    method: str = "",
+    coalesce_key: Optional[Hashable] = None,
+    tokens: float = 1,
+    **attributes: Any,
+) -> Any:
+    """
+    Executes a Google API request through the configured RequestExecutor, in a span.
+
+    Args:
+        request (Any): The request built by the service object.
+        method (str): The API method, e.g. 'sheets.values.get', naming the span.
+        coalesce_key (Optional[Hashable]): Identifies identical requests, coalesced when
+            the executor has a `single_flight`.
+        tokens (float): Rate limiter tokens the request costs, see
+            `RequestExecutor.execute`.
+        **attributes (Any): Span attributes known upfront, e.g. file_id and range.
+
+    Returns:
+        Any: The response of the request.
+    """
+    instrumentation = get_instrumentation()
+    if not instrumentation.enabled:
+        return get_request_executor().execute(
+            request, coalesce_key=coalesce_key, tokens=tokens
+        )
+    with instrumentation.span(method or "api.execute", **attributes) as span:
+        response = get_request_executor().execute(
+            request, coalesce_key=coalesce_key, tokens=tokens
+        )
+        span.set(**_response_counts(response, instrumentation.response_bytes))
+    return response
+
+
+def _response_counts(response: Any, response_bytes: bool = False) -> Dict[str, int]:
+    """
+    Counts the rows and cells of an API response, for spans, and its JSON bytes when
+    asked for (serializing the response again).
+    """
+    if not isinstance(response, dict):
+        return {}
+    rows = cells = 0
+    for value_range in response.get("valueRanges", [response]):
+        values = value_range.get("values", [])
+        rows += len(values)
+        cells += sum(map(len, values))
+    counts = {"rows": rows, "cells": cells}
+    if response_bytes:
+        counts["response_bytes"] = len(json.dumps(response, default=str))
+    return counts
+
+
+# `typed` reads: raw numbers/booleans instead of display strings, dates as serial numbers
+_TYPED_RENDER_OPTIONS: Dict[str, str] = {
+    "valueRenderOption": "UNFORMATTED_VALUE",
+    "dateTimeRenderOption": "SERIAL_NUMBER",
+}
+
+
+# values of `major_dimension`, the layout of the values returned by a read
+_MAJOR_DIMENSIONS = ("ROWS", "COLUMNS")
+
+
+def _render_options(typed: bool, major_dimension: str = "ROWS") -> Dict[str, str]:
+    """
+    Returns the `values()` request options of a typed or formatted, row or column read.
+    """
+    render_options = _TYPED_RENDER_OPTIONS if typed else {}
+    if major_dimension == "COLUMNS":
+        return {**render_options, "majorDimension": major_dimension}
+    return render_options
+
+
+def _validate_major_dimension(major_dimension: str) -> None:
+    if major_dimension not in _MAJOR_DIMENSIONS:
+        raise Exceptions.GsheetToolsArgumentError(
+            "[major_dimension]",
+            f"value `{major_dimension=}` is invalid, should be any one of "
+            f"`{','.join(_MAJOR_DIMENSIONS)}`.",
+        )
+
+
+def _fetch_data(
+    sheet: object, sheet_id: str, cell_range: str, **render_options: str
+) -> list:
     """
     Fetches data from a single sheet.
 
@@ -189,20 +476,358 @@ def _fetch_data(sheet: object, sheet_id: str, cell_range: str) -> list:
         sheet (object): The Google Sheets API service object.
         sheet_id (str): The ID of the spreadsheet.
         range (str): The range of cells to fetch.
+        **render_options (str): valueRenderOption / dateTimeRenderOption of the read.
 
     Returns:
         list: The fetched data.
     """
-    result = (
-        sheet.values()  # type: ignore[attr-defined]
-        .get(spreadsheetId=sheet_id, range=cell_range)  # type: ignore[attr-defined]
-        .execute()
+    result = _execute(
+        sheet.values().get(  # type: ignore[attr-defined]
+            spreadsheetId=sheet_id, range=cell_range, **render_options
+        ),
+        "sheets.values.get",
+        _coalesce_key("sheets.values.get", sheet_id, cell_range, render_options),
+        file_id=sheet_id,
+        range=cell_range,
     )
     return result.get("values", [])
 
 
+def _fetch_metadata(
+    sheet: object, sheet_id: str, metadata_cache: Optional[MetadataCache] = None
+) -> dict:
+    """
+    Fetches the properties of every sheet in a spreadsheet, consulting the cache first.
+
+    Args:
+        sheet (object): The Google Sheets API service object.
+        sheet_id (str): The ID of the spreadsheet.
+        metadata_cache (Optional[MetadataCache]): Cache to read from and populate.
+
+    Returns:
+        dict: The spreadsheet metadata.
+    """
+    if metadata_cache is not None:
+        cached_metadata = metadata_cache.get(sheet_id)
+        if cached_metadata is not None:
+            return cached_metadata
+    spreadsheet_metadata = _execute(
+        sheet.get(  # type: ignore[attr-defined]
+            spreadsheetId=sheet_id,
+            fields="sheets.properties",  # Request only the properties of each sheet
+        ),
+        "sheets.spreadsheets.get",
+        _coalesce_key("sheets.spreadsheets.get", sheet_id),
+        file_id=sheet_id,
+    )
+    if metadata_cache is not None:
+        metadata_cache.set(sheet_id, spreadsheet_metadata)
+    return spreadsheet_metadata
+
+
+def _batch_fetch_data(
+    sheet: object, sheet_id: str, cell_ranges: List[str], **render_options: str
+) -> list:
+    """
+    Fetches several ranges of a spreadsheet with one `values().batchGet` call.
+
+    Args:
+        sheet (object): The Google Sheets API service object.
+        sheet_id (str): The ID of the spreadsheet.
+        cell_ranges (List[str]): The ranges of cells to fetch.
+        **render_options (str): valueRenderOption / dateTimeRenderOption / majorDimension
+            of the read.
+
+    Returns:
+        list: The fetched data of every range, in request order.
+    """
+    result = _execute(
+        sheet.values().batchGet(  # type: ignore[attr-defined]
+            spreadsheetId=sheet_id, ranges=cell_ranges, **render_options
+        ),
+        "sheets.values.batchGet",
+        _coalesce_key(
+            "sheets.values.batchGet", sheet_id, ",".join(cell_ranges), render_options
+        ),
+        file_id=sheet_id,
+        range=",".join(cell_ranges),
+    )
+    value_ranges = result.get("valueRanges", [])
+    return [
+        value_ranges[position].get("values", []) if position < len(value_ranges) else []
+        for position in range(len(cell_ranges))
+    ]
+
+
+def _estimate_cells(sheet_properties: dict) -> int:
+    """
+    Estimates the number of cells of a tab from its gridProperties (0 when unknown).
+    """
+    grid_properties = sheet_properties.get("gridProperties") or {}
+    return int(grid_properties.get("rowCount", 0)) * int(
+        grid_properties.get("columnCount", 0)
+    )
+
+
+def _chunk_ranges(
+    range_weights: Dict[str, int],
+    max_ranges: int,
+    max_weight: Optional[int],
+) -> Iterator[List[str]]:
+    """
+    Splits ranges into consecutive chunks bounded by count and by total weight.
+
+    A single range heavier than `max_weight` still gets a chunk of its own.
+    """
+    chunk: List[str] = []
+    chunk_weight = 0
+    for cell_range, weight in range_weights.items():
+        if chunk and (
+            len(chunk) >= max_ranges
+            or (max_weight is not None and chunk_weight + weight > max_weight)
+        ):
+            yield chunk
+            chunk, chunk_weight = [], 0
+        chunk.append(cell_range)
+        chunk_weight += weight
+    if chunk:
+        yield chunk
+
+
+def _resolve_sheet_properties(
+    spreadsheet_metadata: dict, selector: "SheetSelector"
+) -> Optional[dict]:
+    """
+    Resolves the sheet properties a selector points at, honouring its fallbacks.
+
+    Lookups go through the `SheetIndex` of the metadata, built once per payload.
+
+    Args:
+        spreadsheet_metadata (dict): The spreadsheet metadata.
+        selector (SheetSelector): The selection to resolve.
+
+    Returns:
+        Optional[dict]: The properties of the selected sheet, None if not found.
+    """
+    sheet_index = SheetIndex.of(spreadsheet_metadata)
+    found_sheet_properties = sheet_index.find(
+        SheetSelector.PROPERTY_KEYS[selector.by], selector.search_value
+    )
+    if found_sheet_properties or not selector.not_found_priority:
+        return found_sheet_properties
+    for (
+        fallback_search_key,
+        fallback_search_value,
+    ) in selector.not_found_priority.items():
+        if (
+            fallback_search_value is not None
+            and fallback_search_key in SheetSelector.PROPERTY_KEYS
+        ):
+            found_sheet_properties = sheet_index.find(
+                SheetSelector.PROPERTY_KEYS[fallback_search_key],
+                fallback_search_value,
+            )
+            if found_sheet_properties:
+                return found_sheet_properties
+    return None
+
+
+def _projected_ranges(
+    sheet: object,
+    file_id: str,
+    sheet_title: str,
+    columns: Sequence[str],
+    without_headers: bool,
+    last_row: Optional[int] = None,
+) -> List[str]:
+    """
+    Reads the header row and maps the requested header names to single-column ranges,
+    ending at `last_row` when set, open-ended otherwise.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If a requested column is not in the header.
+    """
+    header = (_fetch_data(sheet, file_id, cell_range=f"{sheet_title}!1:1") or [[]])[0]
+    positions: Dict[str, int] = {}
+    for position, name in enumerate(header, start=1):
+        positions.setdefault(str(name), position)
+    missing_columns = [name for name in columns if name not in positions]
+    if missing_columns:
+        raise Exceptions.GsheetToolsArgumentError(
+            "[columns]",
+            f"columns `{missing_columns}` are not in the header row of `{sheet_title}`.",
+        )
+    first_row = 2 if without_headers else 1
+    end_row = str(last_row) if last_row is not None else ""
+    return [
+        f"{sheet_title}!{letter}{first_row}:{letter}{end_row}"
+        for letter in (column_letter(positions[name]) for name in columns)
+    ]
+
+
+def _stitch_columns(column_values: List[List]) -> List[List]:
+    """
+    Turns columns read with majorDimension=COLUMNS back into rows shaped like a row read,
+    i.e. with trailing blank cells and rows trimmed.
+    """
+    rows: List[List] = []
+    for values in itertools.zip_longest(*column_values, fillvalue=""):
+        row = list(values)
+        while row and row[-1] == "":
+            row.pop()
+        rows.append(row)
+    while rows and not rows[-1]:
+        rows.pop()
+    return rows
+
+
+def _sheet_name_range(selector: "SheetSelector") -> str:
+    """
+    Range of the `sheet_name` fast path, read before any metadata is known: the whole
+    tab (from row 2 without headers, open-ended), or the custom range. The title is
+    quoted, a bare "Q1" would read cell Q1 of the first sheet instead of the tab.
+    """
+    sheet_title = quote_sheet_title(str(selector.sheet_name))
+    if selector.custom_tabular_range:
+        return selector.cell_range(sheet_title)
+    if selector.without_headers:
+        return f"{sheet_title}!A2:ZZZ"
+    return sheet_title
+
+
+def _read_ranges(
+    sheet: object,
+    file_id: str,
+    sheet_title: str,
+    cell_ranges: List[str],
+    typed: bool = False,
+    response_cache: Optional[ResponseCache] = None,
+    projected: bool = False,
+    major_dimension: str = "ROWS",
+) -> list:
+    """
+    Reads the data of a tab, from one range or, when `projected`, from single-column
+    ranges stitched back into rows (kept as columns with `major_dimension="COLUMNS"`).
+    Goes through the response cache when given.
+    """
+    cell_range = ",".join(cell_ranges)
+
+    def _read() -> list:
+        if not projected:
+            return _fetch_data(
+                sheet,
+                file_id,
+                cell_range=cell_range,
+                **_render_options(typed, major_dimension),
+            )
+        column_values = [
+            values[0] if values else []
+            for values in _batch_fetch_data(
+                sheet,
+                file_id,
+                cell_ranges,
+                **_render_options(typed, "COLUMNS"),
+            )
+        ]
+        if major_dimension == "COLUMNS":
+            return column_values
+        return _stitch_columns(column_values)
+
+    if response_cache is None:
+        return _read()
+    render_key = "typed" if typed else ""
+    if major_dimension == "COLUMNS":
+        render_key += ":columns"
+    cached_data, file_version = response_cache.get(
+        file_id, sheet_title, cell_range, render_key
+    )
+    if cached_data is not None:
+        return cached_data
+    sheet_data = _read()
+    response_cache.set(
+        file_id,
+        sheet_title,
+        cell_range,
+        sheet_data,
+        file_version,  # type: ignore[arg-type]
+        render_key,
+    )
+    return sheet_data
+
+
+def _get_selected_data(
+    sheet: object,
+    file_id: str,
+    selector: "SheetSelector",
+    metadata_cache: Optional[MetadataCache] = None,
+    typed: bool = False,
+    response_cache: Optional[ResponseCache] = None,
+    columns: Optional[Sequence[str]] = None,
+    major_dimension: str = "ROWS",
+) -> Tuple[str, List[Optional[List]]]:
+    """
+    Fetches the data of the sheet a selector points at, see `get_gsheet_data`.
+
+    With `by="sheet_name"` the named tab is read directly, skipping the metadata round
+    trip. The metadata is only fetched when the API does not know the tab (HTTP 400),
+    to apply the `not_found_priority` fallbacks, or when it is cached anyway. The title
+    returned by the fast path is `sheet_name` as given, the API matching tab names
+    case-insensitively.
+    """
+    if selector.by == "sheet_name" and metadata_cache is None and not columns:
+        sheet_title = str(selector.sheet_name)
+        try:
+            return sheet_title, _read_ranges(
+                sheet,
+                file_id,
+                sheet_title,
+                [_sheet_name_range(selector)],
+                typed,
+                response_cache,
+                major_dimension=major_dimension,
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if _http_status(e) != 400:
+                raise
+    # fetch metadata on google sheet
+    spreadsheet_metadata = _fetch_metadata(sheet, file_id, metadata_cache)
+    # check if any sheet exists
+    if "sheets" not in spreadsheet_metadata:
+        return "", []
+    found_sheet_properties = _resolve_sheet_properties(spreadsheet_metadata, selector)
+    if found_sheet_properties:
+        # properties found
+        sheet_title = found_sheet_properties.get("title")  # type: ignore[assignment]
+        if columns:
+            cell_ranges = _projected_ranges(
+                sheet,
+                file_id,
+                sheet_title,
+                columns,
+                selector.without_headers,
+            )
+        else:
+            cell_ranges = [selector.cell_range(sheet_title, found_sheet_properties)]
+        return sheet_title, _read_ranges(
+            sheet,
+            file_id,
+            sheet_title,
+            cell_ranges,
+            typed,
+            response_cache,
+            projected=bool(columns),
+            major_dimension=major_dimension,
+        )
+    # default return
+    return "", []
+
+
 def get_gid_sheets_data(
-    sheet: object, sheet_id: str, gid: Optional[str], without_headers: bool = False
+    sheet: object,
+    sheet_id: str,
+    gid: Optional[str],
+    without_headers: bool = False,
+    metadata_cache: Optional[MetadataCache] = None,
 ) -> Tuple[str, list]:
     """
     Fetches data for a specific sheet by its GID or the first sheet by default.
@@ -212,6 +837,7 @@ def get_gid_sheets_data(
         sheet_id (str): The ID of the spreadsheet.
         gid (Optional[str]): The GID of the sheet.
         without_headers (bool): Whether to exclude headers from the data.
+        metadata_cache (Optional[MetadataCache]): Cache for the spreadsheet metadata.
 
     Returns:
         Tuple[str, list]: The sheet title and its data.
@@ -225,28 +851,25 @@ def get_gid_sheets_data(
         PendingDeprecationWarning,
         stacklevel=2,
     )
-    spreadsheet_metadata = sheet.get(  # type: ignore[attr-defined]
-        spreadsheetId=sheet_id,
-        fields="sheets.properties",  # Request only the properties of each sheet
-    ).execute()
+    spreadsheet_metadata = _fetch_metadata(sheet, sheet_id, metadata_cache)
 
-    found_sheet_properties = None
     if "sheets" in spreadsheet_metadata:
 
         search_on_key, search_for_value = (
-            ("sheetId", str(gid)) if gid is not None else ("index", str(0))
+            ("sheetId", gid) if gid is not None else ("index", 0)
+        )
+        found_sheet_properties = SheetIndex.of(spreadsheet_metadata).find(
+            search_on_key, search_for_value
         )
-
-        for indivisual_sheet in spreadsheet_metadata["sheets"]:
-            if str(indivisual_sheet["properties"][search_on_key]) == search_for_value:
-                found_sheet_properties = indivisual_sheet["properties"]
-                break
         if not found_sheet_properties:
             raise Exception("sheet not found")
-        title: str = found_sheet_properties.get("title")
+        title: str = found_sheet_properties.get("title")  # type: ignore[assignment]
         _range = f"{title}"
         if without_headers:
-            _range = _range + "!" + "A2:z999999"
+            _range = (
+                plan_range(title, found_sheet_properties, first_row=2)
+                or _range + "!" + "A2:z999999"
+            )
         return title, _fetch_data(sheet, sheet_id, cell_range=_range)
     return "", []
 
@@ -259,8 +882,13 @@ def get_gsheet_data(
     sheet_name: Optional[str] = None,
     sheet_position: Optional[int] = None,
     without_headers: bool = False,
-    custom_tabular_range: Tuple[str, str] = ("A1", "z999999"),
+    custom_tabular_range: Optional[Tuple[str, str]] = None,
     not_found_priority: Optional[Dict[str, Any]] = None,
+    metadata_cache: Optional[MetadataCache] = None,
+    typed: bool = False,
+    response_cache: Optional[ResponseCache] = None,
+    columns: Optional[Sequence[str]] = None,
+    major_dimension: str = "ROWS",
 ) -> Tuple[str, List[Optional[List]]]:
     """
     Fetches data from a Google Sheet with various selection options.
@@ -273,120 +901,390 @@ def get_gsheet_data(
         sheet_name (Optional[str]): The name of the sheet (if by='sheet_name').
         sheet_position (Optional[int]): The position of the sheet (if by='sheet_position').
         without_headers (bool): Whether to exclude headers from the data.
-        custom_tabular_range (Tuple[str, str]): The custom range of cells to fetch.
+        custom_tabular_range (Optional[Tuple[str, str]]): The custom range of cells to
+            fetch. By default the range covers the sheet's grid (gridProperties), so
+            columns beyond Z are read and no oversized rectangle is requested.
         not_found_priority (Optional[List]): Priority list for fallback options.
+        metadata_cache (Optional[MetadataCache]): Cache for the spreadsheet metadata,
+            avoids a metadata round trip per call when reading many tabs of one file.
+        typed (bool): Read unformatted values (numbers, booleans, dates as serial
+            numbers) instead of display strings, see `prepare_dataframe(schema=...)`.
+        response_cache (Optional[ResponseCache]): Persistent cache of the fetched data,
+            served as long as the Drive file version is unchanged.
+        columns (Optional[Sequence[str]]): Header names of the columns to read. The
+            header row is read first, then only those columns are fetched with one
+            `batchGet` and stitched back into rows, in the requested order.
+        major_dimension (str): 'ROWS' for a list of rows, 'COLUMNS' for a list of
+            columns (header first), to pass to
+            `prepare_dataframe(major_dimension="COLUMNS")` without any transpose.
 
     Returns:
         List[List]: The fetched data.
 
     Raises:
-        Exceptions.GsheetToolsArgumentError: If invalid arguments are passed.
+        Exceptions.GsheetToolsArgumentError: If invalid arguments are passed, or if a
+            requested column is not in the header row.
 
     Warning:
         * without_headers parameter won't take effect when custom_tabular_range is set .
         * within not_found_priority values , every value is coerced to string .
+        * with by='sheet_name', the tab is looked up case-insensitively by the API .
     """
 
-    __by__ = {"gid", "sheet_name", "sheet_position"}
-    if by not in __by__:
+    selector = SheetSelector(
+        by=by,
+        gid=gid,
+        sheet_name=sheet_name,
+        sheet_position=sheet_position,
+        without_headers=without_headers,
+        custom_tabular_range=custom_tabular_range,
+        not_found_priority=not_found_priority,
+    )
+    if columns is not None and custom_tabular_range:
         raise Exceptions.GsheetToolsArgumentError(
-            "[by]",
-            f"value `{by=}` is invalid, should be any one of `{','.join(__by__)}`.",
+            "[columns,custom_tabular_range]",
+            "`columns` cannot be combined with `custom_tabular_range`.",
         )
-    if by == "gid" and gid is None:
+    _validate_major_dimension(major_dimension)
+    return _get_selected_data(
+        sheet,
+        file_id,
+        selector,
+        metadata_cache,
+        typed,
+        response_cache,
+        columns,
+        major_dimension,
+    )
+
+
+def get_gsheet_data_many(
+    sheet: object,
+    file_id: str,
+    selectors: List[Union[SheetSelector, Dict[str, Any]]],
+    metadata_cache: Optional[MetadataCache] = None,
+    max_ranges_per_request: int = 100,
+    max_cells_per_request: Optional[int] = 5_000_000,
+    typed: bool = False,
+) -> List[Tuple[str, List[Optional[List]]]]:
+    """
+    Fetches several tabs of one Google Sheet with a single metadata call and batched reads.
+
+    Every selector is resolved (including its `not_found_priority` fallbacks) against
+    the same metadata response, and all resulting ranges are read through
+    `values().batchGet`. The ranges are split over several batchGet calls when there
+    are more than `max_ranges_per_request` of them, or when the estimated number of
+    cells (from each tab's gridProperties) exceeds `max_cells_per_request`.
+
+    Args:
+        sheet (object): The Google Sheets API service object.
+        file_id (str): The ID of the spreadsheet.
+        selectors (List[Union[SheetSelector, Dict[str, Any]]]): The tabs to fetch, either
+            as SheetSelector or as a dict of `get_gsheet_data` selection arguments.
+        metadata_cache (Optional[MetadataCache]): Cache for the spreadsheet metadata.
+        max_ranges_per_request (int): Maximum number of ranges per batchGet call.
+        max_cells_per_request (Optional[int]): Estimated cell budget per batchGet call,
+            `None` disables the cell based split.
+        typed (bool): Read unformatted values instead of display strings.
+
+    Returns:
+        List[Tuple[str, List]]: The sheet title and data for every selector, in selector
+            order. Selectors that match no sheet yield `("", [])`.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If invalid arguments are passed.
+    """
+    if max_ranges_per_request <= 0:
         raise Exceptions.GsheetToolsArgumentError(
-            "[by,gid]", f"with `{by=}` you cannot pass `{gid=}`."
+            "[max_ranges_per_request]",
+            f"value `{max_ranges_per_request=}` is invalid, should be positive.",
         )
-    if by == "sheet_name" and sheet_name is None:
-        raise Exceptions.GsheetToolsArgumentError(
-            "[by,sheet_name]", f"with `{by=}` you cannot pass `{sheet_name=}`."
+    sheet_selectors: List[SheetSelector] = [
+        (selector if isinstance(selector, SheetSelector) else SheetSelector(**selector))
+        for selector in selectors
+    ]
+    if not sheet_selectors:
+        return []
+    spreadsheet_metadata = _fetch_metadata(sheet, file_id, metadata_cache)
+    if "sheets" not in spreadsheet_metadata:
+        return [("", []) for _ in sheet_selectors]
+
+    # resolve every selector, de-duplicating identical ranges
+    resolved: List[Optional[Tuple[str, str]]] = []
+    range_weights: Dict[str, int] = {}
+    for selector in sheet_selectors:
+        found_sheet_properties = _resolve_sheet_properties(
+            spreadsheet_metadata, selector
         )
-    if by == "sheet_position" and sheet_position is None:
-        raise Exceptions.GsheetToolsArgumentError(
-            "[by,sheet_position]", f"with `{by=}` you cannot pass `{sheet_position=}`."
+        if not found_sheet_properties:
+            resolved.append(None)
+            continue
+        sheet_title = found_sheet_properties.get("title")
+        cell_range = selector.cell_range(
+            sheet_title, found_sheet_properties  # type: ignore[arg-type]
         )
-    if not_found_priority and not all([v in __by__ for v in not_found_priority]):
-        raise Exceptions.GsheetToolsArgumentError(
-            "[not_found_priority]",
-            f"not_found_priority should be any of `{','.join(__by__)}`.",
+        resolved.append((sheet_title, cell_range))  # type: ignore[arg-type]
+        range_weights.setdefault(cell_range, _estimate_cells(found_sheet_properties))
+
+    fetched = _batch_read(
+        sheet,
+        file_id,
+        range_weights,
+        max_ranges_per_request,
+        max_cells_per_request,
+        typed,
+    )
+    return [(entry[0], fetched[entry[1]]) if entry else ("", []) for entry in resolved]
+
+
+def _batch_read(
+    sheet: object,
+    file_id: str,
+    range_weights: Dict[str, int],
+    max_ranges_per_request: int,
+    max_cells_per_request: Optional[int],
+    typed: bool = False,
+) -> Dict[str, list]:
+    """
+    Reads ranges with as few `values().batchGet` calls as the limits allow, see
+    `_chunk_ranges`.
+
+    Returns:
+        Dict[str, list]: The data of every range.
+    """
+    fetched: Dict[str, list] = {}
+    for ranges in _chunk_ranges(
+        range_weights, max_ranges_per_request, max_cells_per_request
+    ):
+        fetched.update(
+            zip(
+                ranges,
+                _batch_fetch_data(sheet, file_id, ranges, **_render_options(typed)),
+            )
         )
-    # fetch metadata on google sheet
-    spreadsheet_metadata = sheet.get(  # type: ignore[attr-defined]
-        spreadsheetId=file_id,
-        fields="sheets.properties",  # Request only the properties of each sheet
-    ).execute()
-    # check if any sheet exists
-    if "sheets" not in spreadsheet_metadata:
-        return "", []
+    return fetched
 
-    translation_map: Dict[str, Tuple[str, Any]] = {
-        "gid": ("sheetId", gid),
-        "sheet_name": ("title", sheet_name),
-        "sheet_position": ("index", sheet_position),
-    }
-    try:
-        search_on_key, search_for_value = translation_map[by]
-    except KeyError as e:
-        raise Exception(f"value not supported yet. {e}")
-
-    def _find(
-        indivisual_sheet_properties: list, search_on_key: str, search_for_value: str
-    ) -> Optional[dict]:
-        """[Nested]"""
-        found_sheet_properties = None
-        for indivisual_sheet in indivisual_sheet_properties:
-            if str(indivisual_sheet["properties"][search_on_key]) == search_for_value:
-                found_sheet_properties = indivisual_sheet["properties"]
+
+def get_workbook_dataframes(
+    sheet: object,
+    file_id: str,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    metadata_cache: Optional[MetadataCache] = None,
+    typed: bool = False,
+    infer_dtypes: bool = False,
+    dtype_backend: str = "numpy",
+    max_workers: int = 4,
+    max_ranges_per_request: int = 100,
+    max_cells_per_request: Optional[int] = 5_000_000,
+) -> Dict[str, "pd.DataFrame"]:
+    """
+    Reads every tab of a Google Sheet into a DataFrame, keyed by snake_case title.
+
+    The workbook metadata is fetched once, the tabs are read with batched
+    `values().batchGet` calls (split as in `get_gsheet_data_many`), and the DataFrames
+    are built in parallel on a thread pool.
+
+    Args:
+        sheet (object): The Google Sheets API service object.
+        file_id (str): The ID of the spreadsheet.
+        include (Optional[Sequence[str]]): Glob patterns (e.g. 'Sales *'), only tabs
+            whose title matches one of them are read. All tabs when None.
+        exclude (Optional[Sequence[str]]): Glob patterns of tab titles to skip, applied
+            after `include`.
+        metadata_cache (Optional[MetadataCache]): Cache for the spreadsheet metadata.
+        typed (bool): Read unformatted values instead of display strings.
+        infer_dtypes (bool): Give columns a native dtype when their values allow it,
+            see `prepare_dataframe`.
+        dtype_backend (str): 'numpy' or 'pyarrow', see `prepare_dataframe`.
+        max_workers (int): Number of threads building the DataFrames.
+        max_ranges_per_request (int): Maximum number of ranges per batchGet call.
+        max_cells_per_request (Optional[int]): Estimated cell budget per batchGet call,
+            `None` disables the cell based split.
+
+    Returns:
+        Dict[str, pd.DataFrame]: The DataFrame of every selected tab, in workbook order,
+            keyed by `NameFormatter.to_snake_case(title)`. Titles sharing a key get a
+            `_2`, `_3`... suffix. Empty tabs give an empty DataFrame.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If invalid arguments are passed.
+        Exceptions.GoogleSpreadsheetProcessingError: If a tab has a blank header cell.
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    for name, value in (
+        ("max_workers", max_workers),
+        ("max_ranges_per_request", max_ranges_per_request),
+    ):
+        if value <= 0:
+            raise Exceptions.GsheetToolsArgumentError(
+                f"[{name}]", f"value `{name}={value!r}` is invalid, should be positive."
+            )
+    spreadsheet_metadata = _fetch_metadata(sheet, file_id, metadata_cache)
+    selected: Dict[str, Tuple[str, str]] = {}  # key -> (title, cell range)
+    range_weights: Dict[str, int] = {}
+    for sheet_properties in SheetIndex.of(spreadsheet_metadata).sheets:
+        title = str(sheet_properties.get("title", ""))
+        if include is not None and not any(
+            fnmatch.fnmatchcase(title, pattern) for pattern in include
+        ):
+            continue
+        if exclude and any(fnmatch.fnmatchcase(title, pattern) for pattern in exclude):
+            continue
+        key = base_key = NameFormatter.to_snake_case(title)
+        for suffix in itertools.count(2):
+            if key not in selected:
                 break
-        return found_sheet_properties
+            key = f"{base_key}_{suffix}"
+        cell_range = SheetSelector(by="sheet_name", sheet_name=title).cell_range(
+            title, sheet_properties
+        )
+        selected[key] = (title, cell_range)
+        range_weights.setdefault(cell_range, _estimate_cells(sheet_properties))
+    if not selected:
+        return {}
+    fetched = _batch_read(
+        sheet,
+        file_id,
+        range_weights,
+        max_ranges_per_request,
+        max_cells_per_request,
+        typed,
+    )
 
-    def _fallback_safe_find_proprties(spreadsheet_metadata: dict) -> Optional[dict]:
-        """[Nested]"""
-        found_sheet_properties = _find(
-            spreadsheet_metadata["sheets"], search_on_key, search_for_value
+    def _build(cell_range: str) -> "pd.DataFrame":
+        if not any(fetched[cell_range]):
+            return pd.DataFrame()
+        return prepare_dataframe(
+            fetched[cell_range], infer_dtypes=infer_dtypes, dtype_backend=dtype_backend
         )
-        if found_sheet_properties or not not_found_priority:
-            return found_sheet_properties
-        for (
-            first_fallback_search_key,
-            first_fallback_search_value,
-        ) in not_found_priority.items():
-            if (
-                first_fallback_search_value is not None
-                and first_fallback_search_key in translation_map
-            ):
-                first_fallback_search_key_translated, _ = translation_map[
-                    first_fallback_search_key
-                ]
-                found_sheet_properties = _find(
-                    spreadsheet_metadata["sheets"],
-                    first_fallback_search_key_translated,
-                    first_fallback_search_value,
-                )
-                if found_sheet_properties:
-                    return found_sheet_properties
-        return None
 
-    found_sheet_properties = _fallback_safe_find_proprties(spreadsheet_metadata)
-    sheet_title: str = ""
-    sheet_data: list = []
-    if found_sheet_properties:
-        # properties found
-        sheet_title = found_sheet_properties.get("title")  # type: ignore[assignment]
-        _range = f"{sheet_title}"
-        if custom_tabular_range:
-            _range = _range + "!" + ":".join(custom_tabular_range)
-        else:
-            if without_headers:
-                _range = _range + "!" + "A2:z999999"
-        return sheet_title, _fetch_data(sheet, file_id, cell_range=_range)
-    # default return
-    return sheet_title, sheet_data
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(selected)), thread_name_prefix="gsheet-tools"
+    ) as executor:
+        dataframes = executor.map(_build, [entry[1] for entry in selected.values()])
+        return dict(zip(selected, dataframes))
+
+
+def _iter_row_windows(
+    sheet: object,
+    file_id: str,
+    sheet_title: str,
+    columns: Tuple[str, str],
+    first_row: int,
+    chunk_size: int,
+    typed: bool = False,
+) -> Iterator[List[List]]:
+    """
+    Reads a sheet window by window, see `iter_gsheet_data`.
+
+    Empty rows trailing a window are trimmed by the API, they are re-inserted in
+    front of the next non-empty window so the concatenated blocks match a single read.
+    """
+    pending_blank_rows = 0
+    start_row = first_row
+    while True:
+        end_row = start_row + chunk_size - 1
+        rows = _fetch_data(
+            sheet,
+            file_id,
+            cell_range=f"{sheet_title}!{columns[0]}{start_row}:{columns[1]}{end_row}",
+            **_render_options(typed),
+        )
+        if not rows:
+            return
+        fetched_rows = len(rows)
+        if pending_blank_rows:
+            # not in place: a coalesced response is shared with other callers
+            rows = [[] for _ in range(pending_blank_rows)] + rows
+        pending_blank_rows = end_row - start_row + 1 - fetched_rows
+        yield rows
+        start_row = end_row + 1
+
+
+def iter_gsheet_data(
+    sheet: object,
+    file_id: str,
+    by: str = "all",
+    gid: Optional[str] = None,
+    sheet_name: Optional[str] = None,
+    sheet_position: Optional[int] = None,
+    without_headers: bool = False,
+    not_found_priority: Optional[Dict[str, Any]] = None,
+    chunk_size: int = 5000,
+    columns: Optional[Tuple[str, str]] = None,
+    metadata_cache: Optional[MetadataCache] = None,
+    typed: bool = False,
+) -> Tuple[str, Iterator[List[List]]]:
+    """
+    Streams data from a Google Sheet in blocks of rows, keeping memory bounded.
+
+    The sheet is resolved eagerly (same selection semantics as `get_gsheet_data`),
+    the rows are then read lazily in windows of `chunk_size` rows, e.g. `A1:Z5000`
+    then `A5001:Z10000`. Windows span every column of the grid's `columnCount`
+    (A:Z when the metadata does not report it). Reading stops at the first empty window.
+
+    Args:
+        sheet (object): The Google Sheets API service object.
+        file_id (str): The ID of the spreadsheet.
+        by (str): The selection method ('gid', 'sheet_name' or 'sheet_position').
+        gid (Optional[str]): The GID of the sheet (if by='gid').
+        sheet_name (Optional[str]): The name of the sheet (if by='sheet_name').
+        sheet_position (Optional[int]): The position of the sheet (if by='sheet_position').
+        without_headers (bool): Whether to skip the first row of the sheet.
+        not_found_priority (Optional[Dict[str, Any]]): Priority list for fallback options.
+        chunk_size (int): Number of rows read per API call.
+        columns (Optional[Tuple[str, str]]): First and last column letter of every
+            window, planned from the grid when None.
+        metadata_cache (Optional[MetadataCache]): Cache for the spreadsheet metadata.
+        typed (bool): Read unformatted values instead of display strings.
+
+    Returns:
+        Tuple[str, Iterator[List[List]]]: The sheet title and an iterator over row
+            blocks. Both are empty when no sheet matches.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If invalid arguments are passed.
+    """
+    if chunk_size <= 0:
+        raise Exceptions.GsheetToolsArgumentError(
+            "[chunk_size]", f"value `{chunk_size=}` is invalid, should be positive."
+        )
+    selector = SheetSelector(
+        by=by,
+        gid=gid,
+        sheet_name=sheet_name,
+        sheet_position=sheet_position,
+        without_headers=without_headers,
+        custom_tabular_range=None,
+        not_found_priority=not_found_priority,
+    )
+    spreadsheet_metadata = _fetch_metadata(sheet, file_id, metadata_cache)
+    if "sheets" not in spreadsheet_metadata:
+        return "", iter(())
+    found_sheet_properties = _resolve_sheet_properties(spreadsheet_metadata, selector)
+    if not found_sheet_properties:
+        return "", iter(())
+    sheet_title: str = found_sheet_properties.get("title")  # type: ignore[assignment]
+    grid_properties = found_sheet_properties.get("gridProperties") or {}
+    if columns is None:
+        column_count = int(grid_properties.get("columnCount") or 0)
+        columns = ("A", column_letter(column_count) if column_count > 0 else "Z")
+    return sheet_title, _iter_row_windows(
+        sheet,
+        file_id,
+        sheet_title,
+        columns=columns,
+        first_row=2 if without_headers else 1,
+        chunk_size=chunk_size,
+        typed=typed,
+    )
 
 
 def check_sheet_origin(
     google_drive_service: object, file_id: str
-) -> Tuple[str, NamedTuple]:
+) -> Tuple[str, OriginDetails]:
     """
     Determines the origin and MIME type of a Google Sheet file.
 
@@ -395,36 +1293,34 @@ def check_sheet_origin(
         file_id (str): The ID of the file.
 
     Returns:
-        Tuple[str, NamedTuple]: The origin and details of the file.
+        Tuple[str, OriginDetails]: The origin and details of the file.
     """
 
-    file_metadata = (
-        google_drive_service.files()  # type: ignore[attr-defined]
-        .get(fileId=file_id, fields="mimeType,originalFilename")
-        .execute()
+    file_metadata = _execute(
+        google_drive_service.files().get(  # type: ignore[attr-defined]
+            fileId=file_id, fields="mimeType,originalFilename"
+        ),
+        "drive.files.get",
+        _coalesce_key("drive.files.get", file_id),
+        file_id=file_id,
     )
+    return _classify_origin(file_metadata)
+
+
+def _classify_origin(file_metadata: dict) -> Tuple[str, OriginDetails]:
+    """
+    Classifies a Drive file resource holding `mimeType` and `originalFilename`.
 
+    Args:
+        file_metadata (dict): The Drive file metadata.
+
+    Returns:
+        Tuple[str, OriginDetails]: The origin and details of the file.
+    """
     mime_type = file_metadata.get("mimeType")
     original_filename = file_metadata.get(
         "originalFilename"
     )  # May not always be present or reliable for conversion history
-    OriginDetails: namedtuple = namedtuple(  # type: ignore[misc]
-        "OriginDetails",
-        field_names=(
-            "is_parsable",
-            "mimetype",
-            "original_extension",
-            "original_filename",
-        ),
-        defaults=[None],
-    )
-    OriginDetails.__annotations__ = {
-        "is_parsable": bool,
-        "mimetype": str,
-        "original_extension": str,
-        "original_filename": str,
-    }
-
     origin: str = SheetOrigins.UNDEFINED.value
     is_parsable = True
     original_extension = None
@@ -461,7 +1357,7 @@ def check_sheet_origin(
         else:
             # un-identified format & unsupported
             original_extension = "unidentified"
-    return origin, OriginDetails(  # type: ignore[call-arg]
+    return origin, OriginDetails(
         is_parsable=is_parsable,
         mimetype=mime_type,
         original_extension=original_extension,
@@ -492,28 +1388,380 @@ def is_valid_google_url(url: str) -> bool:
         return False
 
 
-def prepare_dataframe(spreadsheet_data: List[List[Any]]) -> pd.DataFrame:
+def prepare_dataframe(
+    spreadsheet_data: List[List[Any]],
+    schema: Optional[Dict[str, str]] = None,
+    infer_dtypes: bool = False,
+    dtype_backend: str = "numpy",
+    major_dimension: str = "ROWS",
+) -> "pd.DataFrame":
     """
     Converts Google Sheets data into a pandas DataFrame.
 
     Args:
-        spreadsheet_data (List[List[Any]]): The data from the spreadsheet.
+        spreadsheet_data (List[List[Any]]): The data from the spreadsheet, as rows or,
+            with `major_dimension="COLUMNS"`, as columns.
+        schema (Optional[Dict[str, str]]): Column name to dtype, any of 'int', 'float',
+            'bool', 'datetime' or 'string'. Blank cells become missing values.
+        infer_dtypes (bool): Whether to give columns missing from `schema` a native
+            int/float/bool dtype when all their values allow it.
+        dtype_backend (str): 'numpy' for the default pandas dtypes, 'pyarrow' for
+            `ArrowDtype` columns built from `prepare_arrow_table` (requires pyarrow).
+        major_dimension (str): 'COLUMNS' for data read with
+            `get_gsheet_data(major_dimension="COLUMNS")`: every column is padded and
+            typed on its own and handed to pandas as is, without transposing rows.
 
     Returns:
         pd.DataFrame: The resulting DataFrame.
 
     Raises:
-        Exceptions.GoogleSpreadsheetProcessingError: If the data is invalid or empty.
+        Exceptions.GoogleSpreadsheetProcessingError: If the data is invalid or empty,
+            or if a column cannot be converted to its schema dtype.
+        Exceptions.GsheetToolsArgumentError: If the schema is invalid.
+
+    Notes:
+        Typed columns are meant for data read with `get_gsheet_data(typed=True)`, which
+        returns raw numbers and booleans, and dates as serial numbers (days since
+        1899-12-30) that the 'datetime' dtype converts. Dates cannot be told apart from
+        numbers, so they are never inferred and must be declared in `schema`.
+    """
+
+    if dtype_backend not in ("numpy", "pyarrow"):
+        raise Exceptions.GsheetToolsArgumentError(
+            "[dtype_backend]",
+            f"value `{dtype_backend=}` is invalid, should be any one of `numpy,pyarrow`.",
+        )
+    _validate_major_dimension(major_dimension)
+    instrumentation = get_instrumentation()
+    if not instrumentation.enabled:
+        return _build_dataframe(
+            spreadsheet_data, schema, infer_dtypes, dtype_backend, major_dimension
+        )
+    with instrumentation.span(
+        "prepare_dataframe",
+        rows=(
+            len(spreadsheet_data)
+            if major_dimension == "ROWS"
+            else max(map(len, spreadsheet_data), default=0)
+        ),
+        dtype_backend=dtype_backend,
+        major_dimension=major_dimension,
+    ) as span:
+        spreadsheet_dataframe = _build_dataframe(
+            spreadsheet_data, schema, infer_dtypes, dtype_backend, major_dimension
+        )
+        span.set(
+            columns=spreadsheet_dataframe.shape[1], cells=spreadsheet_dataframe.size
+        )
+    return spreadsheet_dataframe
+
+
+def _build_dataframe(
+    spreadsheet_data: List[List[Any]],
+    schema: Optional[Dict[str, str]],
+    infer_dtypes: bool,
+    dtype_backend: str,
+    major_dimension: str = "ROWS",
+) -> "pd.DataFrame":
+    """
+    Builds the DataFrame of `prepare_dataframe`.
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    if dtype_backend == "pyarrow":
+        return prepare_arrow_table(
+            spreadsheet_data,
+            schema=schema,
+            infer_dtypes=infer_dtypes,
+            major_dimension=major_dimension,
+        ).to_pandas(types_mapper=pd.ArrowDtype)
+    column_names, columns = _tabulate(spreadsheet_data, schema, major_dimension)
+    if columns is None:
+        return pd.DataFrame(columns=column_names)
+    if schema or infer_dtypes:
+        columns = _typed_columns(column_names, columns, schema or {}, infer_dtypes)
+    spreadsheet_dataframe = pd.DataFrame(dict(enumerate(columns)), copy=False)
+    spreadsheet_dataframe.columns = column_names  # may hold duplicated names
+    return spreadsheet_dataframe
+
+
+def prepare_arrow_table(
+    spreadsheet_data: List[List[Any]],
+    schema: Optional[Dict[str, str]] = None,
+    infer_dtypes: bool = False,
+    major_dimension: str = "ROWS",
+) -> Any:
     """
+    Converts Google Sheets data into a `pyarrow.Table`.
+
+    Text columns are stored as Arrow strings instead of Python objects, which takes a
+    fraction of the memory of an object-dtype DataFrame and can be written to Parquet
+    or handed to Arrow consumers without conversion. Requires the optional `pyarrow`
+    dependency (`pip install gsheet_tools[arrow]`).
+
+    Args:
+        spreadsheet_data (List[List[Any]]): The data from the spreadsheet.
+        schema (Optional[Dict[str, str]]): Column name to dtype, see `prepare_dataframe`.
+        infer_dtypes (bool): Whether to infer int/float/bool columns missing from `schema`.
+        major_dimension (str): 'ROWS' or 'COLUMNS', see `prepare_dataframe`.
+
+    Returns:
+        pyarrow.Table: The resulting table.
 
+    Raises:
+        ImportError: If pyarrow is not installed.
+        Exceptions.GoogleSpreadsheetProcessingError: If the data is invalid or empty,
+            or if a column cannot be converted to its schema dtype.
+        Exceptions.GsheetToolsArgumentError: If the schema is invalid.
+    """
+    try:
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Arrow output, "
+            "install it with `pip install gsheet_tools[arrow]`."
+        ) from e
+    _validate_major_dimension(major_dimension)
+    column_names, columns = _tabulate(spreadsheet_data, schema, major_dimension)
+    if columns is None:
+        return pa.Table.from_arrays(
+            [pa.array([], type=pa.string()) for _ in column_names],
+            names=column_names,
+        )
+    if schema or infer_dtypes:
+        columns = _typed_columns(column_names, columns, schema or {}, infer_dtypes)
+    arrays = []
+    for values in columns:
+        if not isinstance(values, tuple):  # typed columns are pandas Series
+            arrays.append(pa.Array.from_pandas(values))
+            continue
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # mixed cell types (typed reads), kept as text like the sheet shows them
+            arrays.append(pa.array([str(value) for value in values]))
+    return pa.Table.from_arrays(arrays, names=column_names)
+
+
+def _tabulate(
+    spreadsheet_data: List[List[Any]],
+    schema: Optional[Dict[str, str]],
+    major_dimension: str = "ROWS",
+) -> Tuple[List[str], Optional[List[Any]]]:
+    """
+    Splits Google Sheets data into its header and its padded columns.
+
+    Args:
+        spreadsheet_data (List[List[Any]]): The data from the spreadsheet.
+        schema (Optional[Dict[str, str]]): The schema to validate against the header.
+        major_dimension (str): Whether `spreadsheet_data` holds rows or columns.
+
+    Returns:
+        Tuple[List[str], Optional[List[Any]]]: The column names and the columns, None
+            when the sheet only has a header.
+
+    Raises:
+        Exceptions.GoogleSpreadsheetProcessingError: If the data is invalid or empty.
+        Exceptions.GsheetToolsArgumentError: If the schema is invalid.
+    """
+    if major_dimension == "COLUMNS":
+        return _tabulate_columns(spreadsheet_data, schema)
     spreadsheet_data = list(filter(None, spreadsheet_data))  # remove empty rows .
     if not spreadsheet_data:
         raise Exceptions.GoogleSpreadsheetProcessingError("GSHEET.PROCESSING.BLANK01")
     column_names: List[str] = spreadsheet_data[0]
     if "" in column_names:
         raise Exceptions.GoogleSpreadsheetProcessingError("GSHEET.PROCESSING.BLANK02")
-    padded_spreadsheet_data: List[List[Any]] = [
-        arr + [""] * (len(column_names) - len(arr)) for arr in spreadsheet_data[1:]
+    _validate_schema(schema, column_names)
+    if len(spreadsheet_data) == 1:
+        return column_names, None
+    # ragged rows are padded while being transposed into columns, so no padded copy
+    # of the rows is built and pandas receives the data column-wise .
+    return column_names, _padded_columns(
+        itertools.islice(spreadsheet_data, 1, None),
+        row_count=len(spreadsheet_data) - 1,
+        width=len(column_names),
+    )
+
+
+def _tabulate_columns(
+    column_data: List[List[Any]], schema: Optional[Dict[str, str]]
+) -> Tuple[List[str], Optional[List[Any]]]:
+    """
+    Column-major counterpart of `_tabulate`: every column is padded to the height of
+    the tallest one, and the rows blank in every column are dropped, as empty rows are
+    in a row read, so both reads of a sheet give the same table.
+    """
+    column_data = list(column_data)
+    while column_data and not column_data[-1]:
+        column_data.pop()  # blank trailing columns, not returned by the API either
+    row_count = max(map(len, column_data), default=0)
+    blank_rows = _blank_rows(column_data, row_count)
+    if len(blank_rows) == row_count:
+        raise Exceptions.GoogleSpreadsheetProcessingError("GSHEET.PROCESSING.BLANK01")
+    columns: List[Sequence[Any]] = [
+        tuple(values) + ("",) * (row_count - len(values)) for values in column_data
     ]
-    spreadsheet_dataframe = pd.DataFrame(padded_spreadsheet_data, columns=column_names)
-    return spreadsheet_dataframe
+    if blank_rows:
+        blank = set(blank_rows)
+        kept = [position not in blank for position in range(row_count)]
+        columns = [tuple(itertools.compress(values, kept)) for values in columns]
+    column_names: List[str] = [values[0] for values in columns]
+    if "" in column_names:
+        raise Exceptions.GoogleSpreadsheetProcessingError("GSHEET.PROCESSING.BLANK02")
+    _validate_schema(schema, column_names)
+    if len(columns[0]) == 1:
+        return column_names, None
+    return column_names, [values[1:] for values in columns]
+
+
+def _blank_rows(column_data: List[List[Any]], row_count: int) -> List[int]:
+    """
+    Positions of the rows blank in every column. Each column only narrows down the
+    candidates left by the previous ones, so usually few cells are looked at.
+    """
+    candidates: Iterable[int] = range(row_count)
+    for values in column_data:
+        candidates = [
+            position
+            for position in candidates
+            if position >= len(values) or values[position] == ""
+        ]
+        if not candidates:
+            break
+    return list(candidates)
+
+
+# dtypes accepted by `prepare_dataframe(schema=...)`
+_SCHEMA_DTYPES = ("int", "float", "bool", "datetime", "string")
+# day zero of Google Sheets date serial numbers
+_SERIAL_NUMBER_EPOCH = "1899-12-30"
+
+
+def _validate_schema(schema: Optional[Dict[str, str]], column_names: List[str]) -> None:
+    """
+    Checks that a schema only names existing columns and supported dtypes.
+    """
+    for column_name, dtype in (schema or {}).items():
+        if column_name not in column_names:
+            raise Exceptions.GsheetToolsArgumentError(
+                "[schema]", f"column `{column_name}` is not in the sheet header."
+            )
+        if dtype not in _SCHEMA_DTYPES:
+            raise Exceptions.GsheetToolsArgumentError(
+                "[schema]",
+                f"dtype `{dtype}` of `{column_name}` should be any of "
+                f"`{','.join(_SCHEMA_DTYPES)}`.",
+            )
+
+
+def _typed_columns(
+    column_names: List[str],
+    columns: List[Sequence[Any]],
+    schema: Dict[str, str],
+    infer_dtypes: bool,
+) -> List[Any]:
+    """
+    Converts the columns declared in `schema` (or inferred) to their native dtypes.
+    """
+    typed_columns: List[Any] = []
+    for column_name, values in zip(column_names, columns):
+        dtype = schema.get(column_name)
+        if dtype is None and infer_dtypes:
+            dtype = _infer_dtype(values)
+        typed_columns.append(
+            values if dtype is None else _convert_column(column_name, values, dtype)
+        )
+    return typed_columns
+
+
+def _infer_dtype(values: Sequence[Any]) -> Optional[str]:
+    """
+    Infers 'bool', 'int' or 'float' from the non blank values, None otherwise.
+    """
+    kinds = set()
+    for value in values:
+        if isinstance(value, bool):
+            kinds.add("bool")
+        elif isinstance(value, int):
+            kinds.add("int")
+        elif isinstance(value, float):
+            kinds.add("float")
+        elif value != "":
+            return None
+    if not kinds or ("bool" in kinds and len(kinds) > 1):
+        return None
+    if len(kinds) == 1:
+        return kinds.pop()
+    return "float"
+
+
+def _convert_column(column_name: str, values: Sequence[Any], dtype: str) -> Any:
+    """
+    Converts a column to a native dtype, blank cells becoming missing values.
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    cells = pd.Series(
+        [None if value == "" else value for value in values], dtype=object
+    )
+    has_missing = bool(cells.isna().any())
+    try:
+        if dtype == "int":
+            numbers = pd.to_numeric(cells)
+            # astype("int64") would truncate 1.5 silently, where "Int64" raises
+            if not (numbers.dropna() % 1 == 0).all():
+                raise ValueError(f"non integer values in {column_name}")
+            return numbers.astype("Int64" if has_missing else "int64")
+        if dtype == "float":
+            return pd.to_numeric(cells).astype("float64")
+        if dtype == "bool":
+            flags = cells.map(
+                lambda value: (
+                    {"TRUE": True, "FALSE": False}.get(value.upper(), value)
+                    if isinstance(value, str)
+                    else value
+                )
+            )
+            if not all(isinstance(flag, bool) for flag in flags.dropna().tolist()):
+                raise ValueError(f"non boolean values in {column_name}")
+            return flags.astype("boolean" if has_missing else "bool")
+        if dtype == "datetime":
+            if all(
+                isinstance(value, (int, float)) for value in cells.dropna().tolist()
+            ):
+                return pd.to_datetime(
+                    cells.astype("float64"), unit="D", origin=_SERIAL_NUMBER_EPOCH
+                )
+            return pd.to_datetime(cells)
+        return cells.astype("string")
+    except (TypeError, ValueError) as e:
+        raise Exceptions.GoogleSpreadsheetProcessingError(
+            "GSHEET.PROCESSING.DTYPE01", column_name, dtype
+        ) from e
+
+
+def _padded_columns(
+    rows: Iterable[Sequence[Any]], row_count: int, width: int
+) -> List[Sequence[Any]]:
+    """
+    Transposes ragged rows into `width` columns, padding short rows with "".
+
+    Args:
+        rows (Iterable[Sequence[Any]]): The rows to transpose.
+        row_count (int): The number of rows.
+        width (int): The number of columns to build.
+
+    Returns:
+        List[Sequence[Any]]: The columns, each holding `row_count` values.
+
+    Raises:
+        ValueError: If a row has more values than `width`.
+    """
+    columns: List[Sequence[Any]] = list(itertools.zip_longest(*rows, fillvalue=""))
+    if len(columns) > width:
+        raise ValueError(
+            f"{width} columns passed, passed data had {len(columns)} columns"
+        )
+    columns.extend([("",) * row_count] * (width - len(columns)))
+    return columns
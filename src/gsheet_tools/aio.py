@@ -0,0 +1,350 @@
+# pylint: disable=duplicate-code
+"""
+Asyncio counterparts of the GSheet Tools fetch and origin-check functions.
+
+The selection and fallback semantics are shared with the synchronous functions; only
+the way requests are executed differs. Every Google API request is built locally and
+handed to an `AsyncTransport`, which performs the HTTP call without blocking the
+event loop.
+
+Classes:
+- AsyncTransport: Interface for executing Google API requests asynchronously.
+- ExecutorTransport: Default transport, offloads blocking `execute()` calls to threads.
+
+Functions:
+- get_gsheet_data: Async counterpart of `gsheet_tools.get_gsheet_data`.
+- check_sheet_origin: Async counterpart of `gsheet_tools.check_sheet_origin`.
+- prepare_dataframe: Async counterpart of `gsheet_tools.prepare_dataframe`.
+
+Example:
+    transport = ExecutorTransport(
+        max_concurrency=20, http_factory=lambda: AuthorizedHttp(credentials)
+    )
+    results = await asyncio.gather(
+        *(get_gsheet_data(sheet, file_id, by="gid", gid="0", transport=transport)
+          for file_id in file_ids)
+    )
+"""
+
+import asyncio
+import functools
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from gsheet_tools import _tools
+from gsheet_tools._cache import MetadataCache
+from gsheet_tools._exceptions import Exceptions
+from gsheet_tools._execution import SingleFlight, _http_status, get_request_executor
+from gsheet_tools._tools import (
+    OriginDetails,
+    SheetSelector,
+    _classify_origin,
+    _coalesce_key,
+    _render_options,
+    _resolve_sheet_properties,
+    _sheet_name_range,
+    _validate_major_dimension,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = [
+    "AsyncTransport",
+    "ExecutorTransport",
+    "get_gsheet_data",
+    "check_sheet_origin",
+    "prepare_dataframe",
+]
+
+
+class AsyncTransport(ABC):
+    """
+    Interface for executing Google API requests asynchronously.
+
+    Implement `execute` to plug in a natively async HTTP client; it receives the
+    request object built by the googleapiclient service (`uri`, `method`, `body` and
+    `headers` describe the call) and must return the decoded JSON response.
+    """
+
+    @abstractmethod
+    async def execute(self, request: Any) -> dict:
+        """
+        Executes a Google API request.
+
+        Args:
+            request (Any): The request built by the service object.
+
+        Returns:
+            dict: The decoded response.
+        """
+
+
+class ExecutorTransport(AsyncTransport):
+    """
+    Executes the blocking `request.execute()` in an executor.
+
+    Requests go through the configured `RequestExecutor`, so the rate limiter and the
+    retry policy are shared with the synchronous API.
+
+    Args:
+        executor (Optional[Executor]): Executor to run requests in, the event loop's
+            default executor when None.
+        max_concurrency (Optional[int]): Maximum number of requests in flight. None for
+            no limit with an `http_factory`, and for one request at a time without,
+            whatever the event loop or thread the requests come from.
+        http_factory (Optional[Callable[[], Any]]): Builds an authorized http object
+            (e.g. `AuthorizedHttp`). When set, every executor thread gets its own http
+            object, since httplib2 connections are not thread-safe.
+
+    Warning:
+        * without http_factory, every request goes through the service's own http
+          object, so requests run one at a time unless max_concurrency is set .
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_concurrency: Optional[int] = None,
+        http_factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise Exceptions.GsheetToolsArgumentError(
+                "[max_concurrency]",
+                f"value `{max_concurrency=}` is invalid, should be positive.",
+            )
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        # one shared httplib2 connection cannot serve several threads at once, a thread
+        # lock (unlike a semaphore) also holds across event loops
+        self._serial_lock = (
+            threading.Lock()
+            if max_concurrency is None and http_factory is None
+            else None
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._http_factory = http_factory
+        self._thread_state = threading.local()
+
+    def _execute_blocking(self, request: Any) -> dict:
+        if self._serial_lock is not None:
+            with self._serial_lock:
+                return get_request_executor().execute(request)
+        if self._http_factory is None:
+            return get_request_executor().execute(request)
+        if not hasattr(self._thread_state, "http"):
+            self._thread_state.http = self._http_factory()
+        return get_request_executor().execute(request, http=self._thread_state.http)
+
+    async def execute(self, request: Any) -> dict:
+        loop = asyncio.get_running_loop()
+        if self._max_concurrency is None:
+            return await loop.run_in_executor(
+                self._executor, self._execute_blocking, request
+            )
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphore:
+            return await loop.run_in_executor(
+                self._executor, self._execute_blocking, request
+            )
+
+
+# transport of the calls given none, shared so that they are serialized together
+_default_transport = ExecutorTransport()
+
+
+async def _execute(
+    transport: AsyncTransport,
+    request: Any,
+    single_flight: Optional[SingleFlight] = None,
+    coalesce_key: Optional[Hashable] = None,
+) -> dict:
+    """
+    Executes a request on the transport, sharing an in-flight identical one when a
+    `single_flight` is given.
+    """
+    if single_flight is None or coalesce_key is None:
+        return await transport.execute(request)
+    return await single_flight.do_async(
+        coalesce_key, lambda: transport.execute(request)
+    )
+
+
+async def _fetch_metadata(
+    sheet: object,
+    file_id: str,
+    transport: AsyncTransport,
+    metadata_cache: Optional[MetadataCache] = None,
+    single_flight: Optional[SingleFlight] = None,
+) -> dict:
+    """
+    Async counterpart of `_tools._fetch_metadata`.
+    """
+    if metadata_cache is not None:
+        cached_metadata = metadata_cache.get(file_id)
+        if cached_metadata is not None:
+            return cached_metadata
+    spreadsheet_metadata = await _execute(
+        transport,
+        sheet.get(  # type: ignore[attr-defined]
+            spreadsheetId=file_id,
+            fields="sheets.properties",  # Request only the properties of each sheet
+        ),
+        single_flight,
+        _coalesce_key("sheets.spreadsheets.get", file_id),
+    )
+    if metadata_cache is not None:
+        metadata_cache.set(file_id, spreadsheet_metadata)
+    return spreadsheet_metadata
+
+
+async def get_gsheet_data(
+    sheet: object,
+    file_id: str,
+    by: str = "all",
+    gid: Optional[str] = None,
+    sheet_name: Optional[str] = None,
+    sheet_position: Optional[int] = None,
+    without_headers: bool = False,
+    custom_tabular_range: Optional[Tuple[str, str]] = None,
+    not_found_priority: Optional[Dict[str, Any]] = None,
+    metadata_cache: Optional[MetadataCache] = None,
+    transport: Optional[AsyncTransport] = None,
+    typed: bool = False,
+    single_flight: Optional[SingleFlight] = None,
+    major_dimension: str = "ROWS",
+) -> Tuple[str, List[Optional[List]]]:
+    """
+    Fetches data from a Google Sheet with various selection options, asynchronously.
+
+    Args:
+        sheet (object): The Google Sheets API service object.
+        file_id (str): The ID of the spreadsheet.
+        by (str): The selection method ('gid', 'sheet_name' or 'sheet_position').
+        gid (Optional[str]): The GID of the sheet (if by='gid').
+        sheet_name (Optional[str]): The name of the sheet (if by='sheet_name').
+        sheet_position (Optional[int]): The position of the sheet (if by='sheet_position').
+        without_headers (bool): Whether to exclude headers from the data.
+        custom_tabular_range (Optional[Tuple[str, str]]): The custom range of cells to
+            fetch, planned from the sheet's gridProperties when None.
+        not_found_priority (Optional[Dict[str, Any]]): Priority list for fallback options.
+        metadata_cache (Optional[MetadataCache]): Cache for the spreadsheet metadata.
+        transport (Optional[AsyncTransport]): Executes the API requests, the
+            shared default `ExecutorTransport`, one request at a time, when None.
+        typed (bool): Read unformatted values instead of display strings.
+        single_flight (Optional[SingleFlight]): Shares identical in-flight reads
+            between concurrent tasks; coalesced callers get the same data object.
+        major_dimension (str): 'ROWS' for a list of rows, 'COLUMNS' for a list of
+            columns, see `gsheet_tools.get_gsheet_data`.
+
+    Returns:
+        Tuple[str, List]: The sheet title and its data.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If invalid arguments are passed.
+    """
+    selector = SheetSelector(
+        by=by,
+        gid=gid,
+        sheet_name=sheet_name,
+        sheet_position=sheet_position,
+        without_headers=without_headers,
+        custom_tabular_range=custom_tabular_range,
+        not_found_priority=not_found_priority,
+    )
+    transport = transport or _default_transport
+    _validate_major_dimension(major_dimension)
+    render_options = _render_options(typed, major_dimension)
+    if selector.by == "sheet_name" and metadata_cache is None:
+        # fast path, see `_tools._get_selected_data`
+        cell_range = _sheet_name_range(selector)
+        try:
+            result = await _execute(
+                transport,
+                sheet.values().get(  # type: ignore[attr-defined]
+                    spreadsheetId=file_id, range=cell_range, **render_options
+                ),
+                single_flight,
+                _coalesce_key("sheets.values.get", file_id, cell_range, render_options),
+            )
+            return str(selector.sheet_name), result.get("values", [])
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if _http_status(e) != 400:
+                raise
+    spreadsheet_metadata = await _fetch_metadata(
+        sheet, file_id, transport, metadata_cache, single_flight
+    )
+    if "sheets" not in spreadsheet_metadata:
+        return "", []
+    found_sheet_properties = _resolve_sheet_properties(spreadsheet_metadata, selector)
+    if not found_sheet_properties:
+        return "", []
+    sheet_title: str = found_sheet_properties.get("title")  # type: ignore[assignment]
+    cell_range = selector.cell_range(sheet_title, found_sheet_properties)
+    result = await _execute(
+        transport,
+        sheet.values().get(  # type: ignore[attr-defined]
+            spreadsheetId=file_id, range=cell_range, **render_options
+        ),
+        single_flight,
+        _coalesce_key("sheets.values.get", file_id, cell_range, render_options),
+    )
+    return sheet_title, result.get("values", [])
+
+
+async def check_sheet_origin(
+    google_drive_service: object,
+    file_id: str,
+    transport: Optional[AsyncTransport] = None,
+    single_flight: Optional[SingleFlight] = None,
+) -> Tuple[str, OriginDetails]:
+    """
+    Determines the origin and MIME type of a Google Sheet file, asynchronously.
+
+    Args:
+        google_drive_service (object): The Google Drive API service object.
+        file_id (str): The ID of the file.
+        transport (Optional[AsyncTransport]): Executes the API request, the
+            shared default `ExecutorTransport`, one request at a time, when None.
+        single_flight (Optional[SingleFlight]): Shares an identical in-flight request
+            between concurrent tasks.
+
+    Returns:
+        Tuple[str, OriginDetails]: The origin and details of the file.
+    """
+    transport = transport or _default_transport
+    file_metadata = await _execute(
+        transport,
+        google_drive_service.files().get(  # type: ignore[attr-defined]
+            fileId=file_id, fields="mimeType,originalFilename"
+        ),
+        single_flight,
+        _coalesce_key("drive.files.get", file_id),
+    )
+    return _classify_origin(file_metadata)
+
+
+async def prepare_dataframe(
+    spreadsheet_data: List[List[Any]], executor: Optional[Executor] = None
+) -> "pd.DataFrame":
+    """
+    Converts Google Sheets data into a pandas DataFrame without blocking the event loop.
+
+    Args:
+        spreadsheet_data (List[List[Any]]): The data from the spreadsheet.
+        executor (Optional[Executor]): Executor to build the DataFrame in, the event
+            loop's default executor when None.
+
+    Returns:
+        pd.DataFrame: The resulting DataFrame.
+
+    Raises:
+        Exceptions.GoogleSpreadsheetProcessingError: If the data is invalid or empty.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(_tools.prepare_dataframe, spreadsheet_data)
+    )
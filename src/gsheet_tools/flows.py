@@ -1,9 +1,74 @@
-"""Flows"""
+"""
+Flows
 
-from abc import ABC
+Classes:
+- Flow: Base of the predefined, repeatable sheet processing demands.
+- DataframeFrameFlow: Lazy pipeline from a sheet to a DataFrame.
+- CsvFlow: Streams a sheet into a CSV file, in constant memory.
+- FlowResult: Outcome of a single flow run by a FlowScheduler.
+- FlowScheduler: Runs a batch of flows on a thread pool, grouped by workbook.
+"""
 
+import copy
+import csv
+import dataclasses
+import gzip
+import io
+import itertools
+import os
+import threading
+import time
+import warnings
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
-class Flow(ABC):  # pylint: disable=R0903 # temporary
+from gsheet_tools._cache import MetadataCache
+from gsheet_tools._exceptions import Exceptions
+from gsheet_tools._execution import RateLimiter, _limited_by
+from gsheet_tools._ranges import plan_range
+from gsheet_tools._tools import (
+    SheetSelector,
+    UrlResolver,
+    _batch_fetch_data,
+    _chunk_ranges,
+    _fetch_data,
+    _fetch_metadata,
+    _projected_ranges,
+    _render_options,
+    _resolve_sheet_properties,
+    _stitch_columns,
+    iter_gsheet_data,
+    prepare_dataframe,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = [
+    "Flow",
+    "DataframeFrameFlow",
+    "CsvFlow",
+    "FlowResult",
+    "FlowScheduler",
+]
+
+
+class Flow(ABC):  # pylint: disable=R0903
     """
     Concept Of Flow
 
@@ -11,21 +76,763 @@ class Flow(ABC):  # pylint: disable=R0903 # temporary
         - that are simple
         - and are repeated
 
-    DISCLAIMER: Not Implemented Yet : Scheduled For Upcoming Releases
+    Attributes:
+        sheet (object): The Google Sheets API service object.
+        file_id (str): The ID of the spreadsheet the flow reads.
+        metadata_cache (Optional[MetadataCache]): Cache for the spreadsheet metadata.
     """
 
+    sheet: object
+    file_id: str
+    metadata_cache: Optional[MetadataCache]
+
+    @abstractmethod
+    def run(self) -> Any:
+        """
+        Executes the flow.
+        """
 
-class DataframeFrameFlow(Flow):  # pylint: disable=R0903 # temporary
+
+class DataframeFrameFlow(Flow):  # pylint: disable=R0902
     """
     When the Ultimate goal is to only reach at a dataframe from google sheet
 
-    DISCLAIMER: Not Implemented Yet : Scheduled For Upcoming Releases
+    The flow is declared with chained calls and nothing is read until `collect`. The
+    plan then resolves the sheet with a single metadata call, pushes the column
+    projection (one `batchGet` of the selected columns) and the row limit down into the
+    requested ranges, and filters the rows before the DataFrame is built once.
+
+    Args:
+        sheet (object): The Google Sheets API service object.
+        source (str): A Google Sheets URL (its gid, when present, selects the tab) or
+            the ID of the spreadsheet.
+        metadata_cache (Optional[MetadataCache]): Cache for the spreadsheet metadata.
+        typed (bool): Read unformatted values instead of display strings.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If `source` is not a valid Google Sheets URL.
+
+    Example:
+        df = (
+            DataframeFrameFlow(sheet, url)
+            .select(by="sheet_name", sheet_name="Orders", not_found_priority={"gid": "0"})
+            .columns("id", "amount", "status")
+            .where("status", lambda status: status == "paid")
+            .dtypes({"id": "int", "amount": "float"})
+            .limit(1000)
+            .collect()
+        )
     """
 
+    class Plan(NamedTuple):
+        """
+        Ranges a flow reads, columns are read with majorDimension=COLUMNS when projected.
+        `last_row` is set when the row limit was pushed down into the ranges.
+        """
+
+        sheet_title: str
+        cell_ranges: List[str]
+        projected: bool
+        last_row: Optional[int] = None
+
+    def __init__(
+        self,
+        sheet: object,
+        source: str,
+        metadata_cache: Optional[MetadataCache] = None,
+        typed: bool = False,
+    ) -> None:
+        gid: Optional[str] = None
+        if "://" in source:
+            resolver = UrlResolver(source)
+            if not resolver.is_valid or resolver.url_data is None:
+                raise Exceptions.GsheetToolsArgumentError(
+                    "[source]", f"value `{source=}` is not a valid Google Sheets URL."
+                )
+            source, gid = resolver.url_data.file_id, resolver.url_data.gid
+        self.sheet = sheet
+        self.file_id = source
+        self.metadata_cache = metadata_cache
+        self.typed = typed
+        self._selector = (
+            SheetSelector(by="gid", gid=gid)
+            if gid is not None
+            else SheetSelector(by="sheet_position", sheet_position=0)
+        )
+        self._columns: Tuple[str, ...] = ()
+        self._filters: List[Tuple[str, Callable[[Any], bool]]] = []
+        self._row_limit: Optional[int] = None
+        self._schema: Optional[Dict[str, str]] = None
+        self._infer_dtypes = False
+        self._dtype_backend = "numpy"
+
+    def select(
+        self,
+        by: str,
+        gid: Optional[str] = None,
+        sheet_name: Optional[str] = None,
+        sheet_position: Optional[int] = None,
+        not_found_priority: Optional[Dict[str, Any]] = None,
+    ) -> "DataframeFrameFlow":
+        """
+        Selects the tab to read, see `get_gsheet_data`. Defaults to the URL's gid, or
+        to the first tab.
+
+        Raises:
+            Exceptions.GsheetToolsArgumentError: If invalid arguments are passed.
+        """
+        self._selector = SheetSelector(
+            by=by,
+            gid=gid,
+            sheet_name=sheet_name,
+            sheet_position=sheet_position,
+            not_found_priority=not_found_priority,
+        )
+        return self
+
+    def columns(self, *names: str) -> "DataframeFrameFlow":
+        """
+        Keeps only the given header names, in that order. Only those columns are read.
+        """
+        self._columns = names
+        return self
+
+    def where(
+        self, column: str, predicate: Callable[[Any], bool]
+    ) -> "DataframeFrameFlow":
+        """
+        Keeps the rows whose `column` cell satisfies `predicate`. Filters are combined
+        with a logical and, and see the raw cell values (blank cells as "").
+        """
+        self._filters.append((column, predicate))
+        return self
+
+    def limit(self, rows: int) -> "DataframeFrameFlow":
+        """
+        Keeps the first `rows` rows. Without filters, only those rows are read.
+
+        Raises:
+            Exceptions.GsheetToolsArgumentError: If `rows` is not positive.
+        """
+        if rows <= 0:
+            raise Exceptions.GsheetToolsArgumentError(
+                "[rows]", f"value `{rows=}` is invalid, should be positive."
+            )
+        self._row_limit = rows
+        return self
+
+    def dtypes(
+        self,
+        schema: Optional[Dict[str, str]] = None,
+        infer: bool = False,
+        dtype_backend: str = "numpy",
+    ) -> "DataframeFrameFlow":
+        """
+        Sets the column dtypes, see `prepare_dataframe(schema, infer_dtypes, dtype_backend)`.
+        """
+        self._schema = schema
+        self._infer_dtypes = infer
+        self._dtype_backend = dtype_backend
+        return self
+
+    def _read_columns(self) -> List[str]:
+        """
+        The projected columns, followed by the filtered columns that were not selected.
+        """
+        if not self._columns:
+            return []
+        return list(self._columns) + [
+            column
+            for column in dict.fromkeys(column for column, _ in self._filters)
+            if column not in self._columns
+        ]
+
+    def plan(self) -> "DataframeFrameFlow.Plan":
+        """
+        Resolves the sheet and computes the ranges `collect` reads.
+
+        Returns:
+            DataframeFrameFlow.Plan: The plan of the read.
+
+        Raises:
+            Exceptions.GoogleSpreadsheetProcessingError: If no sheet matches
+                (GSHEET.PROCESSING.NOTFOUND01).
+            Exceptions.GsheetToolsArgumentError: If a selected column is not in the header.
+        """
+        return self._plan(push_limit=True)
+
+    def _plan(self, push_limit: bool) -> "DataframeFrameFlow.Plan":
+        spreadsheet_metadata = _fetch_metadata(
+            self.sheet, self.file_id, self.metadata_cache
+        )
+        found_sheet_properties = (
+            _resolve_sheet_properties(spreadsheet_metadata, self._selector)
+            if "sheets" in spreadsheet_metadata
+            else None
+        )
+        if not found_sheet_properties:
+            raise Exceptions.GoogleSpreadsheetProcessingError(
+                "GSHEET.PROCESSING.NOTFOUND01"
+            )
+        sheet_title: str = found_sheet_properties["title"]
+        # the header plus `limit` rows, unless filters may drop some of them
+        last_row = (
+            self._row_limit + 1
+            if push_limit and self._row_limit is not None and not self._filters
+            else None
+        )
+        read_columns = self._read_columns()
+        if read_columns:
+            cell_ranges = _projected_ranges(
+                self.sheet,
+                self.file_id,
+                sheet_title,
+                read_columns,
+                without_headers=False,
+                last_row=last_row,
+            )
+            return self.Plan(sheet_title, cell_ranges, True, last_row)
+        cell_range = plan_range(
+            sheet_title, found_sheet_properties, last_row=last_row
+        ) or (f"{sheet_title}!A1:z{last_row or 999999}")
+        return self.Plan(sheet_title, [cell_range], False, last_row)
+
+    def _read(self, plan: "DataframeFrameFlow.Plan") -> List[list]:
+        """
+        Reads the `values` of every range of a plan, in order.
+        """
+        if plan.projected:
+            return _batch_fetch_data(
+                self.sheet,
+                self.file_id,
+                plan.cell_ranges,
+                majorDimension="COLUMNS",
+                **_render_options(self.typed),
+            )
+        return [
+            _fetch_data(
+                self.sheet,
+                self.file_id,
+                cell_range=plan.cell_ranges[0],
+                **_render_options(self.typed),
+            )
+        ]
+
+    @staticmethod
+    def _rows(plan: "DataframeFrameFlow.Plan", range_values: List[list]) -> List[list]:
+        """
+        The rows read for a plan, blank rows included.
+        """
+        if plan.projected:
+            return _stitch_columns(
+                [values[0] if values else [] for values in range_values]
+            )
+        return range_values[0]
+
+    def _is_short(
+        self, plan: "DataframeFrameFlow.Plan", range_values: List[list]
+    ) -> bool:
+        """
+        Whether a read limited to `last_row` may hold fewer than `limit` rows while the
+        sheet has more: it reached `last_row` and blank rows, dropped later, took part of
+        the window.
+        """
+        if plan.last_row is None:
+            return False
+        rows = self._rows(plan, range_values)
+        return len(rows) >= plan.last_row and not all(rows)
+
+    def _filtered(self, spreadsheet_data: List[List[Any]]) -> List[List[Any]]:
+        """
+        Applies the filters, the row limit and drops the filter-only columns.
+        """
+        rows = filter(None, spreadsheet_data)  # remove empty rows .
+        column_names = next(rows, None)
+        if column_names is None:
+            return []
+        width = len(self._columns) if self._columns else len(column_names)
+        # duplicated headers resolve to their first column, as in `_projected_ranges`
+        positions: Dict[str, int] = {}
+        for position, name in enumerate(column_names):
+            positions.setdefault(name, position)
+        for column, _ in self._filters:
+            if column not in positions:
+                raise Exceptions.GsheetToolsArgumentError(
+                    "[where]", f"column `{column}` is not in the sheet header."
+                )
+        filters = [
+            (positions[column], predicate) for column, predicate in self._filters
+        ]
+        kept_rows = (
+            row[:width]
+            for row in rows
+            if all(
+                predicate(row[position] if position < len(row) else "")
+                for position, predicate in filters
+            )
+        )
+        return [column_names[:width]] + list(
+            itertools.islice(kept_rows, self._row_limit)
+        )
+
+    def collect(self) -> "pd.DataFrame":
+        """
+        Executes the plan and builds the DataFrame.
+
+        Returns:
+            pd.DataFrame: The resulting DataFrame.
+
+        Raises:
+            Exceptions.GoogleSpreadsheetProcessingError: If no sheet matches, or if the
+                data is invalid or empty.
+            Exceptions.GsheetToolsArgumentError: If a column, filter or dtype is invalid.
+        """
+        plan = self.plan()
+        return self.assemble(plan, self._read(plan))
+
+    def assemble(
+        self, plan: "DataframeFrameFlow.Plan", range_values: List[list]
+    ) -> "pd.DataFrame":
+        """
+        Builds the DataFrame from the values read for a plan, e.g. by `FlowScheduler`.
+
+        When blank rows left a limited read short of `limit` rows, the sheet is read
+        again without the limit first.
+
+        Args:
+            plan (DataframeFrameFlow.Plan): The plan of the read.
+            range_values (List[list]): The `values` of every range of the plan, in order.
+
+        Returns:
+            pd.DataFrame: The resulting DataFrame.
+        """
+        if self._is_short(plan, range_values):
+            plan = self._plan(push_limit=False)
+            range_values = self._read(plan)
+        if (
+            plan.projected
+            and not self._filters
+            and (self._row_limit is None or plan.last_row is not None)
+        ):
+            # the selected columns exactly, built column-wise without any transpose
+            return prepare_dataframe(
+                [values[0] if values else [] for values in range_values],
+                schema=self._schema,
+                infer_dtypes=self._infer_dtypes,
+                dtype_backend=self._dtype_backend,
+                major_dimension="COLUMNS",
+            )
+        return prepare_dataframe(
+            self._filtered(self._rows(plan, range_values)),
+            schema=self._schema,
+            infer_dtypes=self._infer_dtypes,
+            dtype_backend=self._dtype_backend,
+        )
+
+    def run(self) -> "pd.DataFrame":
+        """
+        Same as `collect`.
+        """
+        return self.collect()
 
-class CsvFlow(Flow):  # pylint: disable=R0903 # temporary
+
+class CsvFlow(Flow):  # pylint: disable=R0902,R0903
     """
     When the Ultimate goal is to only reach at a csv from google sheet
 
-    DISCLAIMER: Not Implemented Yet : Scheduled For Upcoming Releases
+    The sheet is read window by window (see `iter_gsheet_data`) and every window is
+    written out before the next one is requested, so memory stays flat whatever the
+    sheet size. The output matches `prepare_dataframe(data).to_csv(index=False)`:
+    empty rows are dropped, the first row is the header and short rows are padded
+    with blank cells.
+
+    Args:
+        sheet (object): The Google Sheets API service object.
+        file_id (str): The ID of the spreadsheet.
+        destination (Union[str, os.PathLike, IO]): Path of the CSV file, or a file-like
+            object (text, or binary when compressed).
+        by (str): The selection method ('gid', 'sheet_name' or 'sheet_position').
+        gid (Optional[str]): The GID of the sheet (if by='gid').
+        sheet_name (Optional[str]): The name of the sheet (if by='sheet_name').
+        sheet_position (Optional[int]): The position of the sheet (if by='sheet_position').
+        not_found_priority (Optional[Dict[str, Any]]): Priority list for fallback options.
+        chunk_size (int): Number of rows read per API call.
+        metadata_cache (Optional[MetadataCache]): Cache for the spreadsheet metadata.
+        typed (bool): Read unformatted values instead of display strings.
+        compression (Optional[str]): 'gzip', None, or 'infer' to gzip paths ending in
+            '.gz'.
+        **csv_options (Any): Forwarded to `csv.writer`, e.g. `delimiter`.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If `compression` is invalid.
+
+    Example:
+        rows = CsvFlow(sheet, file_id, "export.csv.gz", by="gid", gid="0").run()
+    """
+
+    COMPRESSIONS = ("infer", "gzip", None)
+
+    def __init__(
+        self,
+        sheet: object,
+        file_id: str,
+        destination: Union[str, "os.PathLike[str]", IO],
+        by: str = "all",
+        gid: Optional[str] = None,
+        sheet_name: Optional[str] = None,
+        sheet_position: Optional[int] = None,
+        not_found_priority: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 5000,
+        metadata_cache: Optional[MetadataCache] = None,
+        typed: bool = False,
+        compression: Optional[str] = "infer",
+        **csv_options: Any,
+    ) -> None:
+        if compression not in self.COMPRESSIONS:
+            raise Exceptions.GsheetToolsArgumentError(
+                "[compression]",
+                f"value `{compression=}` is invalid, should be any one of "
+                f"`{','.join(map(str, self.COMPRESSIONS))}`.",
+            )
+        self.sheet = sheet
+        self.file_id = file_id
+        self.destination = destination
+        self.selection: Dict[str, Any] = {
+            "by": by,
+            "gid": gid,
+            "sheet_name": sheet_name,
+            "sheet_position": sheet_position,
+            "not_found_priority": not_found_priority,
+        }
+        self.chunk_size = chunk_size
+        self.metadata_cache = metadata_cache
+        self.typed = typed
+        self.compression = compression
+        self.csv_options = csv_options
+
+    def _rows(self) -> Iterator[List[Any]]:
+        """
+        Streams the non-empty rows of the selected sheet.
+        """
+        _, blocks = iter_gsheet_data(
+            self.sheet,
+            self.file_id,
+            chunk_size=self.chunk_size,
+            metadata_cache=self.metadata_cache,
+            typed=self.typed,
+            **self.selection,
+        )
+        for block in blocks:
+            yield from filter(None, block)  # remove empty rows .
+
+    def _is_gzip(self) -> bool:
+        if self.compression != "infer":
+            return self.compression == "gzip"
+        return isinstance(self.destination, (str, os.PathLike)) and os.fspath(
+            self.destination
+        ).endswith(".gz")
+
+    def _open(self) -> IO[str]:
+        """
+        Opens the destination for writing text.
+        """
+        if isinstance(self.destination, (str, os.PathLike)):
+            if self._is_gzip():
+                return gzip.open(self.destination, "wt", newline="", encoding="utf-8")
+            return open(  # pylint: disable=consider-using-with
+                self.destination, "w", newline="", encoding="utf-8"
+            )
+        if self._is_gzip():
+            return io.TextIOWrapper(
+                gzip.GzipFile(fileobj=self.destination, mode="wb"),
+                newline="",
+                encoding="utf-8",
+            )
+        return self.destination
+
+    def run(self) -> int:
+        """
+        Streams the sheet into the destination.
+
+        Returns:
+            int: The number of data rows written, the header excluded.
+
+        Raises:
+            Exceptions.GoogleSpreadsheetProcessingError: If the sheet is empty or its
+                header has a blank cell, before anything is written.
+            ValueError: If a row is wider than the header.
+        """
+        rows = self._rows()
+        column_names = next(rows, None)
+        if column_names is None:
+            raise Exceptions.GoogleSpreadsheetProcessingError(
+                "GSHEET.PROCESSING.BLANK01"
+            )
+        if "" in column_names:
+            raise Exceptions.GoogleSpreadsheetProcessingError(
+                "GSHEET.PROCESSING.BLANK02"
+            )
+        width = len(column_names)
+        output = self._open()
+        written = 0
+        try:
+            writer = csv.writer(output, **self.csv_options)
+            writer.writerow(column_names)
+            for row in rows:
+                if len(row) > width:
+                    raise ValueError(
+                        f"{width} columns passed, passed data had {len(row)} columns"
+                    )
+                writer.writerow(row + [""] * (width - len(row)))
+                written += 1
+        finally:
+            if output is not self.destination:
+                output.close()
+        return written
+
+
+@dataclasses.dataclass(frozen=True)
+class FlowResult:
+    """
+    Outcome of a single flow run by a `FlowScheduler`.
+
+    Attributes:
+        position (int): Position of the flow in the submitted flows.
+        flow (Flow): The flow.
+        value (Any): What the flow returned, e.g. a DataFrame or a row count.
+        error (Optional[Exception]): The exception raised by the flow, if any.
+        seconds (float): Time spent running the flow, including the read it shared with
+            the other flows of its workbook.
     """
+
+    position: int
+    flow: Flow
+    value: Any = None
+    error: Optional[Exception] = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the flow completed without raising"""
+        return self.error is None
+
+
+class FlowScheduler:  # pylint: disable=R0903
+    """
+    Runs a batch of flows on a thread pool, grouped by workbook.
+
+    Flows reading the same file_id run in the same worker: the spreadsheet metadata is
+    fetched once for the group, and the ranges planned by every `DataframeFrameFlow` of
+    the group are read together with `values().batchGet` (one call per value render and
+    major dimension, split every `max_ranges_per_request` ranges). Other flows run one
+    after the other in their group, sharing the metadata.
+
+    Args:
+        max_workers (int): Number of worker threads, i.e. workbooks read concurrently.
+        rate_limiter (Optional[RateLimiter]): API budget of the batch, shared by all
+            workers. Applied on top of the request executor's own limiter, to the
+            scheduler's requests only.
+        metadata_cache (Optional[MetadataCache]): Cache used by the flows that have none,
+            a fresh cache per batch when None.
+        service_factory (Optional[Callable[[], object]]): Builds a Sheets API service
+            object per worker thread, used instead of the flows' own `sheet`, since the
+            googleapiclient service objects are not thread-safe. Without it, workbooks
+            share the flows' services across threads and a `RuntimeWarning` is issued
+            when several workers may run at once.
+        max_ranges_per_request (int): Maximum number of ranges per batchGet call.
+
+    Raises:
+        Exceptions.GsheetToolsArgumentError: If `max_workers` or
+            `max_ranges_per_request` is not positive.
+
+    Notes:
+        Flows run on threads: the service objects and their httplib2 connections cannot
+        be sent to other processes, and the work is bound by API latency.
+        The submitted flows are not modified, each one runs on a copy holding the
+        worker's service and the batch's metadata cache.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        rate_limiter: Optional[RateLimiter] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        service_factory: Optional[Callable[[], object]] = None,
+        max_ranges_per_request: int = 100,
+    ) -> None:
+        if max_workers <= 0 or max_ranges_per_request <= 0:
+            raise Exceptions.GsheetToolsArgumentError(
+                "[max_workers,max_ranges_per_request]",
+                f"values `{max_workers=}`, `{max_ranges_per_request=}` should be positive.",
+            )
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.metadata_cache = metadata_cache
+        self.service_factory = service_factory
+        self.max_ranges_per_request = max_ranges_per_request
+        self._worker_state = threading.local()
+
+    def _worker_service(self) -> Optional[object]:
+        if self.service_factory is None:
+            return None
+        if not hasattr(self._worker_state, "service"):
+            self._worker_state.service = self.service_factory()
+        return self._worker_state.service
+
+    def _read_plans(
+        self,
+        sheet: object,
+        file_id: str,
+        planned: List[
+            Tuple[int, Flow, DataframeFrameFlow, DataframeFrameFlow.Plan, float]
+        ],
+    ) -> Dict[Tuple[bool, bool, str], list]:
+        """
+        Reads the ranges of every plan of a workbook, batching plans that share the
+        major dimension and the value render.
+        """
+        batches: Dict[Tuple[bool, bool], Dict[str, int]] = defaultdict(dict)
+        for _, _, flow, plan, _ in planned:
+            for cell_range in plan.cell_ranges:
+                batches[(plan.projected, flow.typed)].setdefault(cell_range, 0)
+        fetched: Dict[Tuple[bool, bool, str], list] = {}
+        for (projected, typed), range_weights in batches.items():
+            extra_options = {"majorDimension": "COLUMNS"} if projected else {}
+            for cell_ranges in _chunk_ranges(
+                range_weights, self.max_ranges_per_request, None
+            ):
+                range_values = _batch_fetch_data(
+                    sheet,
+                    file_id,
+                    cell_ranges,
+                    **extra_options,
+                    **_render_options(typed),
+                )
+                fetched.update(
+                    ((projected, typed, cell_range), values)
+                    for cell_range, values in zip(cell_ranges, range_values)
+                )
+        return fetched
+
+    def _run_group(
+        self,
+        file_id: str,
+        group: List[Tuple[int, Flow]],
+        metadata_cache: MetadataCache,
+    ) -> List[FlowResult]:
+        """
+        Runs the flows of one workbook.
+        """
+        with _limited_by(self.rate_limiter):
+            return self._run_flows(file_id, group, metadata_cache)
+
+    def _run_flows(
+        self,
+        file_id: str,
+        group: List[Tuple[int, Flow]],
+        metadata_cache: MetadataCache,
+    ) -> List[FlowResult]:
+        service = self._worker_service()
+        results: List[FlowResult] = []
+        planned: List[
+            Tuple[int, Flow, DataframeFrameFlow, DataframeFrameFlow.Plan, float]
+        ] = []
+        for position, flow in group:
+            # a copy, so the caller's flow keeps its own service and cache
+            worker_flow = copy.copy(flow)
+            if service is not None:
+                worker_flow.sheet = service
+            if worker_flow.metadata_cache is None:
+                worker_flow.metadata_cache = metadata_cache
+            started = time.perf_counter()
+            try:
+                if isinstance(worker_flow, DataframeFrameFlow):
+                    plan = worker_flow.plan()
+                    planned.append(
+                        (
+                            position,
+                            flow,
+                            worker_flow,
+                            plan,
+                            time.perf_counter() - started,
+                        )
+                    )
+                else:
+                    value = worker_flow.run()
+                    results.append(
+                        FlowResult(
+                            position, flow, value, seconds=time.perf_counter() - started
+                        )
+                    )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                results.append(
+                    FlowResult(
+                        position, flow, error=e, seconds=time.perf_counter() - started
+                    )
+                )
+        if not planned:
+            return results
+        started = time.perf_counter()
+        try:
+            fetched = self._read_plans(planned[0][2].sheet, file_id, planned)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            read_seconds = time.perf_counter() - started
+            results.extend(
+                FlowResult(position, flow, error=e, seconds=seconds + read_seconds)
+                for position, flow, _, _, seconds in planned
+            )
+            return results
+        read_seconds = time.perf_counter() - started
+        for position, flow, worker_flow, plan, seconds in planned:
+            range_values = [
+                fetched[(plan.projected, worker_flow.typed, cell_range)]
+                for cell_range in plan.cell_ranges
+            ]
+            started = time.perf_counter()
+            value, error = None, None
+            try:
+                value = worker_flow.assemble(plan, range_values)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                error = e
+            results.append(
+                FlowResult(
+                    position,
+                    flow,
+                    value,
+                    error,
+                    seconds + read_seconds + time.perf_counter() - started,
+                )
+            )
+        return results
+
+    def run(self, flows: Iterable[Flow]) -> List[FlowResult]:
+        """
+        Runs a batch of flows.
+
+        Args:
+            flows (Iterable[Flow]): The flows to run.
+
+        Returns:
+            List[FlowResult]: One result per flow, in submission order. Exceptions
+                raised by a flow are reported on its result instead of being raised.
+        """
+        groups: Dict[str, List[Tuple[int, Flow]]] = defaultdict(list)
+        for position, flow in enumerate(flows):
+            groups[flow.file_id].append((position, flow))
+        metadata_cache = self.metadata_cache or MetadataCache(maxsize=len(groups) or 1)
+        if self.service_factory is None and min(self.max_workers, len(groups)) > 1:
+            warnings.warn(
+                "FlowScheduler runs workbooks concurrently on the flows' own service "
+                "objects, which are not thread-safe; pass a service_factory",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="gsheet-tools-flow"
+        ) as executor:
+            group_results = executor.map(
+                lambda item: self._run_group(item[0], item[1], metadata_cache),
+                groups.items(),
+            )
+            results = [result for group in group_results for result in group]
+        return sorted(results, key=lambda result: result.position)
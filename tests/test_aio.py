@@ -0,0 +1,226 @@
+import asyncio
+
+import pytest
+from gsheet_tools import SingleFlight, aio
+from gsheet_tools._tools import Exceptions, SheetOrigins, SheetMimetype
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+
+class UnknownRangeError(Exception):
+    def __init__(self):
+        super().__init__("Unable to parse range")
+        self.resp = SimpleNamespace(status=400)
+
+
+class RecordingTransport(aio.AsyncTransport):
+    def __init__(self):
+        self.requests = []
+
+    async def execute(self, request):
+        self.requests.append(request)
+        await asyncio.sleep(0)
+        return request.execute()
+
+
+def _mock_service():
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {
+        "sheets": [
+            {"properties": {"sheetId": "67890", "title": "Sheet1", "index": "0"}},
+            {"properties": {"sheetId": "12345", "title": "Sheet2", "index": "1"}},
+        ]
+    }
+    mock_service.values().get().execute.return_value = {"values": [["Name", "Age"]]}
+    return mock_service
+
+
+def test_aio_get_gsheet_data():
+    mock_service = _mock_service()
+    title, data = asyncio.run(
+        aio.get_gsheet_data(mock_service, "file_id", by="gid", gid="67890")
+    )
+    assert title == "Sheet1"
+    assert data == [["Name", "Age"]]
+
+
+def test_aio_get_gsheet_data_fallback_with_custom_transport():
+    mock_service = _mock_service()
+    mock_service.values().get().execute.side_effect = [
+        UnknownRangeError(),
+        {"values": [["Name", "Age"]]},
+    ]
+    transport = RecordingTransport()
+    title, _ = asyncio.run(
+        aio.get_gsheet_data(
+            mock_service,
+            "file_id",
+            by="sheet_name",
+            sheet_name="Missing",
+            not_found_priority={"sheet_position": "1"},
+            transport=transport,
+        )
+    )
+    assert title == "Sheet2"
+    # the direct read of the missing tab, the metadata, then the fallback tab
+    assert len(transport.requests) == 3
+
+
+def test_aio_get_gsheet_data_coalesces_concurrent_reads():
+    class SlowTransport(RecordingTransport):
+        async def execute(self, request):
+            await asyncio.sleep(0.01)
+            return await super().execute(request)
+
+    mock_service = _mock_service()
+    transport = SlowTransport()
+    single_flight = SingleFlight()
+
+    async def _main():
+        return await asyncio.gather(
+            *(
+                aio.get_gsheet_data(
+                    mock_service,
+                    "file_id",
+                    by="gid",
+                    gid="67890",
+                    transport=transport,
+                    single_flight=single_flight,
+                )
+                for _ in range(5)
+            )
+        )
+
+    results = asyncio.run(_main())
+    assert results == [("Sheet1", [["Name", "Age"]])] * 5
+    assert len(transport.requests) == 2
+    assert single_flight.stats.collapsed == 8
+
+
+def test_aio_get_gsheet_data_invalid_arguments():
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        asyncio.run(aio.get_gsheet_data(MagicMock(), "file_id", by="gid"))
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        aio.ExecutorTransport(max_concurrency=0)
+
+
+def test_aio_gather_respects_max_concurrency():
+    in_flight = []
+    peak = []
+
+    class SlowRequest:
+        def execute(self, http=None):
+            import time
+
+            in_flight.append(http)
+            peak.append(len(in_flight))
+            time.sleep(0.01)
+            in_flight.pop()
+            return {"values": [["x"]]}
+
+    mock_service = _mock_service()
+    mock_service.values().get.return_value = SlowRequest()
+    transport = aio.ExecutorTransport(max_concurrency=2, http_factory=object)
+
+    async def _main():
+        return await asyncio.gather(
+            *(
+                aio.get_gsheet_data(
+                    mock_service,
+                    f"file_{i}",
+                    by="gid",
+                    gid="67890",
+                    transport=transport,
+                )
+                for i in range(8)
+            )
+        )
+
+    results = asyncio.run(_main())
+    assert results == [("Sheet1", [["x"]])] * 8
+    assert max(peak) <= 2
+
+
+def test_aio_executor_transport_gives_every_thread_its_own_http():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    used = []
+    in_flight = []
+    peak = []
+
+    class SlowRequest:
+        def execute(self, http=None):
+            in_flight.append(http)
+            peak.append(len(in_flight))
+            used.append((threading.get_ident(), http))
+            time.sleep(0.01)
+            in_flight.pop()
+            return {}
+
+    async def _main(transport):
+        await asyncio.gather(*(transport.execute(SlowRequest()) for _ in range(12)))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        asyncio.run(_main(aio.ExecutorTransport(executor, http_factory=object)))
+    https = {}
+    for thread, http in used:
+        assert http is not None
+        assert https.setdefault(thread, http) is http
+    assert len(set(map(id, https.values()))) == len(https) > 1
+
+    # without http_factory, the service's shared http serves one request at a time
+    used.clear()
+    peak.clear()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        asyncio.run(_main(aio.ExecutorTransport(executor)))
+    assert [http for _, http in used] == [None] * 12
+    assert max(peak) == 1
+
+
+def test_aio_calls_without_transport_share_one_request_at_a_time():
+    in_flight = []
+    peak = []
+
+    class SlowRequest:
+        def execute(self):
+            import time
+
+            in_flight.append(None)
+            peak.append(len(in_flight))
+            time.sleep(0.005)
+            in_flight.pop()
+            return {"values": [["x"]]}
+
+    mock_service = _mock_service()
+    mock_service.values().get.return_value = SlowRequest()
+
+    async def _main():
+        return await asyncio.gather(
+            *(
+                aio.get_gsheet_data(mock_service, "file_id", by="gid", gid="67890")
+                for _ in range(8)
+            )
+        )
+
+    assert asyncio.run(_main()) == [("Sheet1", [["x"]])] * 8
+    assert max(peak) == 1
+
+
+def test_aio_check_sheet_origin():
+    mock_service = MagicMock()
+    mock_service.files().get().execute.return_value = {
+        "mimeType": SheetMimetype.ORIGINAL,
+        "originalFilename": "example.xlsx",
+    }
+    origin, details = asyncio.run(aio.check_sheet_origin(mock_service, "file_id"))
+    assert origin == SheetOrigins.UPLOADED_CONVERTED
+    assert details.original_extension == "xlsx"
+
+
+def test_aio_prepare_dataframe():
+    df = asyncio.run(aio.prepare_dataframe([["Name", "Age"], ["Alice", 30]]))
+    assert list(df.columns) == ["Name", "Age"]
+    with pytest.raises(Exceptions.GoogleSpreadsheetProcessingError):
+        asyncio.run(aio.prepare_dataframe([]))
@@ -0,0 +1,228 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from gsheet_tools._bulk import (
+    BulkFetchResult,
+    check_sheet_origins,
+    get_gsheet_data_concurrently,
+    list_sheet_origins,
+)
+from gsheet_tools._execution import (
+    RateLimiter,
+    RequestExecutor,
+    RetryPolicy,
+    set_request_executor,
+)
+from gsheet_tools._tools import (
+    Exceptions,
+    OriginDetails,
+    SheetMimetype,
+    SheetOrigins,
+    SheetSelector,
+)
+from unittest.mock import MagicMock
+
+
+def _service_factory(created):
+    lock = threading.Lock()
+
+    def _factory():
+        mock_service = MagicMock()
+        mock_service.get().execute.return_value = {
+            "sheets": [{"properties": {"sheetId": "1", "title": "Sheet1"}}]
+        }
+        mock_service.values().get().execute.return_value = {"values": [["Name"]]}
+        with lock:
+            created.append(threading.get_ident())
+        return mock_service
+
+    return _factory
+
+
+def test_get_gsheet_data_concurrently():
+    created = []
+    jobs = [(f"file_{i}", SheetSelector(by="gid", gid="1")) for i in range(20)]
+    results = list(
+        get_gsheet_data_concurrently(_service_factory(created), jobs, max_workers=4)
+    )
+    assert sorted(result.position for result in results) == list(range(20))
+    assert all(result.ok for result in results)
+    assert {result.title for result in results} == {"Sheet1"}
+    assert results[0].data == [["Name"]]
+    # one service per worker thread, never shared between threads
+    assert len(created) <= 4
+    assert len(created) == len(set(created))
+
+
+def test_get_gsheet_data_concurrently_reports_job_errors():
+    created = []
+    jobs = [
+        ("file_1", {"by": "gid", "gid": "1"}),
+        ("file_2", {"by": "gid"}),  # invalid selection
+        ("file_3", {"by": "gid", "gid": "404"}),
+    ]
+    results = {
+        result.file_id: result
+        for result in get_gsheet_data_concurrently(_service_factory(created), jobs)
+    }
+    assert results["file_1"].ok and results["file_1"].title == "Sheet1"
+    assert isinstance(results["file_2"].error, Exceptions.GsheetToolsArgumentError)
+    assert results["file_2"].selector is None
+    assert results["file_3"] == BulkFetchResult(
+        2, "file_3", SheetSelector(by="gid", gid="404")
+    )
+
+
+def test_get_gsheet_data_concurrently_invalid_workers():
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        list(get_gsheet_data_concurrently(MagicMock, [], max_workers=0))
+
+
+class FakeHttpError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.resp = SimpleNamespace(status=status)
+
+
+class FakeBatch:
+    def __init__(self, drive, callback):
+        self.drive = drive
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self, **kwargs):
+        self.drive.batches.append(len(self.requests))
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
+class FakeDrive:
+    """
+    Drive service over {file_id: file resource}, failing calls with `failures`
+    """
+
+    def __init__(self, files, failures=None):
+        self.files_by_id = files
+        self.failures = failures or {}
+        self.batches = []
+        self.list_calls = []
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+    def files(self):
+        return self
+
+    def get(self, fileId, fields, supportsAllDrives):
+        def _execute():
+            if self.failures.get(fileId):
+                raise self.failures[fileId].pop(0)
+            if fileId not in self.files_by_id:
+                raise FakeHttpError(404)
+            return dict(self.files_by_id[fileId])
+
+        return SimpleNamespace(execute=_execute)
+
+    def list(self, pageToken=None, pageSize=1000, **kwargs):
+        self.list_calls.append(kwargs)
+        ids = sorted(self.files_by_id)
+        start = int(pageToken or 0)
+        page = ids[start : start + pageSize]
+        response = {"files": [{"id": i, **self.files_by_id[i]} for i in page]}
+        if start + pageSize < len(ids):
+            response["nextPageToken"] = str(start + pageSize)
+        return SimpleNamespace(execute=lambda **_: response)
+
+
+@pytest.fixture
+def no_backoff():
+    previous = set_request_executor(
+        RequestExecutor(retry_policy=RetryPolicy(max_retries=2, initial_backoff=0))
+    )
+    yield
+    set_request_executor(previous)
+
+
+def test_check_sheet_origins_batches(no_backoff):
+    files = {
+        f"file{i}": {"name": f"File {i}", "mimeType": SheetMimetype.ORIGINAL.value}
+        for i in range(5)
+    }
+    files["file4"] = {"mimeType": SheetMimetype.STANDARD_CSV.value}
+    drive = FakeDrive(files, failures={"file1": [FakeHttpError(429)]})
+    results = list(check_sheet_origins(drive, [*files, "missing"], batch_size=4))
+    assert drive.batches == [4, 3]  # file1 retried with the second batch
+    by_id = {result.file_id: result for result in results}
+    assert sorted(result.position for result in results) == list(range(6))
+    assert by_id["file0"].origin == SheetOrigins.GOOGLE_SHEET_TOOL.value
+    assert by_id["file0"].details == OriginDetails(
+        True, SheetMimetype.ORIGINAL.value, None, None
+    )
+    assert by_id["file0"].name == "File 0"
+    assert by_id["file1"].ok
+    assert by_id["file4"].details.is_parsable is False
+    assert not by_id["missing"].ok
+    assert isinstance(by_id["missing"].error, FakeHttpError)
+
+
+def test_check_sheet_origins_takes_a_token_per_call():
+    class RecordingLimiter(RateLimiter):
+        def acquire(self, tokens=1):
+            acquired.append(tokens)
+            return 0.0
+
+    acquired = []
+    previous = set_request_executor(
+        RequestExecutor(
+            RecordingLimiter(1000), RetryPolicy(max_retries=2, initial_backoff=0)
+        )
+    )
+    try:
+        drive = FakeDrive({f"file{i}": {"mimeType": "text/csv"} for i in range(7)})
+        assert len(list(check_sheet_origins(drive, sorted(drive.files_by_id), 4))) == 7
+    finally:
+        set_request_executor(previous)
+    assert acquired == [4, 3]
+
+
+def test_check_sheet_origins_invalid_batch_size():
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        list(check_sheet_origins(FakeDrive({}), ["file"], batch_size=101))
+
+
+def test_list_sheet_origins_pages():
+    files = {
+        f"file{i}": {
+            "name": f"File {i}.xlsx",
+            "mimeType": SheetMimetype.ORIGINAL.value,
+            "originalFilename": f"File {i}.xlsx",
+        }
+        for i in range(5)
+    }
+    drive = FakeDrive(files)
+    results = list(
+        list_sheet_origins(
+            drive, folder_id="folder", query="name contains 'File'", page_size=2
+        )
+    )
+    assert [result.position for result in results] == list(range(5))
+    assert {result.origin for result in results} == {
+        SheetOrigins.UPLOADED_CONVERTED.value
+    }
+    assert results[0].details.original_extension == "xlsx"
+    assert len(drive.list_calls) == 3
+    query = drive.list_calls[0]["q"]
+    assert "'folder' in parents" in query
+    assert "(name contains 'File')" in query
+    assert "trashed = false" in query
+    assert (
+        drive.list_calls[0]["fields"]
+        == "nextPageToken,files(id,name,mimeType,originalFilename)"
+    )
@@ -0,0 +1,189 @@
+import pytest
+from gsheet_tools._cache import MetadataCache, ResponseCache
+from gsheet_tools._tools import Exceptions, get_gsheet_data, get_gid_sheets_data
+from unittest.mock import MagicMock
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _mock_service():
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {
+        "sheets": [
+            {"properties": {"sheetId": "67890", "title": "Sheet1", "index": 0}},
+            {"properties": {"sheetId": "12345", "title": "Sheet2", "index": 1}},
+        ]
+    }
+    mock_service.get.reset_mock()
+    mock_service.values().get().execute.return_value = {"values": [["Name", "Age"]]}
+    return mock_service
+
+
+def test_metadata_cache_hit_and_miss():
+    cache = MetadataCache()
+    assert cache.get("file_id") is None
+    cache.set("file_id", {"sheets": []})
+    assert cache.get("file_id") == {"sheets": []}
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert "file_id" in cache
+    assert len(cache) == 1
+
+
+def test_metadata_cache_ttl_expiry():
+    clock = FakeClock()
+    cache = MetadataCache(ttl=10, timer=clock)
+    cache.set("file_id", {"sheets": []})
+    clock.now = 9.9
+    assert cache.get("file_id") is not None
+    clock.now = 10.0
+    assert cache.get("file_id") is None
+    assert "file_id" not in cache
+    assert cache.stats == MetadataCache.Stats(hits=1, misses=1, evictions=0, size=0)
+
+
+def test_metadata_cache_lru_eviction():
+    cache = MetadataCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # `b` becomes least recently used
+    cache.set("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.evictions == 1
+
+
+def test_metadata_cache_invalidate_and_clear():
+    cache = MetadataCache()
+    cache.set("a", 1)
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+    cache.set("b", 2)
+    cache.get("b")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats == MetadataCache.Stats(hits=0, misses=0, evictions=0, size=0)
+
+
+def test_metadata_cache_invalid_arguments():
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        MetadataCache(ttl=0)
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        MetadataCache(maxsize=0)
+
+
+def test_get_gsheet_data_uses_metadata_cache():
+    mock_service = _mock_service()
+    cache = MetadataCache()
+    title, _ = get_gsheet_data(
+        mock_service, "file_id", by="gid", gid="67890", metadata_cache=cache
+    )
+    assert title == "Sheet1"
+    title, _ = get_gsheet_data(
+        mock_service, "file_id", by="sheet_name", sheet_name="Sheet2", metadata_cache=cache
+    )
+    assert title == "Sheet2"
+    assert mock_service.get.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_get_gid_sheets_data_uses_metadata_cache():
+    mock_service = _mock_service()
+    cache = MetadataCache()
+    get_gid_sheets_data(mock_service, "file_id", "67890", metadata_cache=cache)
+    get_gid_sheets_data(mock_service, "file_id", "12345", metadata_cache=cache)
+    assert mock_service.get.call_count == 1
+    assert cache.hits == 1
+
+
+def _mock_drive(version="1"):
+    mock_drive = MagicMock()
+    mock_drive.files().get().execute.return_value = {
+        "version": version,
+        "modifiedTime": "2024-01-01T00:00:00.000Z",
+    }
+    mock_drive.files().get.reset_mock()
+    return mock_drive
+
+
+def test_response_cache_skips_read_while_version_unchanged(tmp_path):
+    mock_service = _mock_service()
+    mock_drive = _mock_drive()
+    with ResponseCache(str(tmp_path / "cache.db"), mock_drive) as cache:
+        for _ in range(3):
+            title, data = get_gsheet_data(
+                mock_service, "file_id", by="gid", gid="67890", response_cache=cache
+            )
+            assert (title, data) == ("Sheet1", [["Name", "Age"]])
+        assert mock_service.values().get().execute.call_count == 1
+        assert mock_drive.files().get().execute.call_count == 3
+        assert cache.stats[:3] == (2, 1, 3)
+
+
+def test_response_cache_refetches_when_version_changes(tmp_path):
+    mock_service = _mock_service()
+    mock_drive = _mock_drive()
+    with ResponseCache(str(tmp_path / "cache.db"), mock_drive) as cache:
+        get_gsheet_data(mock_service, "file_id", by="gid", gid="67890", response_cache=cache)
+        mock_drive.files().get().execute.return_value = {"version": "2"}
+        mock_service.values().get().execute.return_value = {"values": [["Name"]]}
+        _, data = get_gsheet_data(
+            mock_service, "file_id", by="gid", gid="67890", response_cache=cache
+        )
+        assert data == [["Name"]]
+        assert mock_service.values().get().execute.call_count == 2
+        assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_response_cache_persists_and_keys_render_options(tmp_path):
+    path = str(tmp_path / "cache.db")
+    with ResponseCache(path, _mock_drive()) as cache:
+        cache.set("file_id", "Sheet1", "Sheet1!A1:z999999", [["a"]], ("1", None))
+    with ResponseCache(path, _mock_drive()) as cache:
+        assert cache.get("file_id", "Sheet1", "Sheet1!A1:z999999")[0] == [["a"]]
+        assert cache.get("file_id", "Sheet1", "Sheet1!A1:z999999", "typed")[0] is None
+
+
+def test_response_cache_revalidate_after(tmp_path):
+    clock = FakeClock()
+    mock_drive = _mock_drive()
+    cache = ResponseCache(
+        str(tmp_path / "cache.db"), mock_drive, revalidate_after=60, timer=clock
+    )
+    cache.set("file_id", "Sheet1", "range", [["a"]], ("1", None))
+    assert cache.get("file_id", "Sheet1", "range") == ([["a"]], None)
+    assert mock_drive.files().get().execute.call_count == 0
+    clock.now = 60
+    assert cache.get("file_id", "Sheet1", "range")[0] == [["a"]]
+    assert mock_drive.files().get().execute.call_count == 1
+    cache.close()
+
+
+def test_response_cache_eviction_and_invalidate(tmp_path):
+    clock = FakeClock()
+    cache = ResponseCache(
+        str(tmp_path / "cache.db"), _mock_drive(), max_entries=2, timer=clock
+    )
+    for clock.now, name in enumerate("abc"):
+        cache.set("file_id", name, "range", [[name]], ("1", None))
+    assert cache.get("file_id", "a", "range")[0] is None
+    assert cache.stats.evictions == 1
+    assert cache.stats.entries == 2
+    assert cache.invalidate("other") == 0
+    assert cache.invalidate("file_id") == 2
+    cache.close()
+    cache = ResponseCache(
+        str(tmp_path / "sized.db"), _mock_drive(), max_bytes=1, timer=clock
+    )
+    cache.set("file_id", "a", "range", [["a"]], ("1", None))
+    assert cache.stats.entries == 0
+    cache.close()
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        ResponseCache(str(tmp_path / "x.db"), _mock_drive(), max_entries=0)
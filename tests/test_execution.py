@@ -0,0 +1,239 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from gsheet_tools._execution import (
+    RateLimiter,
+    RequestExecutor,
+    RetryPolicy,
+    SingleFlight,
+    get_request_executor,
+    set_request_executor,
+)
+from gsheet_tools._tools import Exceptions, get_gsheet_data
+from unittest.mock import MagicMock
+
+
+class FakeHttpError(Exception):
+    """
+    Mimics googleapiclient.errors.HttpError
+    """
+
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.resp = SimpleNamespace(status=status)
+
+
+class FlakyRequest:
+    def __init__(self, failures, response=None):
+        self.failures = list(failures)
+        self.response = response if response is not None else {"values": [["ok"]]}
+        self.calls = 0
+
+    def execute(self, **kwargs):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return self.response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def executor():
+    sleeps = []
+    request_executor = RequestExecutor(
+        retry_policy=RetryPolicy(max_retries=3, jitter=False), sleep=sleeps.append
+    )
+    request_executor.sleeps = sleeps
+    previous = set_request_executor(request_executor)
+    yield request_executor
+    set_request_executor(previous)
+
+
+def test_request_executor_retries_retryable_statuses(executor):
+    request = FlakyRequest([FakeHttpError(429), FakeHttpError(503)])
+    assert executor.execute(request) == {"values": [["ok"]]}
+    assert request.calls == 3
+    assert executor.sleeps == [1.0, 2.0]
+    assert executor.stats == RequestExecutor.Stats(
+        requests=3, retries=2, failures=0, throttled_seconds=0.0
+    )
+
+
+def test_request_executor_gives_up(executor):
+    request = FlakyRequest([FakeHttpError(500)] * 10)
+    with pytest.raises(FakeHttpError):
+        executor.execute(request)
+    assert request.calls == 4
+    assert (executor.retries, executor.failures) == (3, 1)
+
+
+def test_request_executor_does_not_retry_client_errors(executor):
+    request = FlakyRequest([FakeHttpError(404)])
+    with pytest.raises(FakeHttpError):
+        executor.execute(request)
+    assert request.calls == 1
+    assert executor.retries == 0
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(initial_backoff=1, max_backoff=5, jitter=False)
+    assert [policy.backoff(i) for i in range(5)] == [1, 2, 4, 5, 5]
+    jittered = RetryPolicy(initial_backoff=1, max_backoff=5)
+    assert all(0 <= jittered.backoff(3) <= 5 for _ in range(100))
+    assert policy.is_retryable(ConnectionResetError())
+    assert policy.is_retryable(FakeHttpError(400)) is False
+    assert policy.is_retryable(FakeHttpError("502"))
+
+
+def test_rate_limiter_token_bucket():
+    clock = FakeClock()
+    limiter = RateLimiter(2, per=1, timer=clock, sleep=clock.sleep)
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert limiter.acquire() == pytest.approx(0.5)
+    clock.now += 10  # refills up to the burst size only
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert limiter.acquire() > 0
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        RateLimiter(0)
+
+
+def test_rate_limiter_shared_across_threads_and_tasks():
+    limiter = RateLimiter(1000, per=1, burst=5)
+    waits = []
+    threads = [
+        threading.Thread(target=lambda: waits.append(limiter.acquire()))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert waits == [0] * 5
+
+    limiter = RateLimiter(100, per=1, burst=1)
+
+    async def _main():
+        return await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+
+    first, *others = asyncio.run(_main())
+    assert first == 0
+    assert all(wait > 0 for wait in others)
+
+
+def test_api_calls_go_through_request_executor(executor):
+    executor.rate_limiter = RateLimiter(100, per=1)
+    mock_service = MagicMock()
+    mock_service.get.return_value = FlakyRequest(
+        [FakeHttpError(429)],
+        {"sheets": [{"properties": {"sheetId": "1", "title": "Sheet1"}}]},
+    )
+    mock_service.values().get.return_value = FlakyRequest([FakeHttpError(503)])
+    title, data = get_gsheet_data(mock_service, "file_id", by="gid", gid="1")
+    assert (title, data) == ("Sheet1", [["ok"]])
+    assert executor.stats.requests == 4
+    assert executor.stats.retries == 2
+    assert get_request_executor() is executor
+
+
+def test_single_flight_coalesces_concurrent_threads():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def _read():
+        calls.append(1)
+        release.wait(5)
+        return [["ok"]]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(single_flight.do("key", _read)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    while single_flight.stats.calls < 4:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [[["ok"]]] * 4
+    assert single_flight.stats == SingleFlight.Stats(calls=4, collapsed=3, in_flight=0)
+    # completed calls are not cached
+    assert single_flight.do("key", lambda: "again") == "again"
+
+
+def test_single_flight_shares_errors():
+    single_flight = SingleFlight()
+    with pytest.raises(FakeHttpError):
+        single_flight.do("key", FlakyRequest([FakeHttpError(500)]).execute)
+    assert single_flight.stats.in_flight == 0
+
+
+def test_single_flight_coalesces_asyncio_tasks():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def _read():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"values": [["ok"]]}
+
+    async def _main():
+        return await asyncio.gather(
+            *(single_flight.do_async(("file_id", "A1:B2"), _read) for _ in range(5)),
+            single_flight.do_async(("file_id", "C1:D2"), _read),
+        )
+
+    results = asyncio.run(_main())
+    assert len(calls) == 2
+    assert results[0] is results[4]
+    assert single_flight.stats == SingleFlight.Stats(calls=6, collapsed=4, in_flight=0)
+
+
+def test_request_executor_coalesces_identical_reads(executor):
+    executor.single_flight = SingleFlight()
+    release = threading.Event()
+    mock_service = MagicMock()
+    mock_service.get.return_value.execute.side_effect = lambda **_: (
+        release.wait(5)
+        and {"sheets": [{"properties": {"sheetId": "1", "title": "Sheet1"}}]}
+    )
+    mock_service.values().get.return_value = FlakyRequest([])
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                get_gsheet_data(mock_service, "file_id", by="gid", gid="1")
+            )
+        )
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    while executor.single_flight.stats.collapsed < 2:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == [("Sheet1", [["ok"]])] * 3
+    assert mock_service.get.return_value.execute.call_count == 1
+    assert executor.single_flight.stats.calls == 6
@@ -1,5 +1,11 @@
+import gzip
+import io
+import re
+
 import pytest
 from gsheet_tools.flows import Flow, DataframeFrameFlow, CsvFlow
+from gsheet_tools._tools import Exceptions, prepare_dataframe
+from unittest.mock import MagicMock
 
 
 # def test_flow_is_abstract():
@@ -14,7 +20,7 @@ def test_dataframe_frame_flow_inherits_flow():
     """
     Test that DataframeFrameFlow is a subclass of Flow and can be instantiated.
     """
-    flow = DataframeFrameFlow()
+    flow = DataframeFrameFlow(MagicMock(), "file_id")
     assert isinstance(flow, Flow)
     assert isinstance(flow, DataframeFrameFlow)
 
@@ -23,6 +29,314 @@ def test_csv_flow_inherits_flow():
     """
     Test that CsvFlow is a subclass of Flow and can be instantiated.
     """
-    flow = CsvFlow()
+    flow = CsvFlow(MagicMock(), "file_id", io.StringIO(), by="gid", gid="1")
     assert isinstance(flow, Flow)
-    assert isinstance(flow, CsvFlow)
\ No newline at end of file
+    assert isinstance(flow, CsvFlow)
+
+
+def _windowed_service(rows):
+    """
+    Mock service whose values().get serves `rows` for `Data!A{start}:C{end}` windows.
+    """
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {
+        "sheets": [
+            {
+                "properties": {
+                    "sheetId": "1",
+                    "title": "Data",
+                    "index": 0,
+                    "gridProperties": {"rowCount": len(rows), "columnCount": 3},
+                }
+            }
+        ]
+    }
+
+    def _get(spreadsheetId, range):
+        start, end = map(int, re.fullmatch(r"Data!A(\d+):C(\d+)", range).groups())
+        window = rows[start - 1 : end]
+        request = MagicMock()
+        request.execute.return_value = {"values": window} if window else {}
+        return request
+
+    mock_service.values().get.side_effect = _get
+    return mock_service
+
+
+ROWS = [["name", "age", "city"], ["a", "1"], [], ["b", "2", "x,y"], ["c"]]
+
+
+def test_csv_flow_matches_prepare_dataframe():
+    mock_service = _windowed_service(ROWS)
+    output = io.StringIO()
+    written = CsvFlow(
+        mock_service, "file_id", output, by="gid", gid="1", chunk_size=2
+    ).run()
+    assert written == 3
+    expected = prepare_dataframe(ROWS).to_csv(index=False, lineterminator="\r\n")
+    assert output.getvalue() == expected
+    assert mock_service.values().get.call_count == 3
+
+
+def test_csv_flow_gzip(tmp_path):
+    path = tmp_path / "export.csv.gz"
+    CsvFlow(_windowed_service(ROWS), "file_id", path, by="gid", gid="1").run()
+    with gzip.open(path, "rt", newline="") as f:
+        assert f.read().splitlines()[0] == "name,age,city"
+    output = io.BytesIO()
+    CsvFlow(
+        _windowed_service(ROWS),
+        "file_id",
+        output,
+        by="gid",
+        gid="1",
+        compression="gzip",
+        delimiter=";",
+    ).run()
+    assert gzip.decompress(output.getvalue()).startswith(b"name;age;city\r\n")
+
+
+def test_csv_flow_errors(tmp_path):
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        CsvFlow(MagicMock(), "file_id", io.StringIO(), compression="zip")
+    path = tmp_path / "blank.csv"
+    with pytest.raises(Exceptions.GoogleSpreadsheetProcessingError):
+        CsvFlow(_windowed_service([[], []]), "file_id", path, by="gid", gid="1").run()
+    assert not path.exists()
+    with pytest.raises(ValueError):
+        CsvFlow(
+            _windowed_service([["a"], ["1", "2"]]), "file_id", io.StringIO(), by="gid", gid="1"
+        ).run()
+
+
+def _flow_service():
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {
+        "sheets": [
+            {"properties": {"sheetId": 0, "title": "First", "index": 0}},
+            {
+                "properties": {
+                    "sheetId": 42,
+                    "title": "Orders",
+                    "index": 1,
+                    "gridProperties": {"rowCount": 100, "columnCount": 30},
+                }
+            },
+        ]
+    }
+    mock_service.get.reset_mock()
+    mock_service.values().get().execute.return_value = {
+        "values": [["id", "amount", "status"], ["1", "10", "paid"], [], ["2", "5"]]
+    }
+    columns = {
+        "Orders!A1:A100": [["id", "1", "2", "3"]],
+        "Orders!C1:C100": [["status", "paid", "", "paid"]],
+        "Orders!A1:A3": [["id", "1", "2"]],
+    }
+
+    def _batch_get(spreadsheetId, ranges, majorDimension):
+        request = MagicMock()
+        request.execute.return_value = {
+            "valueRanges": [{"range": r, "values": columns[r]} for r in ranges]
+        }
+        return request
+
+    mock_service.values().batchGet.side_effect = _batch_get
+    return mock_service
+
+
+def test_dataframe_frame_flow_is_lazy_and_reads_url_gid():
+    mock_service = _flow_service()
+    url = "https://docs.google.com/spreadsheets/d/abc123/edit#gid=42"
+    flow = DataframeFrameFlow(mock_service, url).dtypes({"id": "int"})
+    assert flow.file_id == "abc123"
+    mock_service.get.assert_not_called()
+    df = flow.collect()
+    assert df["id"].tolist() == [1, 2]
+    assert df["status"].tolist() == ["paid", ""]
+    assert mock_service.values().get.call_args.kwargs["range"] == "Orders!A1:AD100"
+    assert flow.run().equals(df)
+
+
+def test_dataframe_frame_flow_pushes_projection_and_limit_down():
+    mock_service = _flow_service()
+    flow = (
+        DataframeFrameFlow(mock_service, "abc123")
+        .select(by="sheet_name", sheet_name="Missing", not_found_priority={"gid": 42})
+        .columns("id")
+        .limit(2)
+    )
+    assert flow.plan() == ("Orders", ["Orders!A1:A3"], True, 3)
+    assert flow.collect()["id"].tolist() == ["1", "2"]
+
+    flow = (
+        DataframeFrameFlow(mock_service, "abc123")
+        .select(by="gid", gid="42")
+        .columns("id")
+        .where("status", lambda status: status == "paid")
+        .limit(5)
+    )
+    # the filtered column is read too, and the limit is not pushed down
+    assert flow.plan().cell_ranges == ["Orders!A1:A100", "Orders!C1:C100"]
+    df = flow.collect()
+    assert list(df.columns) == ["id"]
+    assert df["id"].tolist() == ["1", "3"]
+
+
+def test_dataframe_frame_flow_errors():
+    mock_service = _flow_service()
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        DataframeFrameFlow(mock_service, "https://example.com/d/abc/edit")
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        DataframeFrameFlow(mock_service, "abc123").limit(0)
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        DataframeFrameFlow(mock_service, "abc123").where("missing", bool).collect()
+    with pytest.raises(
+        Exceptions.GoogleSpreadsheetProcessingError, match="NOTFOUND01"
+    ):
+        DataframeFrameFlow(mock_service, "abc123").select(by="gid", gid="7").collect()
+
+
+def test_dataframe_frame_flow_limit_skips_blank_rows():
+    mock_service = _flow_service()
+    rows = {
+        "Orders!A1:AD3": [["id", "status"], ["1", "paid"], []],
+        "Orders!A1:AD100": [["id", "status"], ["1", "paid"], [], ["2"], ["3"]],
+    }
+    mock_service.values().get.side_effect = lambda spreadsheetId, range: MagicMock(
+        **{"execute.return_value": {"values": rows[range]}}
+    )
+    flow = DataframeFrameFlow(mock_service, "abc123").select(by="gid", gid="42")
+    # the limited read ends on a blank row, the sheet is read again without the limit
+    assert flow.limit(2).collect()["id"].tolist() == ["1", "2"]
+    assert mock_service.values().get.call_args.kwargs["range"] == "Orders!A1:AD100"
+
+    # a limited read ending before `last_row` holds every row of the sheet
+    rows["Orders!A1:AD11"] = rows.pop("Orders!A1:AD100")
+    assert flow.limit(10).collect()["id"].tolist() == ["1", "2", "3"]
+    assert mock_service.values().get.call_args.kwargs["range"] == "Orders!A1:AD11"
+
+
+def test_dataframe_frame_flow_duplicated_header_uses_first_column():
+    mock_service = _flow_service()
+    mock_service.values().get().execute.return_value = {
+        "values": [["id", "id"], ["1", "x"], ["2", "y"]]
+    }
+    flow = (
+        DataframeFrameFlow(mock_service, "abc123")
+        .select(by="gid", gid="42")
+        .where("id", lambda value: value == "2")
+    )
+    assert flow.collect().values.tolist() == [["2", "y"]]
+
+
+def _scheduler_service(title):
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {
+        "sheets": [
+            {
+                "properties": {
+                    "sheetId": 0,
+                    "title": title,
+                    "index": 0,
+                    "gridProperties": {"rowCount": 3, "columnCount": 2},
+                }
+            }
+        ]
+    }
+    mock_service.get.reset_mock()
+    mock_service.values().get().execute.return_value = {"values": [["a", "b"]]}
+    values = {
+        f"{title}!A1:B3": [["a", "b"], ["1", "2"]],
+        f"{title}!B1:B3": [["b", "2"]],
+    }
+
+    def _batch_get(spreadsheetId, ranges, **options):
+        request = MagicMock()
+        request.execute.return_value = {
+            "valueRanges": [{"range": r, "values": values[r]} for r in ranges]
+        }
+        return request
+
+    mock_service.values().batchGet.side_effect = _batch_get
+    return mock_service
+
+
+def test_flow_scheduler_groups_flows_by_workbook():
+    from gsheet_tools._execution import RateLimiter, get_request_executor
+    from gsheet_tools.flows import FlowScheduler
+
+    first, second = _scheduler_service("One"), _scheduler_service("Two")
+    flows = [
+        DataframeFrameFlow(first, "one"),
+        DataframeFrameFlow(second, "two").columns("b"),
+        DataframeFrameFlow(first, "one").columns("b"),
+        DataframeFrameFlow(first, "one").columns("missing"),
+        DataframeFrameFlow(first, "one"),
+    ]
+    executor = get_request_executor()
+    with pytest.warns(RuntimeWarning, match="service_factory"):
+        results = FlowScheduler(max_workers=2, rate_limiter=RateLimiter(1000)).run(
+            flows
+        )
+    assert get_request_executor() is executor
+    # the submitted flows are left as they were
+    assert all(flow.metadata_cache is None for flow in flows)
+    assert [result.flow for result in results] == flows
+
+    assert [result.position for result in results] == [0, 1, 2, 3, 4]
+    assert [result.ok for result in results] == [True, True, True, False, True]
+    assert isinstance(results[3].error, Exceptions.GsheetToolsArgumentError)
+    assert results[0].value.to_dict("list") == {"a": ["1"], "b": ["2"]}
+    assert results[1].value.to_dict("list") == {"b": ["2"]}
+    assert results[2].value.equals(results[1].value)
+    assert all(result.seconds > 0 for result in results)
+    # one metadata call per workbook, one batchGet per major dimension
+    assert first.get.call_count == 1
+    assert first.values().batchGet.call_count == 2
+    assert second.values().batchGet.call_count == 1
+
+
+def test_flow_scheduler_rate_limits_its_own_requests_only():
+    import threading
+
+    from gsheet_tools._execution import RateLimiter, get_request_executor
+    from gsheet_tools.flows import FlowScheduler
+
+    acquired = []
+
+    class RecordingLimiter(RateLimiter):
+        def acquire(self, tokens=1):
+            acquired.append(threading.current_thread().name)
+            return 0.0
+
+    service = _scheduler_service("One")
+    flow = DataframeFrameFlow(MagicMock(), "one")
+    FlowScheduler(
+        rate_limiter=RecordingLimiter(1000), service_factory=lambda: service
+    ).run([flow])
+    assert acquired
+    assert all(name.startswith("gsheet-tools-flow") for name in acquired)
+    assert flow.sheet is not service
+    # outside of the scheduler, requests are not limited by it
+    acquired.clear()
+    get_request_executor().execute(MagicMock())
+    assert acquired == []
+
+
+def test_flow_scheduler_runs_other_flows_and_reports_errors():
+    from gsheet_tools.flows import FlowScheduler
+
+    service = _scheduler_service("One")
+    service.values().batchGet.side_effect = ConnectionResetError("reset")
+    output = io.StringIO()
+    results = FlowScheduler(service_factory=lambda: service).run(
+        [
+            CsvFlow(MagicMock(), "one", output, by="gid", gid="0"),
+            DataframeFrameFlow(MagicMock(), "one"),
+        ]
+    )
+    assert results[0].ok and output.getvalue().startswith("a,b")
+    assert isinstance(results[1].error, ConnectionResetError)
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        FlowScheduler(max_workers=0)
@@ -0,0 +1,77 @@
+import json
+import os
+import subprocess
+import sys
+
+import gsheet_tools
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not os.path.exists("/proc/self/statm"), reason="RSS is read from procfs"
+)
+
+# Runs in a fresh interpreter: imports gsheet_tools, then pandas, reporting the time
+# and resident memory (in pages) after each import. The peak RSS of getrusage is not
+# used, on Linux it carries the peak of the parent process over fork/exec.
+_PROBE = """
+import json, sys, time
+
+def _rss():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1])
+
+report = {"rss_before": _rss()}
+started = time.perf_counter()
+import gsheet_tools, gsheet_tools.aio, gsheet_tools.flows
+report["gsheet_tools_seconds"] = time.perf_counter() - started
+report["rss_gsheet_tools"] = _rss()
+report["pandas_imported"] = "pandas" in sys.modules
+report["valid_url"] = gsheet_tools.is_valid_google_url(
+    "https://docs.google.com/spreadsheets/d/abc/edit#gid=0"
+)
+started = time.perf_counter()
+import pandas
+report["pandas_seconds"] = time.perf_counter() - started
+report["rss_pandas"] = _rss()
+report["dataframe_shape"] = list(gsheet_tools.prepare_dataframe([["a"], ["1"]]).shape)
+print(json.dumps(report))
+"""
+
+
+def _probe():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(
+            None,
+            [
+                os.path.dirname(os.path.dirname(gsheet_tools.__file__)),
+                env.get("PYTHONPATH"),
+            ],
+        )
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_import_does_not_load_pandas():
+    report = _probe()
+    assert report["pandas_imported"] is False
+    assert report["valid_url"] is True
+    assert report["dataframe_shape"] == [1, 1]
+
+
+def test_import_time_and_rss_regression():
+    # compared with the cost of pandas itself on the same machine, so the thresholds
+    # hold on slow CI runners; a module importing pandas again fails both
+    reports = [_probe() for _ in range(3)]
+    best = min(reports, key=lambda report: report["gsheet_tools_seconds"])
+    assert best["gsheet_tools_seconds"] < best["pandas_seconds"] / 2
+    gsheet_tools_rss = best["rss_gsheet_tools"] - best["rss_before"]
+    pandas_rss = best["rss_pandas"] - best["rss_gsheet_tools"]
+    assert gsheet_tools_rss < pandas_rss / 2
@@ -0,0 +1,48 @@
+from gsheet_tools._index import SheetIndex
+from gsheet_tools._tools import get_gsheet_data
+from unittest.mock import MagicMock
+
+
+METADATA = {
+    "sheets": [
+        {"properties": {"sheetId": 67890, "title": "Sheet1", "index": 0}},
+        {"properties": {"sheetId": 12345, "title": "Sheet2", "index": 1}},
+        {"properties": {"sheetId": 11111, "title": "Sheet2", "index": 2}},
+    ]
+}
+
+
+def test_sheet_index_find():
+    index = SheetIndex(METADATA)
+    assert len(index) == 3
+    assert index.find("sheetId", "12345")["title"] == "Sheet2"
+    assert index.find("sheetId", 12345)["title"] == "Sheet2"
+    assert index.find("index", 2)["sheetId"] == 11111
+    assert index.find("title", "Sheet2")["sheetId"] == 12345  # first one wins
+    assert index.find("title", "Missing") is None
+    assert [sheet["title"] for sheet in index.sheets] == ["Sheet1", "Sheet2", "Sheet2"]
+
+
+def test_sheet_index_of_is_built_once_per_payload():
+    metadata = {"sheets": [{"properties": {"sheetId": 1, "title": "A", "index": 0}}]}
+    assert SheetIndex.of(metadata) is SheetIndex.of(metadata)
+    assert SheetIndex.of(dict(metadata)) is not SheetIndex.of(metadata)
+    assert len(SheetIndex({})) == 0
+
+
+def test_get_gsheet_data_by_integer_sheet_position():
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = METADATA
+    mock_service.values().get().execute.return_value = {"values": [["Name"]]}
+    title, _ = get_gsheet_data(
+        mock_service, "file_id", by="sheet_position", sheet_position=1
+    )
+    assert title == "Sheet2"
+    title, _ = get_gsheet_data(
+        mock_service,
+        "file_id",
+        by="gid",
+        gid="0",
+        not_found_priority={"sheet_position": 2},
+    )
+    assert mock_service.values().get.call_args.kwargs["range"].startswith("Sheet2")
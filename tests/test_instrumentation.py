@@ -0,0 +1,107 @@
+import pytest
+from gsheet_tools._instrumentation import (
+    InMemoryCollector,
+    Instrumentation,
+    NoopInstrumentation,
+    get_instrumentation,
+    set_instrumentation,
+)
+from gsheet_tools._tools import get_gsheet_data, get_gsheet_data_many, prepare_dataframe
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def collector():
+    collector = InMemoryCollector()
+    previous = set_instrumentation(collector)
+    yield collector
+    set_instrumentation(previous)
+
+
+def _mock_service():
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {
+        "sheets": [{"properties": {"sheetId": 1, "title": "Sheet1", "index": 0}}]
+    }
+    mock_service.values().get().execute.return_value = {
+        "values": [["Name", "Age"], ["a", "1"], ["b"]]
+    }
+    mock_service.values().batchGet().execute.return_value = {
+        "valueRanges": [{"values": [["x"]]}, {"values": [["y", "z"]]}]
+    }
+    return mock_service
+
+
+def test_default_instrumentation_is_noop():
+    instrumentation = get_instrumentation()
+    assert isinstance(instrumentation, NoopInstrumentation)
+    with instrumentation.span("anything", file_id="f") as span:
+        span.set(rows=1)
+    assert span.attributes == {}
+
+
+def test_spans_around_api_calls_and_prepare_dataframe(collector):
+    mock_service = _mock_service()
+    _, data = get_gsheet_data(mock_service, "file_id", by="gid", gid="1")
+    prepare_dataframe(data)
+    get_gsheet_data_many(
+        mock_service,
+        "file_id",
+        [{"by": "gid", "gid": "1"}, {"by": "gid", "gid": "1", "without_headers": True}],
+    )
+    names = [span.name for span in collector.spans]
+    assert names == [
+        "sheets.spreadsheets.get",
+        "sheets.values.get",
+        "prepare_dataframe",
+        "sheets.spreadsheets.get",
+        "sheets.values.batchGet",
+    ]
+    values_get = collector.spans[1]
+    assert values_get.attributes["file_id"] == "file_id"
+    assert values_get.attributes["range"] == "Sheet1!A1:z999999"
+    assert (values_get.attributes["rows"], values_get.attributes["cells"]) == (3, 5)
+    # the response size is only measured on request
+    assert "response_bytes" not in values_get.attributes
+    assert collector.spans[2].attributes["cells"] == 4
+    assert collector.spans[4].attributes["cells"] == 3
+
+    summary = collector.summary()
+    assert summary["sheets.spreadsheets.get"].calls == 2
+    assert summary["sheets.values.get"].rows == 3
+    assert summary["prepare_dataframe"].errors == 0
+
+
+def test_response_bytes_on_request():
+    collector = InMemoryCollector(response_bytes=True)
+    previous = set_instrumentation(collector)
+    try:
+        get_gsheet_data(_mock_service(), "file_id", by="gid", gid="1")
+    finally:
+        set_instrumentation(previous)
+    values_get = collector.spans[1]
+    assert values_get.attributes["response_bytes"] > 0
+    assert collector.summary()["sheets.values.get"].response_bytes == (
+        values_get.attributes["response_bytes"]
+    )
+
+
+def test_span_records_errors_and_callback():
+    spans = []
+    collector = InMemoryCollector(maxlen=2, callback=spans.append)
+    with pytest.raises(ValueError):
+        with collector.span("failing"):
+            raise ValueError("boom")
+    for _ in range(2):
+        with collector.span("ok"):
+            pass
+    assert [span.name for span in collector.spans] == ["ok", "ok"]
+    assert spans[0].error == "ValueError"
+    assert spans[0].duration >= 0
+    collector.clear()
+    assert collector.summary() == {}
+
+    forwarded = []
+    with Instrumentation(forwarded.append).span("custom", key="value"):
+        pass
+    assert forwarded[0].attributes == {"key": "value"}
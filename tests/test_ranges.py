@@ -0,0 +1,60 @@
+import pytest
+from gsheet_tools._ranges import column_letter, column_number, plan_range
+from gsheet_tools._tools import Exceptions, SheetSelector, get_gsheet_data
+from unittest.mock import MagicMock
+
+
+@pytest.mark.parametrize(
+    "number, letters",
+    [(1, "A"), (26, "Z"), (27, "AA"), (52, "AZ"), (53, "BA"), (702, "ZZ"), (703, "AAA")],
+)
+def test_column_letter_round_trip(number, letters):
+    assert column_letter(number) == letters
+    assert column_number(letters) == number
+    assert column_number(letters.lower()) == number
+
+
+def test_column_helpers_invalid_arguments():
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        column_letter(0)
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        column_number("A1")
+
+
+def test_plan_range():
+    properties = {"gridProperties": {"rowCount": 1000, "columnCount": 28}}
+    assert plan_range("Wide", properties) == "Wide!A1:AB1000"
+    assert plan_range("Wide", properties, first_row=2) == "Wide!A2:AB1000"
+    assert plan_range("Wide", {}) is None
+    assert plan_range("Wide", {"gridProperties": {"rowCount": 0}}) is None
+
+
+def test_selector_cell_range():
+    properties = {"gridProperties": {"rowCount": 50, "columnCount": 30}}
+    selector = SheetSelector(by="gid", gid="1")
+    assert selector.cell_range("Sheet1", properties) == "Sheet1!A1:AD50"
+    assert selector.cell_range("Sheet1") == "Sheet1!A1:z999999"
+    selector = SheetSelector(by="gid", gid="1", without_headers=True)
+    assert selector.cell_range("Sheet1", properties) == "Sheet1!A2:AD50"
+    assert selector.cell_range("Sheet1") == "Sheet1!A2:z999999"
+    selector = SheetSelector(by="gid", gid="1", custom_tabular_range=("B2", "C3"))
+    assert selector.cell_range("Sheet1", properties) == "Sheet1!B2:C3"
+
+
+def test_get_gsheet_data_reads_planned_range():
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {
+        "sheets": [
+            {
+                "properties": {
+                    "sheetId": 1,
+                    "title": "Wide",
+                    "index": 0,
+                    "gridProperties": {"rowCount": 120, "columnCount": 40},
+                }
+            }
+        ]
+    }
+    mock_service.values().get().execute.return_value = {"values": [["h"]]}
+    get_gsheet_data(mock_service, "file_id", by="gid", gid="1")
+    assert mock_service.values().get.call_args.kwargs["range"] == "Wide!A1:AN120"
@@ -5,15 +5,31 @@ from gsheet_tools._tools import (
     NameFormatter,
     SheetOrigins,
     SheetMimetype,
+    SheetSelector,
     get_gid_sheets_data,
     get_gsheet_data,
+    get_gsheet_data_many,
+    get_workbook_dataframes,
+    iter_gsheet_data,
     check_sheet_origin,
     is_valid_google_url,
+    prepare_arrow_table,
     prepare_dataframe,
 )
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 
+class UnknownRangeError(Exception):
+    """
+    Mimics the googleapiclient HttpError raised for a tab that does not exist
+    """
+
+    def __init__(self):
+        super().__init__("Unable to parse range")
+        self.resp = SimpleNamespace(status=400)
+
+
 def test_is_valid_google_url():
     valid_url = "https://docs.google.com/spreadsheets/d/12345/edit?usp=sharing"
     invalid_url = "https://example.com/sheets/d/12345/edit"
@@ -32,6 +48,31 @@ def test_url_resolver_valid_url():
     assert resolver.raw_url == url
 
 
+def test_url_resolver_resolve_many():
+    urls = [
+        "https://docs.google.com/spreadsheets/d/12345/edit?gid=67890",
+        "https://example.com/sheets/d/12345/edit",
+        "https://docs.google.com/spreadsheets/d/12345/edit?usp=sharing",
+        "https://docs.google.com/spreadsheets/d/abc-_1/edit#gid=1",
+        "https://docs.google.com/spreadsheets/d/12345/edit?gid=67890",
+    ]
+    results = UrlResolver.resolve_many(urls)
+    assert results == [
+        ("12345", "67890", True),
+        (None, None, False),
+        ("12345", None, True),
+        ("abc-_1", "1", True),
+        ("12345", "67890", True),
+    ]
+    for url, result in zip(urls, results):
+        resolver = UrlResolver(url)
+        assert resolver.is_valid is result.is_valid
+        if resolver.is_valid:
+            assert (resolver.url_data.file_id, resolver.url_data.gid) == result[:2]
+    unique = list(UrlResolver.iter_resolve(urls, unique=True))
+    assert [result.file_id for result in unique] == ["12345", None, "abc-_1"]
+
+
 def test_url_resolver_invalid_url():
     url = "https://example.com/sheets/d/12345/edit"
     resolver = UrlResolver(url)
@@ -263,7 +304,10 @@ def test_get_gsheet_data__by_sheet_name_404():
             {"properties": {"sheetId": "12351", "title": "default", "index": "2"}},
         ]
     }
-    mock_service.values().get().execute.return_value = {"values": [["Name", "Age"]]}
+    mock_service.values().get().execute.side_effect = [
+        UnknownRangeError(),
+        {"values": [["Name", "Age"]]},
+    ]
     title, data = get_gsheet_data(mock_service, "file_id", by="sheet_name", sheet_name="SomeInvalidName", not_found_priority={'sheet_position': '2'})
     assert title == "default"
     assert data == [["Name", "Age"]]
@@ -277,11 +321,60 @@ def test_get_gsheet_data__fallback_404():
             {"properties": {"sheetId": "12351", "title": "default", "index": "2"}},
         ]
     }
-    mock_service.values().get().execute.return_value = {"values": [["Name", "Age"]]}
+    mock_service.values().get().execute.side_effect = UnknownRangeError()
     title, data = get_gsheet_data(mock_service, "file_id", by="sheet_name", sheet_name="SomeInvalidName", not_found_priority={'sheet_position': '3'})
     assert title == ""
     assert data == []
 
+def test_get_gsheet_data__by_sheet_name_skips_metadata():
+    mock_service = MagicMock()
+    mock_service.values().get().execute.return_value = {"values": [["Name", "Age"]]}
+    assert get_gsheet_data(
+        mock_service, "file_id", by="sheet_name", sheet_name="Sheet1"
+    ) == ("Sheet1", [["Name", "Age"]])
+    mock_service.values().get.assert_called_with(spreadsheetId="file_id", range="'Sheet1'")
+    assert mock_service.get.return_value.execute.call_count == 0
+
+    get_gsheet_data(
+        mock_service, "file_id", by="sheet_name", sheet_name="Sheet1", without_headers=True
+    )
+    mock_service.values().get.assert_called_with(
+        spreadsheetId="file_id", range="'Sheet1'!A2:ZZZ"
+    )
+    assert mock_service.get.return_value.execute.call_count == 0
+
+    mock_service.values().get().execute.side_effect = RuntimeError("boom")
+    with pytest.raises(RuntimeError):
+        get_gsheet_data(mock_service, "file_id", by="sheet_name", sheet_name="Sheet1")
+
+
+def test_get_gsheet_data__by_sheet_name_quotes_the_title():
+    mock_service = MagicMock()
+    mock_service.values().get().execute.return_value = {"values": [["Name"]]}
+    # bare, "Q1" and "AB12" would be read as cells of the first sheet
+    for sheet_name, cell_range in [
+        ("Q1", "'Q1'"),
+        ("AB12", "'AB12'"),
+        ("Bob's", "'Bob''s'"),
+    ]:
+        assert get_gsheet_data(
+            mock_service, "file_id", by="sheet_name", sheet_name=sheet_name
+        ) == (sheet_name, [["Name"]])
+        mock_service.values().get.assert_called_with(
+            spreadsheetId="file_id", range=cell_range
+        )
+    get_gsheet_data(
+        mock_service,
+        "file_id",
+        by="sheet_name",
+        sheet_name="Q1",
+        custom_tabular_range=("A1", "B2"),
+    )
+    mock_service.values().get.assert_called_with(
+        spreadsheetId="file_id", range="'Q1'!A1:B2"
+    )
+
+
 def test_get_gsheet_data_invalid_arguments():
     mock_service = MagicMock()
     with pytest.raises(Exceptions.GsheetToolsArgumentError, match=r"Argument::[by,gid]|with `by='gid'` you cannot pass `gid=None`"):
@@ -380,3 +473,441 @@ def test_check_sheet_origin_invalid_mimetype():
     assert origin == SheetOrigins.UPLOADED_NON_CONVERTED
     assert details.is_parsable is False
     assert details.original_extension == "unidentified"
+
+
+def _batch_get_service(sheets):
+    """
+    Mock service whose batchGet echoes every requested range back as its values.
+    """
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {"sheets": sheets}
+    mock_service.get.reset_mock()
+
+    def _batch_get(spreadsheetId, ranges):
+        request = MagicMock()
+        request.execute.return_value = {
+            "valueRanges": [{"range": r, "values": [[r]]} for r in ranges]
+        }
+        return request
+
+    mock_service.values().batchGet.side_effect = _batch_get
+    return mock_service
+
+
+def test_get_gsheet_data_many():
+    mock_service = _batch_get_service(
+        [
+            {"properties": {"sheetId": "67890", "title": "Sheet1", "index": "0"}},
+            {"properties": {"sheetId": "12345", "title": "Sheet2", "index": "1"}},
+        ]
+    )
+    results = get_gsheet_data_many(
+        mock_service,
+        "file_id",
+        selectors=[
+            SheetSelector(by="sheet_name", sheet_name="Sheet2"),
+            {"by": "gid", "gid": "67890", "custom_tabular_range": ("A1", "B2")},
+            SheetSelector(by="gid", gid="0", not_found_priority={"sheet_position": "1"}),
+            SheetSelector(by="sheet_name", sheet_name="Missing"),
+        ],
+    )
+    assert results == [
+        ("Sheet2", [["Sheet2!A1:z999999"]]),
+        ("Sheet1", [["Sheet1!A1:B2"]]),
+        ("Sheet2", [["Sheet2!A1:z999999"]]),
+        ("", []),
+    ]
+    assert mock_service.get.call_count == 1
+    # duplicated ranges are fetched once, in a single batchGet
+    assert mock_service.values().batchGet.call_count == 1
+    _, kwargs = mock_service.values().batchGet.call_args
+    assert kwargs["ranges"] == ["Sheet2!A1:z999999", "Sheet1!A1:B2"]
+
+
+def test_get_workbook_dataframes():
+    tabs = {
+        "Sales Q1": [["Region", "Total"], ["EU", "10"], ["US"]],
+        "salesQ1": [["Region"], ["APAC"]],
+        "Notes": [],
+        "Archive 2020": [["Old"], ["x"]],
+    }
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {
+        "sheets": [
+            {"properties": {"sheetId": i, "title": title, "index": i}}
+            for i, title in enumerate(tabs)
+        ]
+    }
+
+    def _batch_get(spreadsheetId, ranges):
+        request = MagicMock()
+        request.execute.return_value = {
+            "valueRanges": [{"values": tabs[r.split("!")[0]]} for r in ranges]
+        }
+        return request
+
+    mock_service.values().batchGet.side_effect = _batch_get
+    mock_service.get.reset_mock()
+    dataframes = get_workbook_dataframes(
+        mock_service, "file_id", exclude=["Archive *"], infer_dtypes=True
+    )
+    assert list(dataframes) == ["sales_q1", "sales_q1_2", "notes"]
+    assert dataframes["sales_q1"].to_dict("list") == {
+        "Region": ["EU", "US"],
+        "Total": ["10", ""],
+    }
+    assert dataframes["sales_q1_2"]["Region"].tolist() == ["APAC"]
+    assert dataframes["notes"].empty
+    assert mock_service.get.call_count == 1
+    assert mock_service.values().batchGet.call_count == 1
+
+    dataframes = get_workbook_dataframes(mock_service, "file_id", include=["Sales*", "Arch*"])
+    assert list(dataframes) == ["sales_q1", "archive_2020"]
+    assert get_workbook_dataframes(mock_service, "file_id", include=["Missing"]) == {}
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        get_workbook_dataframes(mock_service, "file_id", max_workers=0)
+
+
+def test_get_gsheet_data_many_splits_batches():
+    mock_service = _batch_get_service(
+        [
+            {
+                "properties": {
+                    "sheetId": str(i),
+                    "title": f"Sheet{i}",
+                    "gridProperties": {"rowCount": 1000, "columnCount": 26},
+                }
+            }
+            for i in range(5)
+        ]
+    )
+    selectors = [SheetSelector(by="gid", gid=str(i)) for i in range(5)]
+    results = get_gsheet_data_many(
+        mock_service, "file_id", selectors, max_ranges_per_request=2
+    )
+    assert [title for title, _ in results] == [f"Sheet{i}" for i in range(5)]
+    assert mock_service.values().batchGet.call_count == 3
+
+    mock_service.values().batchGet.reset_mock()
+    get_gsheet_data_many(
+        mock_service, "file_id", selectors, max_cells_per_request=26_000 * 3
+    )
+    assert mock_service.values().batchGet.call_count == 2
+
+
+def test_get_gsheet_data_many_invalid_selector():
+    mock_service = MagicMock()
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        get_gsheet_data_many(mock_service, "file_id", [{"by": "gid"}])
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        get_gsheet_data_many(
+            mock_service, "file_id", [], max_ranges_per_request=0
+        )
+    mock_service.get.assert_not_called()
+
+
+def _windowed_service(rows, row_count=None):
+    """
+    Mock service whose values().get serves `rows` for `Title!A{start}:Z{end}` windows.
+    """
+    import re
+
+    properties = {"sheetId": "1", "title": "Big", "index": 0}
+    if row_count is not None:
+        properties["gridProperties"] = {"rowCount": row_count, "columnCount": 26}
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {"sheets": [{"properties": properties}]}
+
+    def _get(spreadsheetId, range):
+        start, end = map(int, re.fullmatch(r"Big!A(\d+):Z(\d+)", range).groups())
+        window = rows[start - 1 : end]
+        while window and not window[-1]:  # the API trims trailing empty rows
+            window.pop()
+        request = MagicMock()
+        request.execute.return_value = {"values": window} if window else {}
+        return request
+
+    mock_service.values().get.side_effect = _get
+    return mock_service
+
+
+def test_iter_gsheet_data_windows():
+    rows = [["h"]] + [[str(i)] for i in range(1, 12)]
+    mock_service = _windowed_service(rows)
+    title, blocks = iter_gsheet_data(
+        mock_service, "file_id", by="gid", gid="1", chunk_size=5
+    )
+    blocks = list(blocks)
+    assert title == "Big"
+    assert [len(block) for block in blocks] == [5, 5, 2]
+    assert [row for block in blocks for row in block] == rows
+    # the 4th window (rows 16-20) came back empty and stopped the stream
+    assert mock_service.values().get.call_count == 4
+
+
+def test_iter_gsheet_data_stops_at_row_count_and_keeps_gaps():
+    rows = [["h"], ["1"], [], [], ["4"], ["5"]]
+    mock_service = _windowed_service(rows, row_count=6)
+    _, blocks = iter_gsheet_data(
+        mock_service,
+        "file_id",
+        by="gid",
+        gid="1",
+        without_headers=True,
+        chunk_size=2,
+    )
+    assert [row for block in blocks for row in block] == rows[1:]
+    ranges = [c.kwargs["range"] for c in mock_service.values().get.call_args_list]
+    assert ranges == ["Big!A2:Z3", "Big!A4:Z5", "Big!A6:Z6"]
+
+
+def test_iter_gsheet_data_not_found():
+    mock_service = _windowed_service([["h"]])
+    title, blocks = iter_gsheet_data(mock_service, "file_id", by="gid", gid="404")
+    assert title == ""
+    assert list(blocks) == []
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        iter_gsheet_data(mock_service, "file_id", by="gid", gid="1", chunk_size=0)
+
+
+def test_prepare_dataframe_pads_ragged_rows():
+    data = [["Name", "Age", "City"], ["Alice", 30], [], ["Bob"], ["Eve", 22, "Pune"]]
+    df = prepare_dataframe(data)
+    assert df.shape == (3, 3)
+    assert df["City"].tolist() == ["", "", "Pune"]
+    assert df["Age"].tolist() == [30, "", 22]
+
+
+def test_prepare_dataframe_header_only_and_duplicated_names():
+    df = prepare_dataframe([["Name", "Name"]])
+    assert list(df.columns) == ["Name", "Name"]
+    assert df.empty
+    df = prepare_dataframe([["Name", "Name"], ["a", "b"]])
+    assert df.iloc[0].tolist() == ["a", "b"]
+
+
+def test_prepare_dataframe_row_wider_than_header():
+    with pytest.raises(ValueError):
+        prepare_dataframe([["Name"], ["Alice", 30]])
+
+
+def test_get_gsheet_data_typed_requests_unformatted_values():
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {
+        "sheets": [{"properties": {"sheetId": "1", "title": "Sheet1"}}]
+    }
+    mock_service.values().get().execute.return_value = {"values": [["n"], [1]]}
+    mock_service.values().get.reset_mock()
+    get_gsheet_data(mock_service, "file_id", by="gid", gid="1", typed=True)
+    _, kwargs = mock_service.values().get.call_args
+    assert kwargs["valueRenderOption"] == "UNFORMATTED_VALUE"
+    assert kwargs["dateTimeRenderOption"] == "SERIAL_NUMBER"
+
+
+def test_prepare_dataframe_schema():
+    data = [
+        ["id", "price", "active", "joined", "note"],
+        [1, 9.5, True, 45292, 7],
+        [2, "", False, 45293.5],
+        ["", 3, "", "", "x"],
+    ]
+    df = prepare_dataframe(
+        data,
+        schema={
+            "id": "int",
+            "price": "float",
+            "active": "bool",
+            "joined": "datetime",
+            "note": "string",
+        },
+    )
+    assert str(df["id"].dtype) == "Int64"
+    assert df["id"].isna().tolist() == [False, False, True]
+    assert str(df["price"].dtype) == "float64"
+    assert str(df["active"].dtype) == "boolean"
+    assert str(df["joined"].dtype).startswith("datetime64")
+    assert str(df["joined"].iloc[0].date()) == "2024-01-01"
+    assert df["joined"].iloc[1].hour == 12
+    assert df["note"].tolist()[0] == "7"
+
+
+def test_prepare_dataframe_infer_dtypes():
+    data = [["a", "b", "c", "d"], [1, 1.5, True, "x"], [2, 2, False, 1]]
+    df = prepare_dataframe(data, infer_dtypes=True)
+    assert [str(dtype) for dtype in df.dtypes[:3]] == ["int64", "float64", "bool"]
+    assert df["d"].tolist() == ["x", 1]
+
+
+def test_prepare_dataframe_schema_errors():
+    data = [["a"], ["not a number"]]
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        prepare_dataframe(data, schema={"missing": "int"})
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        prepare_dataframe(data, schema={"a": "complex"})
+    with pytest.raises(Exceptions.GoogleSpreadsheetProcessingError):
+        prepare_dataframe(data, schema={"a": "int"})
+    with pytest.raises(Exceptions.GoogleSpreadsheetProcessingError):
+        prepare_dataframe(data, schema={"a": "bool"})
+
+
+def test_prepare_dataframe_schema_int_rejects_fractions():
+    # with or without blank cells, fractions are not truncated
+    with pytest.raises(Exceptions.GoogleSpreadsheetProcessingError, match="DTYPE01"):
+        prepare_dataframe([["n"], [1.5], [2]], schema={"n": "int"})
+    with pytest.raises(Exceptions.GoogleSpreadsheetProcessingError, match="DTYPE01"):
+        prepare_dataframe([["n"], [1.5], [""], [2]], schema={"n": "int"})
+    df = prepare_dataframe([["n"], [1.0], ["2"], [3]], schema={"n": "int"})
+    assert str(df["n"].dtype) == "int64"
+    assert df["n"].tolist() == [1, 2, 3]
+
+
+def test_prepare_arrow_table():
+    pa = pytest.importorskip("pyarrow")
+    data = [["Name", "Age", "Joined"], ["Alice", 30, 45292], ["Bob", "", ""]]
+    table = prepare_arrow_table(data, schema={"Age": "int", "Joined": "datetime"})
+    assert table.column_names == ["Name", "Age", "Joined"]
+    assert table.schema.field("Name").type == pa.string()
+    assert table.schema.field("Age").type == pa.int64()
+    assert pa.types.is_timestamp(table.schema.field("Joined").type)
+    assert table.column("Age").to_pylist() == [30, None]
+    # untyped mixed cells are kept as text
+    assert prepare_arrow_table(data).column("Age").to_pylist() == ["30", ""]
+    assert prepare_arrow_table([["Name"]]).num_rows == 0
+
+
+def test_prepare_dataframe_pyarrow_backend():
+    pytest.importorskip("pyarrow")
+    import pandas as pd
+
+    df = prepare_dataframe([["Name", "Age"], ["Alice", 30]], dtype_backend="pyarrow")
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert df.iloc[0]["Name"] == "Alice"
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        prepare_dataframe([["Name"]], dtype_backend="polars")
+
+
+def _projection_service():
+    mock_service = MagicMock()
+    mock_service.get().execute.return_value = {
+        "sheets": [
+            {
+                "properties": {
+                    "sheetId": "1",
+                    "title": "Wide",
+                    "index": 0,
+                    "gridProperties": {"rowCount": 4, "columnCount": 30},
+                }
+            }
+        ]
+    }
+    header = [f"c{i}" for i in range(30)]
+    mock_service.values().get().execute.return_value = {"values": [header]}
+    columns = {
+        "Wide!AC1:AC4": [["c28", "x", "", ""]],
+        "Wide!B1:B4": [["c1", "1", "2"]],
+        "Wide!AC2:AC4": [["x"]],
+        "Wide!B2:B4": [["1", "2"]],
+    }
+
+    def _batch_get(spreadsheetId, ranges, majorDimension):
+        assert majorDimension == "COLUMNS"
+        request = MagicMock()
+        request.execute.return_value = {
+            "valueRanges": [{"range": r, "values": columns[r]} for r in ranges]
+        }
+        return request
+
+    mock_service.values().batchGet.side_effect = _batch_get
+    return mock_service
+
+
+def test_get_gsheet_data_column_projection():
+    mock_service = _projection_service()
+    title, data = get_gsheet_data(
+        mock_service, "file_id", by="gid", gid="1", columns=["c28", "c1"]
+    )
+    assert title == "Wide"
+    assert data == [["c28", "c1"], ["x", "1"], ["", "2"]]
+    assert mock_service.values().get.call_args.kwargs["range"] == "Wide!1:1"
+    assert mock_service.values().batchGet.call_count == 1
+    df = prepare_dataframe(data)
+    assert list(df.columns) == ["c28", "c1"]
+    assert df["c1"].tolist() == ["1", "2"]
+
+    _, data = get_gsheet_data(
+        mock_service,
+        "file_id",
+        by="gid",
+        gid="1",
+        without_headers=True,
+        columns=["c28", "c1"],
+    )
+    assert data == [["x", "1"], ["", "2"]]
+
+
+def test_get_gsheet_data_major_dimension_columns():
+    mock_service = _projection_service()
+    title, data = get_gsheet_data(
+        mock_service,
+        "file_id",
+        by="gid",
+        gid="1",
+        columns=["c28", "c1"],
+        major_dimension="COLUMNS",
+    )
+    assert data == [["c28", "x", "", ""], ["c1", "1", "2"]]
+    df = prepare_dataframe(data, major_dimension="COLUMNS")
+    assert df.to_dict("list") == {"c28": ["x", ""], "c1": ["1", "2"]}
+
+    get_gsheet_data(mock_service, "file_id", by="gid", gid="1", major_dimension="COLUMNS")
+    assert mock_service.values().get.call_args.kwargs == {
+        "spreadsheetId": "file_id",
+        "range": "Wide!A1:AD4",
+        "majorDimension": "COLUMNS",
+    }
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        get_gsheet_data(mock_service, "file_id", by="gid", gid="1", major_dimension="ROW")
+
+
+def test_prepare_dataframe_major_dimension_columns():
+    rows = [[], ["a", "b", "c"], ["1", "", ""], [], ["2", "x"], ["", "", "z"]]
+    # the same sheet as returned by a majorDimension=COLUMNS read
+    columns = [["", "a", "1", "", "2"], ["", "b", "", "", "x"], ["", "c", "", "", "", "z"]]
+    assert prepare_dataframe(columns, major_dimension="COLUMNS").equals(
+        prepare_dataframe(rows)
+    )
+    typed = prepare_dataframe(
+        [["n", 1, 2], ["flag", True], ["name", "x", "y"]],
+        schema={"n": "int"},
+        infer_dtypes=True,
+        major_dimension="COLUMNS",
+    )
+    assert typed.dtypes.astype(str).tolist()[:2] == ["int64", "boolean"]
+    assert typed["name"].tolist() == ["x", "y"]
+    assert prepare_arrow_table(
+        [["n", 1, 2], ["name", "x"]], major_dimension="COLUMNS"
+    ).to_pydict() == {"n": [1, 2], "name": ["x", ""]}
+
+    header_only = prepare_dataframe([["a"], ["b"], []], major_dimension="COLUMNS")
+    assert list(header_only.columns) == ["a", "b"] and header_only.empty
+    with pytest.raises(Exceptions.GoogleSpreadsheetProcessingError, match="BLANK01"):
+        prepare_dataframe([[], [""]], major_dimension="COLUMNS")
+    with pytest.raises(Exceptions.GoogleSpreadsheetProcessingError, match="BLANK02"):
+        prepare_dataframe([["a", "1"], [], ["c", "2"]], major_dimension="COLUMNS")
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        prepare_dataframe(rows, major_dimension="columns")
+
+
+def test_get_gsheet_data_column_projection_invalid():
+    mock_service = _projection_service()
+    with pytest.raises(Exceptions.GsheetToolsArgumentError, match="missing"):
+        get_gsheet_data(mock_service, "file_id", by="gid", gid="1", columns=["missing"])
+    with pytest.raises(Exceptions.GsheetToolsArgumentError):
+        get_gsheet_data(
+            mock_service,
+            "file_id",
+            by="gid",
+            gid="1",
+            columns=["c1"],
+            custom_tabular_range=("A1", "B2"),
+        )